@@ -0,0 +1,40 @@
+import argparse
+import os
+import time
+
+from netflix_analysis.backtesting import print_summary, run_backtest, summarize_backtest
+from netflix_analysis.growth_series import collect_growth_series
+from curve_fitting import load_data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Büyüme modellerinin rolling-origin backtest'i")
+    parser.add_argument('--dedupe', action='store_true', help="tekrar listelenen içerikleri bir kez say")
+    args = parser.parse_args(argv)
+
+    netflix_data = load_data(dedupe=args.dedupe)
+
+    if netflix_data is not None:
+        print("Netflix veri seti başarıyla yüklendi. Toplam kayıt sayısı:", len(netflix_data))
+
+        # Script'lerin uydurduğu tüm yıllık serileri toplama
+        series = collect_growth_series(netflix_data)
+        print(f"Toplam {len(series)} seri rolling-origin yöntemiyle değerlendirilecek.")
+
+        start_time = time.time()
+        results = run_backtest(series, min_train=8, max_horizon=5)
+        summary = summarize_backtest(results)
+        duration = time.time() - start_time
+
+        print_summary(summary)
+        print(f"\nBacktest süresi: {duration:.2f} saniye ({len(results)} tahmin)")
+
+        # Özeti kaydetme
+        os.makedirs('graphics/curve_fitting', exist_ok=True)
+        summary_path = 'graphics/curve_fitting/backtest_summary.csv'
+        summary.to_csv(summary_path, index=False)
+        print(f"Backtest özeti kaydedildi: {summary_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Ülke kümeleri: profil matrisinin, uzaklıkların ve önbelleğin hızı ve doğruluğu.
+
+Gerçek veride seyrek çarpımla kurulan ülke-yıl profilleri, grup başına döngüyle hesaplanan referansla
+karşılaştırılır. Ardından istenen sayıda rastgele profil için vektörel Jensen-Shannon ve kosinüs uzaklıkları
+scipy.spatial.distance.pdist ile karşılaştırılır. Son olarak aynı kümelemenin ikinci çağrıda önbellekten
+okunduğu ölçülür.
+
+    python benchmarks/bench_country_clusters.py
+    python benchmarks/bench_country_clusters.py --groups 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TOLERANCE = 1e-9
+
+
+def reference_profiles(catalog, groups, year_field):
+    """Döngülü referans: her ülke-yıl grubunun satırları ayrı ayrı seçilip blok sayımları bincount ile alınır"""
+    from netflix_analysis.country_clusters import PROFILE_WEIGHTS, _blocks
+
+    bridge = catalog.bridge('country')
+    countries = bridge.values[bridge.codes]
+    years = catalog.df[year_field].values[bridge.rows]
+    blocks = _blocks(catalog)
+    profiles = []
+    for country, year in zip(groups['country'].tolist(), groups[year_field].tolist()):
+        rows = bridge.rows[(countries == country) & (years == year)]
+        parts = []
+        for block, (block_rows, codes, names) in blocks.items():
+            counts = np.bincount(codes[np.isin(block_rows, rows)], minlength=len(names)).astype(float)
+            parts.append(PROFILE_WEIGHTS[block] * counts / counts.sum() if counts.sum() else counts)
+        profile = np.concatenate(parts)
+        profiles.append(profile / profile.sum())
+    return np.array(profiles)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ülke kümelerinin hızı ve doğruluğu")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--groups', type=int, default=2000, help="rastgele profil sayısı")
+    args = parser.parse_args(argv)
+
+    from scipy.spatial.distance import pdist, squareform
+
+    from netflix_analysis import country_clusters
+    from netflix_analysis.catalog import load_catalog
+    from netflix_analysis.country_clusters import cluster_countries, pairwise_distances, profile_matrix
+
+    catalog = load_catalog(args.data)
+    start = time.perf_counter()
+    groups, features, _, profiles = profile_matrix(catalog, by_year=True)
+    profile_time = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = reference_profiles(catalog, groups, 'year_added')
+    reference_time = time.perf_counter() - start
+    profile_error = float(np.abs(profiles - expected).max())
+    print(f"ülke-yıl profilleri ({len(groups)} grup, {len(features)} özellik): {profile_time:.3f} s; "
+          f"döngülü referans {reference_time:.2f} s, en büyük fark {profile_error:.1e}")
+
+    rng = np.random.default_rng(0)
+    random_profiles = rng.dirichlet(np.full(len(features), 0.3), args.groups)
+    errors = []
+    # scipy doğal logaritma kullanır; 2 tabanına çevirmek için sqrt(ln 2) ile bölünür
+    for metric, scale in [('jensenshannon', np.sqrt(np.log(2))), ('cosine', 1.0)]:
+        start = time.perf_counter()
+        distances = pairwise_distances(random_profiles, metric)
+        vector_time = time.perf_counter() - start
+        start = time.perf_counter()
+        reference = squareform(pdist(random_profiles, metric)) / scale
+        scipy_time = time.perf_counter() - start
+        errors.append(float(np.abs(distances - reference).max()))
+        print(f"{metric} ({args.groups} grup): vektörel {vector_time:.2f} s, pdist {scipy_time:.2f} s, "
+              f"en büyük fark {errors[-1]:.1e}")
+
+    # Uzaklık hesabı sayılır: ikinci çağrı önbellekten okunuyorsa hiç çağrılmamalı
+    calls = []
+
+    def counted_distances(*args, **kwargs):
+        calls.append(1)
+        return pairwise_distances(*args, **kwargs)
+
+    country_clusters.pairwise_distances = counted_distances
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            start = time.perf_counter()
+            first = cluster_countries(catalog, by_year=True, cache_dir=cache_dir)
+            cold_time = time.perf_counter() - start
+            cold_calls = len(calls)
+            start = time.perf_counter()
+            second = cluster_countries(catalog, by_year=True, cache_dir=cache_dir)
+            warm_time = time.perf_counter() - start
+    finally:
+        country_clusters.pairwise_distances = pairwise_distances
+    cached = cold_calls == 1 and len(calls) == cold_calls
+    same = (first.groups.equals(second.groups) and np.array_equal(first.order, second.order)
+            and np.array_equal(first.distances, second.distances))
+    print(f"kümeleme ({len(first)} grup): ilk çağrı {cold_time:.3f} s, ikinci çağrı {warm_time:.3f} s, "
+          f"önbellekten okundu: {'evet' if cached else 'hayır'}, aynı sonuç: {'evet' if same else 'hayır'}")
+
+    return 0 if profile_error < TOLERANCE and max(errors) < TOLERANCE and same and cached else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""Tekrar tespiti: bloklanmış benzerlik aramasının hızı ve doğruluğu.
+
+Gerçek veride önek süzmeli bloklamanın, tüm çiftlerin seyrek matris çarpımıyla karşılaştırıldığı referansla aynı
+grupları bulduğu doğrulanır. Ardından veri seti istenen satır sayısına kadar çoğaltılır (kopyalar farklı yayın
+yıllarına kaydırılır, böylece birbirinin tekrarı olmaz) ve bilinen satırların kesin ve yazım hatalı kopyaları
+eklenir; tespitin süresi ve eklenen tekrarların ne kadarının bulunduğu ölçülür.
+
+    python benchmarks/bench_duplicates.py
+    python benchmarks/bench_duplicates.py --rows 500000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Çoğaltılan kopyalar arasındaki yayın yılı farkı (YEAR_TOLERANCE'tan büyük olmalı)
+YEAR_STEP = 3
+
+
+def reference_groups(df, threshold):
+    """Bloklamasız referans: bütün başlık çiftlerinin trigram kesişimleri tek bir seyrek matris çarpımıyla"""
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+
+    from netflix_analysis.duplicates import NUMBERS, YEAR_TOLERANCE, same_words
+    from netflix_analysis.names import canonical_bridge
+    from netflix_analysis.catalog import MULTI_VALUE_COLUMNS, PLACEHOLDER, Bridge
+    from netflix_analysis.title_index import TitleIndex
+
+    titles = TitleIndex.build(df)
+    directors = canonical_bridge(Bridge.from_column(df[MULTI_VALUE_COLUMNS['director']]))
+    n_rows = len(df)
+    trigrams = titles.trigrams
+    matrix = sparse.csr_matrix((np.ones(len(trigrams.rows)), (trigrams.rows, trigrams.codes)),
+                               shape=(n_rows, len(trigrams.values)))
+    overlap = sparse.triu(matrix @ matrix.T, k=1).tocoo()
+    i, j, shared = overlap.row, overlap.col, overlap.data
+    sizes = np.asarray(titles.trigram_counts)
+    keep = 2 * shared >= threshold * (sizes[i] + sizes[j])
+    i, j = i[keep], j[keep]
+
+    normalized = list(titles.normalized)
+    numbers = pd.Series(normalized).str.findall(NUMBERS).str.join(' ').values
+    years = df['release_year'].values
+    types = df['type'].values
+    people = {}
+    for row, code in zip(directors.rows.tolist(), directors.codes.tolist()):
+        if directors.values[code] != PLACEHOLDER:
+            people.setdefault(row, set()).add(code)
+    # Ana ülke: ilk listelenen ülke; bilinmiyorsa None
+    countries = [None if not isinstance(text, str) else text.split(',')[0].strip() or None for text in df['country']]
+    countries = [None if country == PLACEHOLDER else country for country in countries]
+
+    edges = []
+    for a, b in zip(i.tolist(), j.tolist()):
+        if types[a] != types[b] or abs(years[a] - years[b]) > YEAR_TOLERANCE or numbers[a] != numbers[b]:
+            continue
+        if a in people and b in people and not people[a] & people[b]:
+            continue
+        if a not in people and b not in people and (countries[a] is None or countries[a] != countries[b]):
+            continue
+        if same_words(normalized[a], normalized[b]):
+            edges.append((a, b))
+    # Aynı normalize başlık, yıl, tür ve direktörler (direktör yoksa ana ülke): kesin tekrar (benzerlik 1)
+    identities = [frozenset(people[row]) if row in people else countries[row] for row in range(n_rows)]
+    keys = pd.Series(list(zip(normalized, years, types, identities)))
+    first = keys.groupby(keys).transform(lambda group: group.index[0]).values
+    edges.extend((row, int(first[row])) for row in range(n_rows)
+                 if normalized[row] and identities[row] is not None and first[row] != row)
+
+    edges = np.array(edges, dtype=np.int64).reshape(-1, 2)
+    graph = sparse.coo_matrix((np.ones(len(edges)), (edges[:, 0], edges[:, 1])), shape=(n_rows, n_rows))
+    _, components = connected_components(graph, directed=False)
+    return components
+
+
+def typo(title, rng):
+    """Başlığın en uzun kelimesinin ortasından bir harf sil"""
+    words = title.split(' ')
+    longest = max(range(len(words)), key=lambda index: len(words[index]))
+    word = words[longest]
+    position = int(rng.integers(2, len(word) - 2))
+    words[longest] = word[:position] + word[position + 1:]
+    return ' '.join(words)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tekrar tespitinin hızı ve doğruluğu")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--rows', type=int, default=200_000, help="çoğaltılmış tablonun satır sayısı")
+    parser.add_argument('--injected', type=int, default=200, help="eklenen kesin ve yazım hatalı kopya sayısı")
+    args = parser.parse_args(argv)
+
+    from netflix_analysis.catalog import parse_catalog
+    from netflix_analysis.duplicates import SIMILARITY_THRESHOLD, DuplicateIndex
+
+    raw = pd.read_csv(args.data)
+    df = parse_catalog(raw)
+
+    start = time.perf_counter()
+    components = reference_groups(df, SIMILARITY_THRESHOLD)
+    reference_time = time.perf_counter() - start
+    start = time.perf_counter()
+    index = DuplicateIndex.build(df)
+    build_time = time.perf_counter() - start
+    # Aynı bölümleme: her referans bileşeni tek bir temsilciye, her temsilci tek bir bileşene karşılık gelir
+    pairs = pd.DataFrame({'component': components, 'group': index.representatives}).drop_duplicates()
+    consistent = not pairs['component'].duplicated().any() and not pairs['group'].duplicated().any()
+    print(f"gerçek veri ({len(df)} satır): {int(index.duplicated.sum())} tekrar, {build_time:.2f} s; "
+          f"tüm çiftler referansı {int(len(df) - len(pairs))} tekrar, {reference_time:.2f} s, "
+          f"aynı gruplar: {'evet' if consistent else 'hayır'}")
+
+    copies = -(-args.rows // len(raw))
+    big = pd.concat([raw] * copies, ignore_index=True).iloc[:args.rows]
+    copy = np.arange(len(big)) // len(raw)
+    big['show_id'] = big['show_id'] + '-' + copy.astype(str)
+    big['release_year'] = big['release_year'] + YEAR_STEP * copy
+
+    # Yalnızca gerçek veride tekrarı olmayan, en az üç kelimeli ve uzun kelimeli başlıklar kopyalanır
+    rng = np.random.default_rng(0)
+    titles = raw['title'].astype(str)
+    eligible = np.flatnonzero(index.keep[:len(raw)] & (index.representatives == np.arange(len(raw)))
+                              & (titles.str.split().str.len() >= 3).values
+                              & (titles.str.split().map(lambda words: max(map(len, words))) >= 8).values)
+    sources = rng.choice(eligible, 2 * args.injected, replace=False)
+    extra = big.iloc[sources].copy()
+    extra['show_id'] = [f'dup{number}' for number in range(len(extra))]
+    exact, near = sources[:args.injected], sources[args.injected:]
+    extra.loc[extra.index[:args.injected], 'title'] = titles.values[exact] + ' '
+    extra.loc[extra.index[args.injected:], 'title'] = [typo(title, rng) for title in titles.values[near]]
+    big = pd.concat([big, extra], ignore_index=True)
+    injected = np.arange(len(big) - len(extra), len(big))
+
+    start = time.perf_counter()
+    parsed = parse_catalog(big)
+    parse_time = time.perf_counter() - start
+    start = time.perf_counter()
+    index = DuplicateIndex.build(parsed)
+    build_time = time.perf_counter() - start
+
+    found = index.representatives[injected] == np.r_[exact, near]
+    found_exact, found_near = int(found[:args.injected].sum()), int(found[args.injected:].sum())
+    print(f"{len(big)} satır: ayrıştırma {parse_time:.2f} s, tekrar tespiti {build_time:.2f} s; "
+          f"bulunan kesin kopya {found_exact}/{args.injected}, yazım hatalı kopya {found_near}/{args.injected}; "
+          f"toplam tekrar {int(index.duplicated.sum())}")
+
+    return 0 if consistent and found_exact == args.injected and found_near >= 0.9 * args.injected else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Modül içe aktarma süreleri ve bütçe kontrolü; bir bütçe aşılırsa çıkış kodu 1 olur.
+
+Her modül temiz bir yorumlayıcıda ayrı ayrı içe aktarılır. Süre bütçesinin yanında, veri yollarında
+grafik (matplotlib, seaborn, wordcloud) ve uydurma (scipy) kütüphanelerinin yüklenmediği de kontrol edilir.
+
+    python benchmarks/bench_imports.py
+    python benchmarks/bench_imports.py --repeat 7 --scale 2   # yavaş makinelerde süre bütçelerini genişlet
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Yalnızca grafik çizerken veya eğri uydururken yüklenmesi gereken kütüphaneler
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'scipy', 'wordcloud']
+DATA_MODULES = ['numpy', 'pandas']
+
+# modül -> (süre bütçesi (saniye), yüklenmemesi gereken kütüphaneler)
+BUDGETS = {
+    'netflix_analysis.cli': (0.05, DATA_MODULES + HEAVY_MODULES),
+    'netflix_analysis.growth_models': (0.25, ['pandas'] + HEAVY_MODULES),
+    'netflix_analysis.model_registry': (0.25, ['pandas'] + HEAVY_MODULES),
+    'netflix_analysis.intervals': (0.25, ['pandas'] + HEAVY_MODULES),
+    'netflix_analysis.catalog': (1.0, HEAVY_MODULES),
+    'netflix_analysis.queries': (1.0, HEAVY_MODULES),
+    'netflix_analysis.service': (1.0, HEAVY_MODULES),
+    'netflix_analysis.growth_series': (1.0, HEAVY_MODULES),
+    'netflix_analysis.backtesting': (1.0, HEAVY_MODULES),
+    'netflix_analysis.aggregates': (1.0, HEAVY_MODULES),
+    'netflix_analysis.snapshots': (1.0, HEAVY_MODULES),
+    'netflix_analysis.title_index': (1.0, HEAVY_MODULES),
+    'netflix_analysis.names': (1.0, HEAVY_MODULES),
+    'netflix_analysis.dimensions': (1.0, HEAVY_MODULES),
+    'netflix_analysis.records': (1.0, HEAVY_MODULES),
+    'netflix_analysis.column_store': (1.0, HEAVY_MODULES),
+    'netflix_analysis.parallel': (1.0, HEAVY_MODULES),
+    'netflix_analysis.trends': (1.0, HEAVY_MODULES),
+    'netflix_analysis.sketches': (1.0, HEAVY_MODULES),
+    'netflix_analysis.report': (1.0, HEAVY_MODULES),
+    'netflix_analysis.validation': (1.0, HEAVY_MODULES),
+    'netflix_analysis.duplicates': (1.0, HEAVY_MODULES),
+    'netflix_analysis.neighbors': (1.0, HEAVY_MODULES),
+    'netflix_analysis.country_clusters': (1.0, HEAVY_MODULES),
+    'netflix_analysis.pipeline': (1.0, HEAVY_MODULES),
+    'netflix_analysis.analyses.years': (1.0, HEAVY_MODULES),
+    'netflix_analysis.analyses.durations': (1.0, HEAVY_MODULES),
+    'netflix_analysis.analyses.countries': (1.0, HEAVY_MODULES),
+    'netflix_analysis.analyses.directors': (1.0, HEAVY_MODULES),
+    'netflix_analysis.analyses.ratings': (1.0, HEAVY_MODULES),
+    'netflix_analysis.analyses.wordclouds': (1.0, HEAVY_MODULES),
+    'curve_fitting': (1.0, HEAVY_MODULES),
+    'content_type_curve_fitting': (1.0, HEAVY_MODULES),
+    'seasonal_curve_fitting': (1.0, HEAVY_MODULES),
+    'backtest_curve_fitting': (1.0, HEAVY_MODULES),
+    'years': (1.0, HEAVY_MODULES),
+    'durations': (1.0, HEAVY_MODULES),
+    'countries_and_categories': (1.0, HEAVY_MODULES),
+    'directors_analysis': (1.0, HEAVY_MODULES),
+    'netflix_rating_analysis': (1.0, HEAVY_MODULES),
+    'wordclouds': (1.0, HEAVY_MODULES),
+}
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(' '.join(sorted(name for name in sys.modules if '.' not in name)))
+"""
+
+
+def measure_import(module):
+    """Modülü temiz bir yorumlayıcıda içe aktar; (süre, yüklenen üst düzey modüller) döndür"""
+    result = subprocess.run([sys.executable, '-c', PROBE.format(module=module)], cwd=ROOT,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} içe aktarılamadı:\n{result.stderr.strip()}")
+
+    elapsed, loaded = result.stdout.strip().splitlines()[-2:]
+    return float(elapsed), set(loaded.split())
+
+
+def check_budgets(budgets=BUDGETS, repeat=5, scale=1.0):
+    """Her modül için ortanca içe aktarma süresini ve yasak kütüphaneleri kontrol et"""
+    rows = []
+    for module, (budget, forbidden) in budgets.items():
+        timings = []
+        for _ in range(repeat):
+            elapsed, loaded = measure_import(module)
+            timings.append(elapsed)
+
+        median = statistics.median(timings)
+        unexpected = [name for name in forbidden if name in loaded]
+        ok = median <= budget * scale and not unexpected
+        rows.append((module, median, budget * scale, unexpected, ok))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modül içe aktarma süreleri için bütçe kontrolü")
+    parser.add_argument('--repeat', type=int, default=5, help="Her modül için ölçüm sayısı (ortanca alınır)")
+    parser.add_argument('--scale', type=float, default=1.0, help="Süre bütçelerinin çarpanı")
+    args = parser.parse_args(argv)
+
+    rows = check_budgets(repeat=args.repeat, scale=args.scale)
+
+    width = max(len(module) for module, *_ in rows)
+    for module, median, budget, unexpected, ok in rows:
+        status = "TAMAM" if ok else "AŞILDI"
+        note = f"  yüklenmemeliydi: {', '.join(unexpected)}" if unexpected else ""
+        print(f"{module:<{width}}  {median * 1000:7.1f} ms / {budget * 1000:6.0f} ms  {status}{note}")
+
+    failed = [module for module, *_, ok in rows if not ok]
+    if failed:
+        print(f"\n{len(failed)} modül bütçeyi aştı: {', '.join(failed)}")
+        return 1
+
+    print(f"\nTüm modüller bütçe içinde ({len(rows)} modül).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Artık bootstrap: toplu (tek dizi işlemi) uydurma ile örnek başına curve_fit döngüsünün karşılaştırması.
+
+Her model için genel yıllık seride aynı yeniden örneklenmiş seriler iki yöntemle uydurulur; süreler ve
+2025 tahmin aralıklarının farkı raporlanır. Döngü yavaş olduğundan varsayılan olarak az sayıda örnekle çalışır.
+
+    python benchmarks/bench_intervals.py
+    python benchmarks/bench_intervals.py --samples 2000 --loop-samples 200
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Toplu bootstrap uydurmasının örnek başına döngüyle karşılaştırması")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--samples', type=int, default=2000, help="toplu yöntemdeki bootstrap örneği sayısı")
+    parser.add_argument('--loop-samples', type=int, default=200, help="döngüyle uydurulan örnek sayısı")
+    args = parser.parse_args(argv)
+
+    import pandas as pd
+
+    from netflix_analysis.growth_models import BOUNDS, fit_model, predict
+    from netflix_analysis.growth_series import yearly_counts
+    from netflix_analysis.intervals import batched_fit, bootstrap_interval, delta_interval
+
+    x, y = yearly_counts(pd.read_csv(args.data))
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    for model in ['linear', 'poly', 'exp']:
+        popt, pcov = fit_model(model, x, y)
+        rng = np.random.default_rng(0)
+        fitted = predict(model, x, popt)
+        Y = fitted + rng.choice(y - fitted, size=(args.loop_samples, len(x)))
+        bounds = BOUNDS[model](x, y) if model in BOUNDS else None
+
+        start = time.perf_counter()
+        P, ok = batched_fit(model, x, Y, popt, bounds)
+        batched = time.perf_counter() - start
+
+        start = time.perf_counter()
+        looped = np.array([fit_model(model, x, row, p0=popt)[0] for row in Y])
+        loop = time.perf_counter() - start
+
+        # Üstel modelde b -> 0 olan (neredeyse doğrusal) örneklerde vadi düz olduğundan iki çözüm biraz ayrışabilir
+        gaps = np.abs(predict(model, 25.0, P[ok].T[:, :, None]).ravel()
+                      - np.array([predict(model, 25.0, p) for p in looped[ok]]))
+
+        start = time.perf_counter()
+        _, lower, upper = bootstrap_interval(model, x, y, popt, 25.0, n_bootstrap=args.samples)
+        full = time.perf_counter() - start
+        _, delta_lower, delta_upper = delta_interval(model, x, y, popt, pcov, 25.0)
+
+        print(f"{model:<7} {args.loop_samples} örnek: toplu {batched * 1000:7.1f} ms, döngü {loop * 1000:8.1f} ms "
+              f"({loop / batched:6.1f}x), 2025 farkı medyan {np.median(gaps):.3g} / en büyük {gaps.max():.3g}")
+        print(f"        {args.samples} örnekli bootstrap {full * 1000:7.1f} ms  aralık [{lower[0]:.0f}, {upper[0]:.0f}]"
+              f"  (delta [{delta_lower[0]:.0f}, {delta_upper[0]:.0f}])")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
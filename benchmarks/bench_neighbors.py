@@ -0,0 +1,108 @@
+"""Benzer içerikler: komşu indeksinin oluşturulma süresi, yaklaşık aramanın isabeti ve arama gecikmesi.
+
+Gerçek veride kümelenmiş (IVF) yaklaşık arama, bütün çiftlerin kesin hesabıyla karşılaştırılır. Ardından veri
+seti istenen satır sayısına kadar çoğaltılır (yayın yılları rastgele kaydırılır, direktörler kopyaya göre
+değiştirilir) ve yaklaşık indeks oluşturulur. Kesin hesabın o boyuttaki süresi rastgele satırlardan oluşan
+bir blokla tahmin edilir; isabet aynı satırların kesin komşularıyla ölçülür. İsabet, yaklaşık komşulardan
+benzerliği kesin k. komşununkinden düşük olmayanların oranıdır (eşit skorlu komşular aynı sayılır).
+
+    python benchmarks/bench_neighbors.py
+    python benchmarks/bench_neighbors.py --rows 300000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+K = 10
+
+
+def recall(approximate_scores, exact_kth):
+    """Yaklaşık komşulardan benzerliği kesin k. komşununkine ulaşanların oranı"""
+    hits = approximate_scores[:, :K] >= exact_kth[:, None] - 1e-5
+    return float(hits.sum(axis=1).mean() / K)
+
+
+def sample_exact(matrix, rows):
+    """Seçili satırların kesin k. komşu benzerliği ve hesap süresi"""
+    start = time.perf_counter()
+    similarity = (matrix[rows] @ matrix.T).toarray()
+    similarity[np.arange(len(rows)), rows] = -np.inf
+    kth = -np.partition(-similarity, K - 1, axis=1)[:, K - 1]
+    return np.maximum(kth, 0), time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benzer içerik indeksinin hızı ve isabeti")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--rows', type=int, default=100_000, help="çoğaltılmış tablonun satır sayısı")
+    parser.add_argument('--sample', type=int, default=1000, help="kesin komşuları hesaplanan satır sayısı")
+    args = parser.parse_args(argv)
+
+    from netflix_analysis import queries
+    from netflix_analysis.catalog import MULTI_VALUE_COLUMNS, Catalog, parse_catalog
+    from netflix_analysis.neighbors import NeighborIndex, approximate_neighbors, exact_neighbors, feature_matrix
+
+    raw = pd.read_csv(args.data)
+    catalog = Catalog(parse_catalog(raw))
+    matrix = feature_matrix(catalog.df, {dimension: catalog.bridge(dimension) for dimension in MULTI_VALUE_COLUMNS})
+
+    start = time.perf_counter()
+    exact_rows, exact_scores = exact_neighbors(matrix)
+    exact_time = time.perf_counter() - start
+    start = time.perf_counter()
+    _, approximate_scores = approximate_neighbors(matrix)
+    approximate_time = time.perf_counter() - start
+    exact_kth = np.nan_to_num(exact_scores[:, K - 1])
+    real_recall = recall(np.nan_to_num(approximate_scores, nan=-1), exact_kth)
+    print(f"gerçek veri ({len(raw)} satır, {matrix.shape[1]} özellik): kesin {exact_time:.2f} s, "
+          f"yaklaşık {approximate_time:.2f} s, isabet@{K} {real_recall:.3f}")
+
+    catalog.neighbors()
+    titles = catalog.df['title'].values[np.random.default_rng(0).choice(len(raw), 200, replace=False)]
+    mask = np.ones(len(raw), dtype=bool)
+    start = time.perf_counter()
+    for title in titles:
+        queries.similar(catalog, title, mask, n=K)
+    print(f"  başlıkla arama (queries.similar): {(time.perf_counter() - start) / len(titles) * 1000:.2f} ms")
+
+    copies = -(-args.rows // len(raw))
+    big = pd.concat([raw] * copies, ignore_index=True).iloc[:args.rows]
+    copy = np.arange(len(big)) // len(raw)
+    rng = np.random.default_rng(0)
+    big['release_year'] = big['release_year'] + rng.integers(-2, 3, len(big))
+    known = big['director'] != 'Not Given'
+    big.loc[known, 'director'] = big.loc[known, 'director'] + ' ' + (copy[known.values] % 7).astype(str)
+    df = parse_catalog(big)
+
+    start = time.perf_counter()
+    matrix = feature_matrix(df)
+    feature_time = time.perf_counter() - start
+    start = time.perf_counter()
+    index = NeighborIndex(*approximate_neighbors(matrix))
+    build_time = time.perf_counter() - start
+
+    sample = np.sort(rng.choice(len(df), min(args.sample, len(df)), replace=False))
+    sample_kth, sample_time = sample_exact(matrix, sample)
+    big_recall = recall(np.nan_to_num(index.scores[sample], nan=-1), sample_kth)
+    estimated = sample_time * len(df) / len(sample)
+
+    lookups = rng.integers(0, len(df), 10_000)
+    start = time.perf_counter()
+    for row in lookups.tolist():
+        index.neighbors(row, K)
+    lookup_time = (time.perf_counter() - start) / len(lookups)
+    print(f"{len(df)} satır ({matrix.shape[1]} özellik): özellikler {feature_time:.2f} s, yaklaşık indeks "
+          f"{build_time:.2f} s (kesin hesap tahmini {estimated:.0f} s); isabet@{K} {big_recall:.3f} "
+          f"({len(sample)} satır); indeksten arama {lookup_time * 1e6:.1f} µs")
+
+    return 0 if real_recall >= 0.9 and big_recall >= 0.9 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Analiz DAG'ı: yalnızca ataların hesaplanması, ortak kaynakların paylaşılması ve disk önbelleği.
+
+Her bölüm için betiklerin yaptığı gibi kaynak (katalog veya toplam durumu) ayrı ayrı yüklenip analiz çalıştırılır;
+aynı bölümler pipeline ile tek seferde (kaynaklar paylaşılarak) hesaplanır ve sonuçların aynı olduğu doğrulanır.
+Tek bir grafik istendiğinde yalnızca atalarının hesaplandığı ve ikinci çalıştırmada her şeyin diskten okunduğu
+kontrol edilir.
+
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --workers 4
+"""
+import argparse
+import importlib
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Tek grafik isteği ve beklenen hesaplanan düğümler
+CHART = 'type_distribution_pie'
+CHART_ANCESTORS = {'aggregates', 'countries', CHART}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analiz DAG'ının hızı ve doğruluğu")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--workers', type=int, help="paralel iş parçacığı sayısı")
+    args = parser.parse_args(argv)
+
+    import matplotlib
+    matplotlib.use('Agg')
+
+    from netflix_analysis.aggregates import load_aggregates
+    from netflix_analysis.catalog import load_catalog
+    from netflix_analysis.pipeline import NODES, Pipeline
+
+    sections = [name for name, (_, _, inputs, _, _) in NODES.items() if inputs in (['catalog'], ['aggregates'])]
+    sources = {'catalog': lambda: load_catalog(args.data), 'aggregates': lambda: load_aggregates(args.data)}
+    load_catalog(args.data)
+
+    start = time.perf_counter()
+    expected = {}
+    for name in sections:
+        module, function, inputs, _, _ = NODES[name]
+        expected[name] = getattr(importlib.import_module(module), function)(sources[inputs[0]]())
+    separate_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as root:
+        fig_dir, cache_dir = os.path.join(root, 'graphics'), os.path.join(root, 'pipeline')
+        pipeline = Pipeline(args.data, fig_dir=fig_dir, cache_dir=cache_dir, workers=args.workers)
+        start = time.perf_counter()
+        results = pipeline.run(sections)
+        shared_time = time.perf_counter() - start
+        # Sonuçlar pandas nesneleri içerdiğinden serileştirilmiş halleri karşılaştırılır
+        same = all(pickle.dumps(results[name]) == pickle.dumps(expected[name]) for name in sections
+                   if NODES[name][3])
+        print(f"{len(sections)} bölüm: ayrı ayrı {separate_time:.2f} s, pipeline {shared_time:.2f} s "
+              f"({sorted(set(pipeline.computed) - set(sections))} paylaşıldı), aynı sonuçlar: "
+              f"{'evet' if same else 'hayır'}")
+
+        pipeline = Pipeline(args.data, fig_dir=fig_dir, cache_dir=cache_dir, workers=args.workers)
+        pipeline.values.pop('countries', None)
+        os.remove(next(os.path.join(cache_dir, name) for name in os.listdir(cache_dir)
+                       if name.startswith('countries-')))
+        start = time.perf_counter()
+        pipeline.run([CHART])
+        chart_time = time.perf_counter() - start
+        only_ancestors = set(pipeline.computed) == CHART_ANCESTORS
+        print(f"tek grafik ({CHART}): {chart_time:.2f} s, hesaplanan düğümler {sorted(pipeline.computed)}")
+
+        pipeline = Pipeline(args.data, fig_dir=fig_dir, cache_dir=cache_dir, workers=args.workers)
+        start = time.perf_counter()
+        pipeline.run(sections + [CHART])
+        warm_time = time.perf_counter() - start
+        print(f"ikinci çalıştırma: {warm_time:.2f} s, {len(pipeline.computed)} düğüm hesaplandı, "
+              f"{len(pipeline.loaded)} düğüm diskten okundu")
+
+    return 0 if same and only_ancestors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
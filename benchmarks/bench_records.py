@@ -0,0 +1,88 @@
+"""Satır satır dolaşma: DataFrame.iterrows, itertuples ve TitleRecord kayıtlarının süre ve bellek karşılaştırması.
+
+Her yöntem tüm katalogda başlık ve yayın yılını okuyup basit bir sayım yapar; bellek tracemalloc ile
+ölçülen en yüksek ek ayırmadır.
+
+    python benchmarks/bench_records.py
+    python benchmarks/bench_records.py --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def consume_iterrows(catalog):
+    count = 0
+    for _, row in catalog.df.iterrows():
+        if isinstance(row['title'], str) and row['release_year'] >= 2015:
+            count += 1
+    return count
+
+
+def consume_itertuples(catalog):
+    count = 0
+    for row in catalog.df.itertuples(index=False):
+        if isinstance(row.title, str) and row.release_year >= 2015:
+            count += 1
+    return count
+
+
+def consume_records(catalog):
+    count = 0
+    for record in catalog.records():
+        if record.title is not None and record.release_year >= 2015:
+            count += 1
+    return count
+
+
+METHODS = {
+    'iterrows': consume_iterrows,
+    'itertuples': consume_itertuples,
+    'records': consume_records,
+}
+
+
+def measure(function, catalog, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(catalog)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    function(catalog)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, min(timings), peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Satır satır dolaşma yöntemlerinin karşılaştırması")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--repeat', type=int, default=3, help="Her yöntem için ölçüm sayısı (en iyisi alınır)")
+    args = parser.parse_args(argv)
+
+    from netflix_analysis.catalog import load_catalog
+
+    catalog = load_catalog(args.data)
+    # Kayıt tablosunun (sözlük kodlaması) bir kerelik oluşturulması ölçüme katılmaz
+    next(catalog.records(), None)
+
+    results = {name: measure(function, catalog, args.repeat) for name, function in METHODS.items()}
+    baseline = results['iterrows'][1]
+    for name, (count, elapsed, peak) in results.items():
+        print(f"{name:<10}  {elapsed * 1000:8.1f} ms  ({baseline / elapsed:5.1f}x)  "
+              f"en yüksek bellek {peak / 1024:8.1f} KiB  sonuç {count}")
+
+    if len({count for count, _, _ in results.values()}) != 1:
+        print("\nYöntemler farklı sonuç verdi!")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Sorgu servisi için yerel yük testi: p50/p99 gecikme ve saniyedeki istek sayısı.
+
+    python benchmarks/bench_service.py --requests 5000 --concurrency 8
+    python benchmarks/bench_service.py --url http://127.0.0.1:8050   # çalışan bir servise karşı
+"""
+import argparse
+import http.client
+import os
+import random
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Panoların tipik olarak yaptığı isteklere benzer bir karışım
+QUERIES = [
+    '/ratings/distribution',
+    '/ratings/groups',
+    '/directors/top?n=15',
+    '/countries/type',
+    '/trends/yearly?by=type',
+    '/trends/yearly?year_field=year_added&by=rating_group',
+    '/counts?by=category&type=Movie',
+    '/top?dimension=country&n=10&year_range=2015-2020',
+    '/crosstab?row=country&column=rating_group&rating_group=Yeti%C5%9Fkin',
+    '/forecast?model=poly&year=2025',
+    '/forecast?model=exp&type=Movie',
+    '/ratings/distribution?country=India',
+    '/directors/top?country=United%20States&n=10',
+    '/titles/search?q=stranger%20thi&mode=prefix',
+    '/titles/search?q=narcos%20mexco&mode=fuzzy&n=5',
+]
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return float('nan')
+    index = min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def worker(host, port, paths, latencies, errors):
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    for path in paths:
+        start = time.perf_counter()
+        try:
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(path)
+        except (OSError, http.client.HTTPException):
+            errors.append(path)
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+
+
+def run_load(host, port, n_requests, concurrency, seed=0):
+    rng = random.Random(seed)
+    paths = [rng.choice(QUERIES) for _ in range(n_requests)]
+    chunks = [paths[i::concurrency] for i in range(concurrency)]
+
+    latencies = []
+    errors = []
+    threads = [threading.Thread(target=worker, args=(host, port, chunk, latencies, errors)) for chunk in chunks]
+
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': n_requests,
+        'errors': len(errors),
+        'elapsed': elapsed,
+        'throughput': len(latencies) / elapsed if elapsed else float('nan'),
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sorgu servisi yük testi")
+    parser.add_argument('--url', help="çalışan servis adresi; verilmezse servis bu süreçte başlatılır")
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--cold', action='store_true', help="ısınma turu yapma (önbellek soğukken ölç)")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        from netflix_analysis.service import create_server
+
+        server = create_server(port=0)
+        host, port = server.server_address
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    if not args.cold:
+        run_load(host, port, len(QUERIES), 1)
+
+    result = run_load(host, port, args.requests, args.concurrency)
+
+    print(f"İstek sayısı: {result['requests']} (eşzamanlılık {args.concurrency}, {result['errors']} hata)")
+    print(f"Süre: {result['elapsed']:.2f} saniye")
+    print(f"Verim: {result['throughput']:.0f} istek/saniye")
+    print(f"Gecikme p50: {result['p50_ms']:.2f} ms, p99: {result['p99_ms']:.2f} ms")
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
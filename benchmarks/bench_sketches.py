@@ -0,0 +1,80 @@
+"""Kantil özetleri: doğruluk, boyut ve birleştirme maliyeti.
+
+Yıl ve tür gruplarında özetlerden okunan p50/p90 değerleri pandas'ın kesin yüzdelikleriyle karşılaştırılır;
+en büyük mutlak fark, özetlerin toplam merkez sayısı ve ham değer sayısı raporlanır (yalnızca kesin
+merkezlerden oluşan küçük gruplarda fark sıfırdır). Ayrıca veri parçalara bölünüp özetler birleştirilerek
+tek geçişli kurulumla yakın sonuca ulaşıldığı kontrol edilir.
+
+    python benchmarks/bench_sketches.py
+    python benchmarks/bench_sketches.py --parts 16 --compression 200
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CHECKS = [
+    ('minutes', ['year_added'], {'type': 'Movie'}),
+    ('seasons', ['year_added'], {'type': 'TV Show'}),
+    ('years_delay', ['year_added'], {}),
+    ('years_delay', ['type'], {}),
+]
+
+
+def exact_quantiles(df, metric, by, filters, q):
+    df = df.assign(years_delay=df['year_added'] - df['release_year'])
+    for name, value in filters.items():
+        df = df[df[name] == value]
+    return df.dropna(subset=[metric]).groupby(by)[metric].quantile(q).unstack()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kantil özetlerinin doğruluğu ve birleştirilebilirliği")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--parts', type=int, default=8, help="birleştirme testinde veri parçası sayısı")
+    parser.add_argument('--compression', type=int, default=100)
+    args = parser.parse_args(argv)
+
+    from netflix_analysis.catalog import load_catalog
+    from netflix_analysis.sketches import DEFAULT_QUANTILES, QuantileSketches
+
+    df = load_catalog(args.data).df
+
+    start = time.perf_counter()
+    sketches = QuantileSketches.from_frame(df, compression=args.compression)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    merged = QuantileSketches(compression=args.compression)
+    for part in np.array_split(np.arange(len(df)), args.parts):
+        merged.merge(QuantileSketches.from_frame(df.iloc[part], compression=args.compression))
+    parts = time.perf_counter() - start
+
+    centroids = sum(len(digest.means) for digest in sketches.digests.values())
+    values = sum(int(digest.count) for digest in sketches.digests.values())
+    print(f"{len(sketches.digests)} özet, {centroids} merkez ({values} değer yerine); "
+          f"tek geçiş {build * 1000:.1f} ms, {args.parts} parça + birleştirme {parts * 1000:.1f} ms")
+
+    worst = 0.0
+    for metric, by, filters in CHECKS:
+        exact = exact_quantiles(df, metric, by, filters, DEFAULT_QUANTILES)
+        estimated = sketches.quantiles(metric, DEFAULT_QUANTILES, by, **filters)
+        from_parts = merged.quantiles(metric, DEFAULT_QUANTILES, by, **filters)
+        gap = float(np.nanmax(np.abs(estimated.values - exact.values)))
+        spread = float(np.nanmax(exact.values) - np.nanmin(exact.values)) or 1.0
+        merge_gap = float(np.nanmax(np.abs(from_parts.values - estimated.values)))
+        worst = max(worst, merge_gap / spread)
+        label = f"{metric} / {', '.join(by)}" + (f" ({filters['type']})" if filters else "")
+        print(f"  {label:<30} kesin değere en büyük fark {gap:6.2f}, parçalardan birleştirilen özetle fark "
+              f"{merge_gap:6.2f}")
+
+    # Birleştirilen özetlerin sonucu tek geçişli özetten değer aralığının %5'inden fazla sapmamalı
+    return 0 if worst < 0.05 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Sütun deposunun paylaşımı: N işçi süreci aynı depoyu açıp köprü tablolarını ve sütunları okur.
+
+Her işçi için özel bellek (USS, yalnızca o sürece ait sayfalar) ve toplam yerleşik bellek (RSS) raporlanır.
+Depo mmap ile açıldığından sayfalar işletim sisteminin önbelleğinde paylaşılır; işçi başına özel bellek
+işçi sayısından bağımsız kalmalıdır. Bellek değerleri /proc/<pid>/smaps_rollup dosyasından okunur (Linux).
+
+    python benchmarks/bench_store.py
+    python benchmarks/bench_store.py --workers 1 2 4 8
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def memory_usage():
+    """(RSS, USS) KiB cinsinden; okunamazsa (None, None)"""
+    try:
+        with open('/proc/self/smaps_rollup', encoding='utf-8') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line and not line.startswith('0'))
+    except OSError:
+        return None, None
+    kib = {name: int(value.split()[0]) for name, value in fields.items()}
+    return kib.get('Rss', 0), kib.get('Private_Clean', 0) + kib.get('Private_Dirty', 0)
+
+
+def worker(cache_dir, results):
+    from netflix_analysis.catalog import MULTI_VALUE_COLUMNS, open_catalog
+
+    baseline = memory_usage()
+    start = time.perf_counter()
+    catalog = open_catalog(cache_dir)
+    total = 0
+    for dimension in MULTI_VALUE_COLUMNS:
+        bridge = catalog.bridge(dimension)
+        total += int(bridge.codes.sum()) + int(bridge.order.sum())
+    for record in catalog.records():
+        total += record.release_year
+    elapsed = time.perf_counter() - start
+    rss, uss = memory_usage()
+    results.put((elapsed, rss - (baseline[0] or 0) if rss is not None else None,
+                 uss - (baseline[1] or 0) if uss is not None else None, total))
+
+
+def run(cache_dir, n_workers):
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    processes = [context.Process(target=worker, args=(cache_dir, results)) for _ in range(n_workers)]
+    for process in processes:
+        process.start()
+    measured = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return measured
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sütun deposunun işçi süreçleri arasında paylaşımı")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--cache-dir', default='cache')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args(argv)
+
+    from netflix_analysis.catalog import load_catalog
+
+    # Depo yoksa veya CSV değiştiyse bir kez oluşturulur
+    load_catalog(args.data, cache_dir=args.cache_dir)
+
+    totals = set()
+    for n_workers in args.workers:
+        measured = run(args.cache_dir, n_workers)
+        elapsed = max(m[0] for m in measured)
+        rss = [m[1] for m in measured if m[1] is not None]
+        uss = [m[2] for m in measured if m[2] is not None]
+        totals.update(m[3] for m in measured)
+        memory = (f"işçi başına ek RSS {sum(rss) / len(rss) / 1024:6.1f} MiB, "
+                  f"ek özel bellek {sum(uss) / len(uss) / 1024:6.1f} MiB" if rss else "bellek ölçülemedi")
+        print(f"{n_workers:>2} işçi  açma + okuma {elapsed * 1000:7.1f} ms  {memory}")
+
+    if len(totals) != 1:
+        print("\nİşçiler farklı sonuç verdi!")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
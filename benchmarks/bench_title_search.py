@@ -0,0 +1,86 @@
+"""Başlık arama indeksi gecikmesi: arama türü başına p50/p99; p99 bütçeyi aşarsa çıkış kodu 1 olur.
+
+Sorgular katalogdaki başlıklardan türetilir (tam başlık, ilk kelime, kısaltılmış önek, harf atlanmış hali).
+
+    python benchmarks/bench_title_search.py
+    python benchmarks/bench_title_search.py --queries 2000 --budget-ms 1
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def sample_queries(titles, n, seed=0):
+    """Arama türü -> sorgu listesi"""
+    rng = random.Random(seed)
+    picked = [rng.choice(titles) for _ in range(n)]
+
+    def typo(title):
+        if len(title) < 4:
+            return title
+        i = rng.randrange(1, len(title) - 1)
+        return title[:i] + title[i + 1:]
+
+    return {
+        'exact': picked,
+        'tokens': [title.split()[0] for title in picked],
+        'prefix': [title[:max(3, len(title) // 2)] for title in picked],
+        'fuzzy': [typo(title) for title in picked],
+    }
+
+
+def percentile(sorted_values, q):
+    index = min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Başlık arama indeksi gecikme ölçümü")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--queries', type=int, default=1000, help="arama türü başına sorgu sayısı")
+    parser.add_argument('--budget-ms', type=float, default=1.0, help="indeks araması için p99 bütçesi")
+    args = parser.parse_args(argv)
+
+    import numpy as np
+
+    from netflix_analysis import queries
+    from netflix_analysis.catalog import load_catalog
+
+    catalog = load_catalog(args.data)
+    index = catalog.titles()
+    mask = np.ones(len(catalog), dtype=bool)
+    titles = catalog.df['title'].dropna().astype(str).tolist()
+
+    failed = []
+    for mode, texts in sample_queries(titles, args.queries).items():
+        lookup, full = [], []
+        for text in texts:
+            start = time.perf_counter()
+            index.search(text, mode)
+            lookup.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            queries.search(catalog, text, mask, mode=mode)
+            full.append(time.perf_counter() - start)
+
+        lookup.sort()
+        full.sort()
+        p99 = percentile(lookup, 99) * 1000
+        status = "TAMAM" if p99 <= args.budget_ms else "AŞILDI"
+        print(f"{mode:<7} indeks p50 {percentile(lookup, 50) * 1000:6.3f} ms, p99 {p99:6.3f} ms  {status}   "
+              f"kayıtlarla p50 {percentile(full, 50) * 1000:6.3f} ms")
+        if p99 > args.budget_ms:
+            failed.append(mode)
+
+    if failed:
+        print(f"\nBütçeyi aşan arama türleri: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Trend motoru: onlarca trend çizgisinin tek TrendTable geçişiyle ve çizgi başına groupby ile hesaplanması.
+
+Her boyut (tür, rating grubu, ülke, kategori) ve metrik (sayı, ortalama süre, ortalama gecikme) için yıllık
+değerler, 3 yıllık kayan pencere ve yıllık büyüme iki yoldan hesaplanır; süreler ve en büyük fark raporlanır.
+
+    python benchmarks/bench_trends.py
+    python benchmarks/bench_trends.py --repeat 10 --window 5
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DIMENSIONS = ['type', 'rating_group', 'country', 'category']
+METRICS = [None, 'minutes', 'delay']
+
+
+def with_trend(catalog, window):
+    from netflix_analysis.queries import _labelled_rows, _metric_values
+    from netflix_analysis.trends import TrendTable
+
+    mask = np.ones(len(catalog), dtype=bool)
+    years = catalog.df['year_added'].values
+    metrics = {name: _metric_values(catalog, name) for name in METRICS if name}
+    results = {}
+    for dimension in DIMENSIONS:
+        rows, groups = _labelled_rows(catalog, dimension, mask)
+        table = TrendTable.build(years[rows], groups, {name: values[rows] for name, values in metrics.items()})
+        for metric in METRICS:
+            values = table.grid(metric, window)
+            growth = table.yoy(metric)
+            for i, group in enumerate(table.groups):
+                results[dimension, group, metric] = (table.years, values[i], growth[i])
+    return results
+
+
+def with_groupby(catalog, window):
+    import pandas as pd
+
+    from netflix_analysis.queries import _labelled_rows, _metric_values
+
+    mask = np.ones(len(catalog), dtype=bool)
+    df = catalog.df
+    years = df['year_added'].values
+    full = pd.RangeIndex(int(years.min()), int(years.max()) + 1)
+    metrics = {name: _metric_values(catalog, name) for name in METRICS if name}
+    results = {}
+    for dimension in DIMENSIONS:
+        rows, groups = _labelled_rows(catalog, dimension, mask)
+        frame = pd.DataFrame({'year': years[rows], 'group': groups,
+                              **{name: values[rows] for name, values in metrics.items()}})
+        # Her trend çizgisi kendi groupby / rolling / pct_change çağrılarıyla hesaplanır
+        for group in sorted(frame['group'].unique()):
+            part = frame[frame['group'] == group]
+            for metric in METRICS:
+                if metric is None:
+                    yearly = part.groupby('year').size().reindex(full, fill_value=0).astype(float)
+                    rolled = yearly.rolling(window).sum()
+                else:
+                    sums = part.groupby('year')[metric].agg(['sum', 'count']).reindex(full, fill_value=0)
+                    rolled_sums = sums.rolling(window).sum()
+                    rolled = rolled_sums['sum'] / rolled_sums['count'].where(rolled_sums['count'] > 0)
+                    yearly = sums['sum'] / sums['count'].where(sums['count'] > 0)
+                growth = yearly / yearly.shift() - 1
+                growth = growth.where(yearly.shift() != 0)
+                results[dimension, group, metric] = (full.values, rolled.values, growth.values)
+    return results
+
+
+def timed(function, repeat, *args):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tek geçişli trend motoru ile çizgi başına groupby karşılaştırması")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--window', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    from netflix_analysis.catalog import load_catalog
+
+    catalog = load_catalog(args.data)
+    trend_time, trends = timed(with_trend, args.repeat, catalog, args.window)
+    groupby_time, expected = timed(with_groupby, args.repeat, catalog, args.window)
+
+    gap = 0.0
+    for key, (years, values, growth) in expected.items():
+        _, trend_values, trend_growth = trends[key]
+        for a, b in [(values, trend_values), (growth, trend_growth)]:
+            if not np.array_equal(np.isnan(a), np.isnan(b)):
+                print(f"{key}: eksik değerler farklı!")
+                return 1
+            finite = ~np.isnan(a)
+            if finite.any():
+                gap = max(gap, float(np.max(np.abs(a[finite] - b[finite]) / np.maximum(np.abs(a[finite]), 1))))
+
+    print(f"{len(expected)} trend çizgisi ({len(DIMENSIONS)} boyut, {len(METRICS)} metrik, "
+          f"{args.window} yıllık pencere ve yıllık büyüme)")
+    print(f"  TrendTable:          {trend_time * 1000:8.1f} ms")
+    print(f"  çizgi başına groupby: {groupby_time * 1000:8.1f} ms  ({groupby_time / trend_time:.0f}x)")
+    print(f"  en büyük göreli fark: {gap:.2e}")
+    return 0 if gap < 1e-9 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
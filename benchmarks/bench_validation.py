@@ -0,0 +1,117 @@
+"""Veri doğrulama: vektörel kontrollerin hızı ve doğruluğu.
+
+Veri seti istenen satır sayısına kadar çoğaltılır (show_id'ler tekilleştirilir) ve her kural için bilinen
+satırlara hatalı değerler yazılır. Vektörel doğrulamanın süresi ölçülür ve bozulan her satırın ilgili kuralda
+yakalandığı kontrol edilir. Ayrıca gerçek veride satır satır çalışan basit bir referansla aynı ihlallerin
+bulunduğu doğrulanır.
+
+    python benchmarks/bench_validation.py
+    python benchmarks/bench_validation.py --rows 5000000
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Kural -> (sütun, yazılacak hatalı değer)
+FAULTS = {
+    'missing_value': ('title', np.nan),
+    'invalid_type': ('type', 'Film'),
+    'unparseable_date': ('date_added', '31/31/2020'),
+    'malformed_duration': ('duration', '90 mins'),
+    'placeholder': ('rating', 'Not Given'),
+}
+
+
+def reference_violations(raw):
+    """Satır satır referans: {(kural, sütun): satır kümesi} (yalnızca hata düzeyindeki kurallar)"""
+    from netflix_analysis.validation import CONTENT_TYPES, DURATION_PATTERN, REQUIRED_COLUMNS
+
+    found = {}
+    seen = {}
+    for row, record in enumerate(raw.to_dict('records')):
+        def flag(rule, column):
+            found.setdefault((rule, column), set()).add(row)
+
+        for column in REQUIRED_COLUMNS:
+            if pd.isna(record[column]):
+                flag('missing_value', column)
+        seen.setdefault(record['show_id'], []).append(row)
+        if record['type'] not in CONTENT_TYPES:
+            flag('invalid_type', 'type')
+        added = pd.to_datetime(record['date_added'], errors='coerce', format='%m/%d/%Y')
+        if pd.isna(added):
+            flag('unparseable_date', 'date_added')
+        elif record['release_year'] > added.year:
+            flag('release_after_added', 'release_year')
+        duration = record['duration']
+        if not re.fullmatch(DURATION_PATTERN, duration):
+            flag('malformed_duration', 'duration')
+        elif (record['type'] == 'Movie') == ('Season' in duration):
+            flag('duration_unit_mismatch', 'duration')
+    for rows in seen.values():
+        if len(rows) > 1:
+            found.setdefault(('duplicate_id', 'show_id'), set()).update(rows)
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vektörel veri doğrulamanın hızı ve doğruluğu")
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--rows', type=int, default=2_000_000, help="çoğaltılmış tablonun satır sayısı")
+    args = parser.parse_args(argv)
+
+    from netflix_analysis.catalog import parse_catalog
+    from netflix_analysis.validation import validate_frame
+
+    raw = pd.read_csv(args.data)
+
+    start = time.perf_counter()
+    reference = reference_violations(raw)
+    reference_time = time.perf_counter() - start
+    report = validate_frame(raw)
+    mismatched = [key for key, (rows, _) in report.entries.items()
+                  if key[0] != 'placeholder' and set(rows.tolist()) != reference.get(key, set())]
+    print(f"gerçek veri ({len(raw)} satır): {len(report)} ihlal; satır satır referans {reference_time:.2f} s, "
+          f"farklı sonuçlanan kural: {len(mismatched)}")
+
+    copies = -(-args.rows // len(raw))
+    big = pd.concat([raw] * copies, ignore_index=True).iloc[:args.rows]
+    big['show_id'] = big['show_id'] + '-' + (np.arange(len(big)) // len(raw)).astype(str)
+    rng = np.random.default_rng(0)
+    injected = {}
+    for rule, (column, value) in FAULTS.items():
+        rows = np.sort(rng.choice(len(big), 50, replace=False))
+        big.loc[rows, column] = value
+        injected[rule, column] = rows
+    # Tekrarlanan show_id
+    big.loc[1, 'show_id'] = big.loc[0, 'show_id']
+    injected['duplicate_id', 'show_id'] = np.array([0, 1])
+
+    start = time.perf_counter()
+    parsed = parse_catalog(big)
+    parse_time = time.perf_counter() - start
+    start = time.perf_counter()
+    report = validate_frame(big, parsed)
+    validate_time = time.perf_counter() - start
+
+    missed = 0
+    for key, rows in injected.items():
+        missed += len(np.setdiff1d(rows, report.entries[key][0]))
+    print(f"{len(big)} satır: ayrıştırma {parse_time:.2f} s, doğrulama {validate_time:.2f} s; "
+          f"{sum(len(rows) for rows in injected.values())} bozuk satırdan yakalanmayan: {missed}")
+    for record in report.summary():
+        if record['rows']:
+            print(f"  {record['rule']:<24} {record['column']:<14} {record['rows']:>9}")
+
+    return 0 if not mismatched and not missed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,38 @@
+import argparse
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
-import seaborn as sns
 import os
 from collections import Counter
 
-# Görsel stili ayarlama
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("viridis")
+from netflix_analysis.duplicates import dedupe_frame
+from netflix_analysis.growth_models import poly_func, r_squared
+from netflix_analysis.catalog import Bridge, dataset_version
+from netflix_analysis.dimensions import CountryTable
+from netflix_analysis.intervals import DEFAULT_LEVEL, format_interval, forecast_interval, write_intervals
+from netflix_analysis.model_registry import ModelRegistry
+from netflix_analysis.parallel import map_groups
 
-# Grafiklerin kaydedileceği dizini kontrol etme ve oluşturma
-if not os.path.exists('graphics/curve_fitting'):
-    os.makedirs('graphics/curve_fitting')
+FIG_DIR = 'graphics/curve_fitting'
+
+
+# Görsel stili ayarlama ve grafik dizinini oluşturma; matplotlib yalnızca grafik çizilirken yüklenir
+def setup_plotting():
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("viridis")
+    os.makedirs(FIG_DIR, exist_ok=True)
+    return plt
 
 
 # Veri setini yükleme
-def load_data():
+def load_data(dedupe=False):
     try:
         netflix_data = pd.read_csv('data/netflix1.csv')
+        if dedupe:
+            # Farklı show_id'lerle tekrar listelenen içerikler bir kez sayılır
+            netflix_data = dedupe_frame(netflix_data)
         return netflix_data
     except FileNotFoundError:
         print(
@@ -26,32 +40,49 @@ def load_data():
         return None
 
 
-# Curve fitting fonksiyonları
-def linear_func(x, a, b):
-    return a * x + b
-
+# Tek bir grubun 2000 sonrası yıllık içerik sayıları ve polinom modeli (işçi süreçlerinde çalışır)
+def yearly_growth(arrays, group):
+    series, column, codes, min_points, registry = group
 
-def poly_func(x, a, b, c):
-    return a * x ** 2 + b * x + c
+    # Gruba ait içerikler: sütun kodu seçilen kodlardan biri olan satırlar
+    years = arrays['release_year'][np.isin(arrays[column], codes)]
+    x_data, y_data = np.unique(years[years >= 2000], return_counts=True)
+    if len(x_data) < min_points:
+        return None
+    x_data = x_data - 2000
 
+    try:
+        registry.fit(series, 'poly', x_data, y_data)
+    except Exception as e:
+        return x_data, y_data, registry, e
+    return x_data, y_data, registry, None
 
-def exp_func(x, a, b, c):
-    return a * np.exp(b * x) + c
 
+# Grupları işçi havuzunda çalıştır; kayıt defterine her gruba yalnızca kendi kaydı gönderilir
+def fit_groups(groups, arrays, registry, workers=None):
+    tasks = [(series, column, codes, min_points, registry.subset([(series, 'poly')]))
+             for series, column, codes, min_points in groups]
+    results = map_groups(yearly_growth, tasks, arrays, workers)
+    for result in results:
+        if result is not None:
+            registry.merge(result[2])
+    return results
 
-def logistic_func(x, L, k, x0):
-    return L / (1 + np.exp(-k * (x - x0)))
 
+# Gelecek yıllar için tahmin aralığı bandını çiz, 2025 tahmininin aralık kaydını döndür (delta yöntemi)
+def forecast_band(plt, series, x_data, y_data, entry, future_years, color):
+    _, lower, upper = forecast_interval('poly', x_data, y_data, entry.popt, entry.pcov, future_years)
+    plt.fill_between(future_years + 2000, lower, upper, color=color, alpha=0.15)
 
-# R-kare değerini hesaplama
-def r_squared(y_true, y_pred):
-    ss_res = np.sum((y_true - y_pred) ** 2)
-    ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
-    return 1 - (ss_res / ss_tot)
+    forecast, lower, upper = forecast_interval('poly', x_data, y_data, entry.popt, entry.pcov, 2025 - 2000)
+    return {'series': series, 'model': 'poly', 'year': 2025, 'forecast': forecast, 'lower': lower,
+            'upper': upper, 'level': DEFAULT_LEVEL, 'interval': 'delta'}
 
 
 # Genre bazlı analiz
-def analyze_genres(data):
+def analyze_genres(data, registry, workers=None):
+    plt = setup_plotting()
+
     # Liste olarak saklanan 'listed_in' (genre) sütununu ayırma
     genres = []
     for g in data['listed_in']:
@@ -62,30 +93,29 @@ def analyze_genres(data):
     genre_counter = Counter(genres)
     top_genres = dict(genre_counter.most_common(10))
 
-    # Her tür için yıla göre içerik sayısını hesaplama
-    genre_growth = {}
-
-    for genre in top_genres:
-        # Bu türü içeren içerikleri filtrele
-        genre_data = data[data['listed_in'].apply(lambda x: isinstance(x, str) and genre in x)]
-
-        # Yıla göre grupla
-        yearly_count = genre_data.groupby('release_year').size().reset_index(name='count')
-        yearly_count = yearly_count[yearly_count['release_year'] >= 2000]
-
-        if not yearly_count.empty:
-            genre_growth[genre] = yearly_count
+    # Her tür için, 'listed_in' metninde türü içeren farklı değerlerin kodları (arama sözlükte bir kez yapılır)
+    listed_codes, listed_values = pd.factorize(data['listed_in'])
+    listed_values = np.asarray(listed_values, dtype=str)
+    groups = [(f'genre/{genre}', 'listed_in', np.flatnonzero(np.char.find(listed_values, genre) >= 0), 1)
+              for genre in top_genres]
+    arrays = {'release_year': data['release_year'].values, 'listed_in': listed_codes}
 
     # Türlere göre curve fitting uygula
+    interval_rows = []
     plt.figure(figsize=(15, 10))
 
-    for i, (genre, yearly_data) in enumerate(genre_growth.items()):
-        x_data = yearly_data['release_year'].values - 2000
-        y_data = yearly_data['count'].values
+    for genre, result in zip(top_genres, fit_groups(groups, arrays, registry, workers)):
+        if result is None:
+            continue
+        x_data, y_data, _, error = result
 
         try:
+            if error is not None:
+                raise error
+
             # Polinom modeli uygulama
-            popt, _ = curve_fit(poly_func, x_data, y_data)
+            entry = registry.get(f'genre/{genre}', 'poly')
+            popt = entry.popt
 
             # Model performansını değerlendirme
             y_pred = poly_func(x_data, *popt)
@@ -102,9 +132,13 @@ def analyze_genres(data):
             # Çizim
             plt.scatter(x_data + 2000, y_data, alpha=0.6, label=f'{genre} (Veri)')
             plt.plot(x_smooth + 2000, y_smooth, linewidth=2)
-            plt.plot(future_years + 2000, future_counts, '--', linewidth=2)
+            future_line, = plt.plot(future_years + 2000, future_counts, '--', linewidth=2)
+            interval = forecast_band(plt, f'genre/{genre}', x_data, y_data, entry, future_years,
+                                     future_line.get_color())
+            interval_rows.append(interval)
 
-            print(f"{genre}: R²={r2:.4f}, 2025 tahmini: {int(poly_func(25, *popt))} içerik")
+            print(f"{genre}: R²={r2:.4f}, 2025 tahmini: {int(registry.forecast(f'genre/{genre}', 'poly', 2025))} içerik "
+                  f"({format_interval(interval['lower'], interval['upper'])})")
 
         except Exception as e:
             print(f"{genre} için curve fitting yapılamadı: {e}")
@@ -121,35 +155,40 @@ def analyze_genres(data):
     plt.savefig('graphics/curve_fitting/netflix_genre_growth_prediction.png', dpi=300, bbox_inches='tight')
     plt.close()
 
+    return interval_rows
+
 
 # Ülke bazlı analiz
-def analyze_countries(data):
-    # Boş olmayan ülke verilerini seçme
-    country_data = data.dropna(subset=['country'])
+def analyze_countries(data, registry, workers=None):
+    plt = setup_plotting()
 
-    # Her içeriğin ilk ülkesini alma (birden fazla ülke olabilir)
-    country_data['main_country'] = country_data['country'].apply(lambda x: x.split(',')[0].strip())
+    # Her içeriğin ilk ülkesinin kodu (birden fazla ülke olabilir; ülkesi olmayanlarda -1)
+    countries = CountryTable.from_bridge(Bridge.from_column(data['country'].reset_index(drop=True)), len(data))
+    main_codes = countries.main_codes
 
     # En çok içeriği olan 6 ülkeyi bulma
-    top_countries = country_data['main_country'].value_counts().head(6).index
+    top_codes = np.argsort(-countries.main_counts(), kind='stable')[:6]
 
-    plt.figure(figsize=(15, 10))
+    # Her ülkenin içerikleri ana ülke koduyla (tamsayı karşılaştırması) seçilir
+    groups = [(f'country/{countries.names[code]}', 'main_country', [code], 1) for code in top_codes]
+    arrays = {'release_year': data['release_year'].values, 'main_country': main_codes}
 
-    for i, country in enumerate(top_countries):
-        # Bu ülkeye ait içerikleri filtrele
-        country_contents = country_data[country_data['main_country'] == country]
+    interval_rows = []
+    plt.figure(figsize=(15, 10))
 
-        # Yıla göre grupla
-        yearly_count = country_contents.groupby('release_year').size().reset_index(name='count')
-        yearly_count = yearly_count[yearly_count['release_year'] >= 2000]
+    for code, result in zip(top_codes, fit_groups(groups, arrays, registry, workers)):
+        country = countries.names[code]
 
-        if not yearly_count.empty:
-            x_data = yearly_count['release_year'].values - 2000
-            y_data = yearly_count['count'].values
+        if result is not None:
+            x_data, y_data, _, error = result
 
             try:
+                if error is not None:
+                    raise error
+
                 # Polinom modeli uygulama
-                popt, _ = curve_fit(poly_func, x_data, y_data)
+                entry = registry.get(f'country/{country}', 'poly')
+                popt = entry.popt
 
                 # Görselleştirme
                 x_smooth = np.linspace(min(x_data), max(x_data), 100)
@@ -162,11 +201,15 @@ def analyze_countries(data):
                 # Çizim
                 plt.scatter(x_data + 2000, y_data, alpha=0.6, label=f'{country} (Veri)')
                 plt.plot(x_smooth + 2000, y_smooth, linewidth=2)
-                plt.plot(future_years + 2000, future_counts, '--', linewidth=2)
+                future_line, = plt.plot(future_years + 2000, future_counts, '--', linewidth=2)
+                interval = forecast_band(plt, f'country/{country}', x_data, y_data, entry, future_years,
+                                         future_line.get_color())
+                interval_rows.append(interval)
 
-                # 2025 tahmini
-                pred_2025 = poly_func(25, *popt)  # 2025 - 2000 = 25
-                print(f"{country}: 2025 tahmini: {int(pred_2025)} içerik")
+                # 2025 tahmini (kayıt defterindeki parametrelerden)
+                pred_2025 = registry.forecast(f'country/{country}', 'poly', 2025)
+                print(f"{country}: 2025 tahmini: {int(pred_2025)} içerik "
+                      f"({format_interval(interval['lower'], interval['upper'])})")
 
             except Exception as e:
                 print(f"{country} için curve fitting yapılamadı: {e}")
@@ -183,32 +226,38 @@ def analyze_countries(data):
     plt.savefig('graphics/curve_fitting/netflix_country_growth_prediction.png', dpi=300, bbox_inches='tight')
     plt.close()
 
+    return interval_rows
+
 
 # Rating bazlı analiz
-def analyze_ratings(data):
+def analyze_ratings(data, registry, workers=None):
+    plt = setup_plotting()
+
     # Boş olmayan rating verilerini seçme
     rating_data = data.dropna(subset=['rating'])
 
     # En çok kullanılan 6 derecelendirmeyi bulma
     top_ratings = rating_data['rating'].value_counts().head(6).index
 
-    plt.figure(figsize=(15, 10))
-
-    for i, rating in enumerate(top_ratings):
-        # Bu derecelendirmeye sahip içerikleri filtrele
-        rating_contents = rating_data[rating_data['rating'] == rating]
+    # Her derecelendirmenin içerikleri rating koduyla seçilir; en az 4 veri noktası olsun
+    rating_codes, rating_values = pd.factorize(rating_data['rating'])
+    groups = [(f'rating/{rating}', 'rating', [rating_values.get_loc(rating)], 4) for rating in top_ratings]
+    arrays = {'release_year': rating_data['release_year'].values, 'rating': rating_codes}
 
-        # Yıla göre grupla
-        yearly_count = rating_contents.groupby('release_year').size().reset_index(name='count')
-        yearly_count = yearly_count[yearly_count['release_year'] >= 2000]
+    interval_rows = []
+    plt.figure(figsize=(15, 10))
 
-        if not yearly_count.empty and len(yearly_count) > 3:  # En az 4 veri noktası olsun
-            x_data = yearly_count['release_year'].values - 2000
-            y_data = yearly_count['count'].values
+    for rating, result in zip(top_ratings, fit_groups(groups, arrays, registry, workers)):
+        if result is not None:
+            x_data, y_data, _, error = result
 
             try:
+                if error is not None:
+                    raise error
+
                 # Polinom modeli uygulama
-                popt, _ = curve_fit(poly_func, x_data, y_data)
+                entry = registry.get(f'rating/{rating}', 'poly')
+                popt = entry.popt
 
                 # Görselleştirme
                 x_smooth = np.linspace(min(x_data), max(x_data), 100)
@@ -221,11 +270,15 @@ def analyze_ratings(data):
                 # Çizim
                 plt.scatter(x_data + 2000, y_data, alpha=0.6, label=f'{rating} (Veri)')
                 plt.plot(x_smooth + 2000, y_smooth, linewidth=2)
-                plt.plot(future_years + 2000, future_counts, '--', linewidth=2)
+                future_line, = plt.plot(future_years + 2000, future_counts, '--', linewidth=2)
+                interval = forecast_band(plt, f'rating/{rating}', x_data, y_data, entry, future_years,
+                                         future_line.get_color())
+                interval_rows.append(interval)
 
-                # 2025 tahmini
-                pred_2025 = poly_func(25, *popt)  # 2025 - 2000 = 25
-                print(f"{rating}: 2025 tahmini: {int(pred_2025)} içerik")
+                # 2025 tahmini (kayıt defterindeki parametrelerden)
+                pred_2025 = registry.forecast(f'rating/{rating}', 'poly', 2025)
+                print(f"{rating}: 2025 tahmini: {int(pred_2025)} içerik "
+                      f"({format_interval(interval['lower'], interval['upper'])})")
 
             except Exception as e:
                 print(f"{rating} için curve fitting yapılamadı: {e}")
@@ -242,25 +295,42 @@ def analyze_ratings(data):
     plt.savefig('graphics/curve_fitting/netflix_rating_growth_prediction.png', dpi=300, bbox_inches='tight')
     plt.close()
 
+    return interval_rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tür, ülke ve rating bazında curve fitting")
+    parser.add_argument('--dedupe', action='store_true', help="tekrar listelenen içerikleri bir kez say")
+    parser.add_argument('--workers', type=int, help="grupları bu kadar süreçte uydur (varsayılan: sırayla)")
+    args = parser.parse_args(argv)
 
-def main():
     # Veri setini yükleme
-    netflix_data = load_data()
+    netflix_data = load_data(dedupe=args.dedupe)
 
     if netflix_data is not None:
         print("Netflix veri seti başarıyla yüklendi. Toplam kayıt sayısı:", len(netflix_data))
 
+        # Önceki çalıştırmalardan kalan model parametreleri
+        registry = ModelRegistry(data_version=dataset_version())
+
         # Tür bazlı analiz
         print("\n=== Türlere Göre Büyüme Analizi ===")
-        analyze_genres(netflix_data)
+        interval_rows = analyze_genres(netflix_data, registry, args.workers)
 
         # Ülke bazlı analiz
         print("\n=== Ülkelere Göre Büyüme Analizi ===")
-        analyze_countries(netflix_data)
+        interval_rows += analyze_countries(netflix_data, registry, args.workers)
 
         # Rating bazlı analiz
         print("\n=== Derecelendirmelere Göre Büyüme Analizi ===")
-        analyze_ratings(netflix_data)
+        interval_rows += analyze_ratings(netflix_data, registry, args.workers)
+
+        # 2025 tahminleri ve tahmin aralıkları (makine tarafından okunabilir)
+        write_intervals(interval_rows, 'graphics/curve_fitting/content_type_forecast_intervals.csv')
+
+        registry.save()
+        print(f"\nModel kayıt defteri: {registry.refit_count} model yeniden uyduruldu, "
+              f"{registry.reused_count} model değişmediği için tekrar kullanıldı.")
 
         print("\nTüm analizler tamamlandı. Sonuçları 'graphics/curve_fitting' klasöründe bulabilirsiniz.")
 
@@ -1,24 +1,35 @@
+import argparse
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
-import seaborn as sns
 import os
 
-# Görsel stili ayarlama
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("muted")
-colors = sns.color_palette("muted", 10)
+from netflix_analysis.duplicates import dedupe_frame
+from netflix_analysis.growth_models import exp_func, linear_func, poly_func, r_squared
+from netflix_analysis.catalog import dataset_version
+from netflix_analysis.intervals import DEFAULT_LEVEL, format_interval, forecast_interval, write_intervals
+from netflix_analysis.model_registry import ModelRegistry
 
-# Grafiklerin kaydedileceği dizini kontrol etme ve oluşturma
-if not os.path.exists('graphics/curve_fitting'):
-    os.makedirs('graphics/curve_fitting')
+FIG_DIR = 'graphics/curve_fitting'
+
+
+# Görsel stili ayarlama ve grafik dizinini oluşturma; matplotlib yalnızca grafik çizilirken yüklenir
+def setup_plotting():
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("muted")
+    os.makedirs(FIG_DIR, exist_ok=True)
+    return plt, sns.color_palette("muted", 10)
 
 
 # Veri setini yükleme
-def load_data():
+def load_data(dedupe=False):
     try:
         netflix_data = pd.read_csv('data/netflix1.csv')
+        if dedupe:
+            # Farklı show_id'lerle tekrar listelenen içerikler bir kez sayılır
+            netflix_data = dedupe_frame(netflix_data)
         return netflix_data
     except FileNotFoundError:
         print(
@@ -26,23 +37,12 @@ def load_data():
         return None
 
 
-# İlk model: Lineer fonksiyon
-def linear_func(x, a, b):
-    return a * x + b
-
-
-# İkinci model: Polinom fonksiyon (2. derece)
-def poly_func(x, a, b, c):
-    return a * x ** 2 + b * x + c
-
-
-# Üçüncü model: Exponential fonksiyon
-def exp_func(x, a, b, c):
-    return a * np.exp(b * x) + c
-
-
 # Curve fitting uygulama ve sonuçları görselleştirme
-def apply_curve_fitting(data):
+def apply_curve_fitting(data, registry=None):
+    if registry is None:
+        registry = ModelRegistry(path=None)
+    plt, colors = setup_plotting()
+
     # Yıla göre içerik sayısını hesaplama
     data['release_year'] = pd.to_numeric(data['release_year'], errors='coerce')
     yearly_content = data.groupby('release_year').size().reset_index(name='content_count')
@@ -56,14 +56,18 @@ def apply_curve_fitting(data):
 
     # Eğrileri uydurma
     try:
+        # Seri değişmediyse parametreler kayıt defterinden gelir, değiştiyse yeniden uydurulur
         # Lineer model
-        popt_linear, pcov_linear = curve_fit(linear_func, x_data, y_data)
+        linear_entry = registry.fit('overall', 'linear', x_data, y_data)
+        popt_linear, pcov_linear = linear_entry.popt, linear_entry.pcov
 
         # Polinom model
-        popt_poly, pcov_poly = curve_fit(poly_func, x_data, y_data)
+        poly_entry = registry.fit('overall', 'poly', x_data, y_data)
+        popt_poly, pcov_poly = poly_entry.popt, poly_entry.pcov
 
         # Üstel model
-        popt_exp, pcov_exp = curve_fit(exp_func, x_data, y_data, p0=[1, 0.1, 1])  # Başlangıç değerleri
+        exp_entry = registry.fit('overall', 'exp', x_data, y_data)
+        popt_exp, pcov_exp = exp_entry.popt, exp_entry.pcov
 
         # Modellerin performansını değerlendirme
         x_line = np.linspace(min(x_data), max(x_data), 100)
@@ -72,11 +76,6 @@ def apply_curve_fitting(data):
         y_exp = exp_func(x_line, *popt_exp)
 
         # R-kare değerlerini hesaplama
-        def r_squared(y_true, y_pred):
-            ss_res = np.sum((y_true - y_pred) ** 2)
-            ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
-            return 1 - (ss_res / ss_tot)
-
         r2_linear = r_squared(y_data, linear_func(x_data, *popt_linear))
         r2_poly = r_squared(y_data, poly_func(x_data, *popt_poly))
         r2_exp = r_squared(y_data, exp_func(x_data, *popt_exp))
@@ -121,6 +120,12 @@ def apply_curve_fitting(data):
         plt.plot(future_years + 2000, future_poly, '--', color=colors[2], linewidth=2)
         plt.plot(future_years + 2000, future_exp, '--', color=colors[3], linewidth=2)
 
+        # Tahmin aralıkları (delta yöntemi, kayıt defterindeki pcov'dan)
+        entries = {'linear': linear_entry, 'poly': poly_entry, 'exp': exp_entry}
+        for color, (model, entry) in zip(colors[1:4], entries.items()):
+            _, lower, upper = forecast_interval(model, x_data, y_data, entry.popt, entry.pcov, future_years)
+            plt.fill_between(future_years + 2000, lower, upper, color=color, alpha=0.15)
+
         # Tahmin bölgesini belirtmek için dikey çizgi
         plt.axvline(x=max(x_data) + 2000, color='gray', linestyle='--', alpha=0.7)
 
@@ -155,7 +160,7 @@ def apply_curve_fitting(data):
 
                 try:
                     # Polinom modeli uygulama (en iyi performansı genelde bu gösteriyor)
-                    popt_type, _ = curve_fit(poly_func, x_type, y_type)
+                    popt_type = registry.fit(f'type/{content_type}', 'poly', x_type, y_type).popt
 
                     # Görselleştirme
                     x_smooth = np.linspace(min(x_type), max(x_type), 100)
@@ -190,30 +195,47 @@ def apply_curve_fitting(data):
         best_model = "Lineer" if best_r2 == r2_linear else "Polinom" if best_r2 == r2_poly else "Üstel"
         print(f"\nEn iyi model: {best_model} Model (R²={best_r2:.4f})")
 
-        # 2025 yılı için tahmin
-        year_2025 = 25  # 2025 - 2000 = 25
-        pred_2025_linear = linear_func(year_2025, *popt_linear)
-        pred_2025_poly = poly_func(year_2025, *popt_poly)
-        pred_2025_exp = exp_func(year_2025, *popt_exp)
+        # 2025 yılı için tahmin (kayıt defterindeki parametrelerden) ve tahmin aralıkları
+        pred_2025_linear = registry.forecast('overall', 'linear', 2025)
+        pred_2025_poly = registry.forecast('overall', 'poly', 2025)
+        pred_2025_exp = registry.forecast('overall', 'exp', 2025)
+
+        interval_rows = []
+        for model, entry in entries.items():
+            _, lower, upper = forecast_interval(model, x_data, y_data, entry.popt, entry.pcov, 25)
+            interval_rows.append({'series': 'overall', 'model': model, 'year': 2025,
+                                  'forecast': registry.forecast('overall', model, 2025), 'lower': lower,
+                                  'upper': upper, 'level': DEFAULT_LEVEL, 'interval': 'delta'})
+        intervals = {row['model']: format_interval(row['lower'], row['upper']) for row in interval_rows}
 
         print(f"\n2025 Yılı İçerik Sayısı Tahmini:")
-        print(f"Lineer Model: {int(pred_2025_linear)} içerik")
-        print(f"Polinom Model: {int(pred_2025_poly)} içerik")
-        print(f"Üstel Model: {int(pred_2025_exp)} içerik")
+        print(f"Lineer Model: {int(pred_2025_linear)} içerik ({intervals['linear']})")
+        print(f"Polinom Model: {int(pred_2025_poly)} içerik ({intervals['poly']})")
+        print(f"Üstel Model: {int(pred_2025_exp)} içerik ({intervals['exp']})")
+
+        write_intervals(interval_rows, 'graphics/curve_fitting/forecast_intervals.csv')
 
     except Exception as e:
         print(f"Curve fitting işlemi sırasında hata oluştu: {e}")
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Toplam içerik büyümesi için curve fitting")
+    parser.add_argument('--dedupe', action='store_true', help="tekrar listelenen içerikleri bir kez say")
+    args = parser.parse_args(argv)
+
     # Veri setini yükleme
-    netflix_data = load_data()
+    netflix_data = load_data(dedupe=args.dedupe)
 
     if netflix_data is not None:
         print("Netflix veri seti başarıyla yüklendi. Toplam kayıt sayısı:", len(netflix_data))
 
         # Curve fitting işlemini uygulama
-        apply_curve_fitting(netflix_data)
+        registry = ModelRegistry(data_version=dataset_version())
+        apply_curve_fitting(netflix_data, registry)
+        registry.save()
+        print(f"\nModel kayıt defteri: {registry.refit_count} model yeniden uyduruldu, "
+              f"{registry.reused_count} model değişmediği için tekrar kullanıldı.")
 
         print("\nCurve fitting analizleri tamamlandı. Sonuçları 'graphics/curve_fitting' klasöründe bulabilirsiniz.")
 
@@ -0,0 +1 @@
+"""Netflix veri seti analizleri için ortak yardımcılar."""
@@ -0,0 +1,5 @@
+import sys
+
+from netflix_analysis.cli import main
+
+sys.exit(main())
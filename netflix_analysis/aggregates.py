@@ -0,0 +1,367 @@
+import hashlib
+import io
+import json
+import os
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.catalog import (CACHE_DIR, DATA_PATH, DEDUPE_SUFFIX, MULTI_VALUE_COLUMNS, Bridge, load_catalog,
+                                      parse_catalog)
+from netflix_analysis.sketches import DEFAULT_QUANTILES, QuantileSketches
+
+AGGREGATES_PATH = os.path.join(CACHE_DIR, 'aggregates.json')
+
+# Toplam durumu biçimi değiştiğinde artırılır; eski durumlar yeniden oluşturulur
+STATE_FORMAT = 4
+
+# Tutulan toplamlar: ad -> (anahtar alanları, toplanan alan, satırın sayılması için dolu olması gereken alanlar).
+# Anahtarlardan biri boş olan satırlar (pandas groupby gibi) sayılmaz; toplanan alanı boş olanlar da.
+AGGREGATES = {
+    # Genel sayımlar ve anlık görüntü farkları
+    'year_added': (['year_added'], None, []),
+    'release_year': (['release_year'], None, []),
+    'type': (['type'], None, []),
+    'rating': (['rating'], None, []),
+    'rating_group': (['rating_group'], None, []),
+    'country': (['country'], None, []),
+    'category': (['category'], None, []),
+    'director': (['director'], None, []),
+    'country_type': (['country', 'type'], None, []),
+    'country_category': (['country', 'category'], None, []),
+    # years.py: hem eklenme hem yayın yılı bilinen içerikler
+    'dated_year_added': (['year_added'], None, ['release_year']),
+    'dated_release_year': (['release_year'], None, ['year_added']),
+    'dated_year_added_type': (['year_added', 'type'], None, ['release_year']),
+    'dated_release_year_type': (['release_year', 'type'], None, ['year_added']),
+    'delay_by_year_added': (['year_added'], 'years_delay', []),
+    # durations.py: eklenme yılı bilinen filmlerin süreleri ve dizilerin sezon sayıları
+    'minutes_by_year_added': (['year_added'], 'minutes', []),
+    'seasons_by_year_added': (['year_added'], 'seasons', []),
+    'minutes_by_category': (['category'], 'minutes', ['year_added']),
+    'seasons_by_category': (['category'], 'seasons', ['year_added']),
+    # netflix_rating_analysis.py
+    'rating_type': (['rating', 'type'], None, []),
+    'year_added_rating_group': (['year_added', 'rating_group'], None, []),
+    'country_rating_group': (['country', 'rating_group'], None, []),
+    'category_rating_group': (['category', 'rating_group'], None, []),
+}
+
+# Yeni ortaya çıkan / tamamen kaybolan değerleri raporlanan toplamlar
+TRACKED_VALUES = ['director', 'country']
+
+# Dosya özeti hesaplanırken bir seferde okunan bayt sayısı
+READ_BYTES = 1 << 20
+
+
+def _fields(df):
+    """Toplamların kullandığı tek değerli alanlar (satır konumu sırasıyla)"""
+    fields = pd.DataFrame({
+        'type': df['type'].values,
+        'rating': df['rating'].fillna('Belirtilmemiş').values,
+        'rating_group': df['rating_group'].values,
+        'year_added': df['year_added'].values,
+        'release_year': df['release_year'].values,
+        'minutes': df['minutes'].values,
+        'seasons': df['seasons'].values,
+    })
+    fields['years_delay'] = fields['year_added'] - fields['release_year']
+    return fields
+
+
+def _exploded_pairs(df, dimension):
+    """Çok değerli sütunun (satır konumu, değer) çiftleri; Bridge ile aynı ayırma kuralları"""
+    bridge = Bridge.from_column(df[MULTI_VALUE_COLUMNS[dimension]].reset_index(drop=True))
+    return pd.DataFrame({'_row': bridge.rows, dimension: bridge.values[bridge.codes]})
+
+
+def _python_key(key):
+    key = key if isinstance(key, tuple) else (key,)
+    return tuple(value.item() if isinstance(value, np.generic) else value for value in key)
+
+
+def frame_aggregates(df):
+    """Bir satır kümesinin her toplama katkısı: ad -> (sayılar, toplamlar) sayaçları"""
+    fields = _fields(df)
+    fields['_row'] = np.arange(len(fields))
+    exploded = {}
+
+    result = {}
+    for name, (keys, value, required) in AGGREGATES.items():
+        table = fields
+        for key in keys:
+            if key in MULTI_VALUE_COLUMNS:
+                if key not in exploded:
+                    exploded[key] = _exploded_pairs(df, key)
+                table = table.merge(exploded[key], on='_row')
+
+        needed = keys + list(required) + ([value] if value else [])
+        table = table.dropna(subset=needed)
+
+        counts = Counter()
+        sums = Counter()
+        if len(table):
+            grouped = table.groupby(keys)
+            for key, count in grouped.size().items():
+                counts[_python_key(key)] = int(count)
+            if value:
+                for key, total in grouped[value].sum().items():
+                    sums[_python_key(key)] = float(total)
+        result[name] = (counts, sums)
+    return result
+
+
+def _prefix_digest(f, end):
+    """Açık dosyanın ilk `end` baytının özeti; dosya konumu `end` baytında kalır"""
+    digest = hashlib.sha1()
+    f.seek(0)
+    remaining = end
+    while remaining > 0:
+        chunk = f.read(min(READ_BYTES, remaining))
+        if not chunk:
+            break
+        digest.update(chunk)
+        remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def source_info(path):
+    """CSV'nin ekleme kontrolü için gereken bilgileri: boyut, başlık satırı, dosyanın tamamının özeti"""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        header = f.readline().decode('utf-8')
+        digest = _prefix_digest(f, size)
+        f.seek(max(0, size - 1))
+        ends_with_newline = f.read(1) == b'\n'
+    return {
+        'path': os.path.abspath(path),
+        'size': size,
+        'header': header,
+        'digest': digest,
+        'ends_with_newline': ends_with_newline,
+    }
+
+
+def appended_bytes(path, source):
+    """CSV yalnızca sonuna satır eklenerek büyüdüyse yeni baytları, değilse None döndür.
+
+    Önceki boyuta kadar olan kısmın tamamı özetlenir; dosyanın herhangi bir yerinde yapılan düzenleme
+    (ardından ekleme yapılmış olsa bile) tam yeniden oluşturmaya yol açar.
+    """
+    if source is None or source.get('path') != os.path.abspath(path) or 'digest' not in source:
+        return None
+
+    size = os.path.getsize(path)
+    if size < source['size']:
+        return None
+    with open(path, 'rb') as f:
+        header = f.readline().decode('utf-8')
+        if header != source['header']:
+            return None
+        if _prefix_digest(f, source['size']) != source['digest']:
+            return None
+        new_bytes = f.read()
+    if new_bytes and not source['ends_with_newline'] and not new_bytes.startswith((b'\n', b'\r\n')):
+        # Önceki son satır yarımdı ve devam ettirilmiş; artımlı okuma güvenli değil
+        return None
+    return new_bytes
+
+
+class AggregateState:
+    """Katalog toplamlarının (sayılar, ortalamalar için toplamlar, çapraz tablolar) birleştirilebilir hali.
+
+    Her toplam, anahtar demeti -> satır sayısı ve (varsa) anahtar demeti -> değer toplamı sayaçlarıdır.
+    İki durum toplanarak birleştirilir; bu yüzden yeni satırların (veya bir anlık görüntü farkının)
+    katkısı eklenip çıkarılarak durum, tüm katalog yeniden işlenmeden güncellenir.
+
+    Süre, sezon ve gecikme dağılımları için kantil özetleri (`sketches`) de tutulur. Özetlere satır eklenebilir
+    ama satır çıkarılamaz; çıkarma yapıldığında özetler None olur ve tüm satırlardan yeniden kurulmalıdır.
+    """
+
+    def __init__(self, counts=None, sums=None, date=None, source=None, rows=0, sketches=None):
+        self.counts = {name: Counter() for name in AGGREGATES}
+        self.sums = {name: Counter() for name in AGGREGATES}
+        for target, given in ((self.counts, counts), (self.sums, sums)):
+            for name, counter in (given or {}).items():
+                target[name].update(counter)
+        self.date = date
+        self.source = source
+        self.rows = rows
+        self.sketches = sketches
+
+    @classmethod
+    def from_frame(cls, df, date=None, source=None):
+        state = cls(date=date, source=source, sketches=QuantileSketches())
+        state.add_frame(df)
+        return state
+
+    def add_frame(self, df, sign=1):
+        """Ayrıştırılmış satırların katkısını ekle (sign=-1 ile çıkar); değişen anahtarları döndür"""
+        changed = {}
+        for name, (counts, sums) in frame_aggregates(df).items():
+            changed[name] = self._add(name, counts, sums, sign)
+        if sign < 0:
+            self.sketches = None
+        elif self.sketches is not None:
+            self.sketches.add_frame(df)
+        self.rows += sign * len(df)
+        return changed
+
+    def merge(self, other):
+        """Başka bir durumun (ör. ayrı işlenmiş bir veri parçasının) toplamlarını ekle"""
+        for name in AGGREGATES:
+            self._add(name, other.counts[name], other.sums[name], 1)
+        if self.sketches is not None and other.sketches is not None:
+            self.sketches.merge(other.sketches)
+        else:
+            self.sketches = None
+        self.rows += other.rows
+
+    def _add(self, name, counts, sums, sign):
+        totals = self.counts[name]
+        total_sums = self.sums[name]
+        changed = {}
+        for key, count in counts.items():
+            before = totals.get(key, 0)
+            after = before + sign * count
+            if after > 0:
+                totals[key] = after
+                if key in sums:
+                    total_sums[key] = total_sums.get(key, 0.0) + sign * sums[key]
+            else:
+                totals.pop(key, None)
+                total_sums.pop(key, None)
+            changed[key] = (before, after)
+        return changed
+
+    def apply(self, delta):
+        """Anlık görüntü farkını uygula; yeni ortaya çıkan ve kaybolan değerleri döndür"""
+        before = {name: dict(self.counts[name]) for name in TRACKED_VALUES}
+        for frame, sign in ((delta.removed, -1), (delta.changed_old, -1), (delta.added, 1), (delta.changed_new, 1)):
+            if len(frame):
+                self.add_frame(frame, sign)
+
+        changes = {'appeared': {}, 'disappeared': {}}
+        for name in TRACKED_VALUES:
+            old_keys = set(before[name])
+            new_keys = set(self.counts[name])
+            changes['appeared'][name] = sorted(key[0] for key in new_keys - old_keys)
+            changes['disappeared'][name] = sorted(key[0] for key in old_keys - new_keys)
+        self.date = delta.new_date
+        return changes
+
+    def series(self, name):
+        """Sayıları anahtara göre sıralı pd.Series olarak döndür (çok anahtarlıysa MultiIndex)"""
+        return self._series(name, self.counts[name], 'int64')
+
+    def means(self, name):
+        """Toplanan alanın anahtar bazında ortalaması"""
+        counts = self.counts[name]
+        sums = self.sums[name]
+        means = {key: sums[key] / counts[key] for key in counts if key in sums}
+        return self._series(name, means, 'float64')
+
+    def quantiles(self, metric, q=DEFAULT_QUANTILES, by=('year_added',), **filters):
+        """Kantil özetlerinden yüzdelikler (bkz. QuantileSketches.quantiles)"""
+        if self.sketches is None:
+            raise ValueError("kantil özetleri yok; durum tüm satırlardan yeniden oluşturulmalı")
+        return self.sketches.quantiles(metric, q, by, **filters)
+
+    def table(self, name):
+        """İki anahtarlı toplamın çapraz tablosu (satırlar ilk anahtar, sütunlar ikinci)"""
+        return self.series(name).unstack(fill_value=0)
+
+    def top(self, name, n=None):
+        """Sayıya göre azalan (eşitlikte anahtara göre) sıralı sayılar"""
+        # Seri anahtara göre sıralı olduğundan kararlı sıralama eşitlikleri alfabetik bırakır
+        counts = self.series(name).sort_values(ascending=False, kind='stable')
+        return counts if n is None else counts.head(n)
+
+    def _series(self, name, values, dtype):
+        keys = AGGREGATES[name][0]
+        items = sorted(values.items())
+        if len(keys) == 1:
+            index = pd.Index([key[0] for key, _ in items], name=keys[0])
+        else:
+            index = pd.MultiIndex.from_tuples([key for key, _ in items], names=keys)
+        return pd.Series([value for _, value in items], index=index, dtype=dtype)
+
+    def to_dict(self):
+        aggregates = {}
+        for name in AGGREGATES:
+            sums = self.sums[name]
+            aggregates[name] = [[*key, count, sums[key]] if key in sums else [*key, count]
+                                for key, count in sorted(self.counts[name].items())]
+        return {'format': STATE_FORMAT, 'date': self.date, 'source': self.source, 'rows': self.rows,
+                'aggregates': aggregates,
+                'sketches': self.sketches.to_list() if self.sketches is not None else None}
+
+    @classmethod
+    def from_dict(cls, d):
+        if d.get('format') != STATE_FORMAT:
+            raise ValueError("eski toplam durumu biçimi")
+        counts, sums = {}, {}
+        for name, items in d['aggregates'].items():
+            if name not in AGGREGATES:
+                continue
+            width = len(AGGREGATES[name][0])
+            counts[name] = Counter()
+            sums[name] = Counter()
+            for item in items:
+                key = tuple(item[:width])
+                counts[name][key] = item[width]
+                if len(item) > width + 1:
+                    sums[name][key] = item[width + 1]
+        sketches = QuantileSketches.from_list(d['sketches']) if d.get('sketches') is not None else None
+        return cls(counts, sums, date=d.get('date'), source=d.get('source'), rows=d.get('rows', 0),
+                   sketches=sketches)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Kaydedilmiş durumu oku; dosya yoksa, bozuksa veya eski biçimdeyse None"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def load_aggregates(path=DATA_PATH, state_path=AGGREGATES_PATH, dedupe=False):
+    """CSV'nin toplam durumunu getir; dosyanın sonuna satır eklendiyse yalnızca yeni satırlar işlenir.
+
+    Dosya başka bir şekilde değiştiyse (satır silme, düzenleme) durum baştan oluşturulur. `dedupe` verilirse
+    tekrar listelenen içerikler bir kez sayılır; durum ayrı bir dosyada tutulur ve yeni satırlar eski
+    satırların tekrarı olabileceğinden CSV her değiştiğinde baştan oluşturulur.
+    """
+    if dedupe and state_path:
+        root, extension = os.path.splitext(state_path)
+        state_path = f'{root}{DEDUPE_SUFFIX}{extension}'
+    state = AggregateState.load(state_path) if state_path else None
+    source = state.source if state is not None else None
+
+    new_bytes = appended_bytes(path, source)
+    if new_bytes is None or state.sketches is None or (dedupe and new_bytes.strip()):
+        if dedupe:
+            df = load_catalog(path, dedupe=True).df
+        else:
+            df = parse_catalog(pd.read_csv(path))
+        state = AggregateState.from_frame(df, source=source_info(path))
+    elif new_bytes.strip():
+        header = source['header'].encode('utf-8')
+        new_rows = pd.read_csv(io.BytesIO(header + new_bytes.lstrip(b'\r\n')))
+        state.add_frame(parse_catalog(new_rows))
+        state.source = source_info(path)
+    else:
+        return state
+
+    if state_path:
+        state.save(state_path)
+    return state
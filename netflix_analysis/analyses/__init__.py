@@ -0,0 +1 @@
+"""Katalog nesnesi alıp sonuç döndüren, grafik çizmeyen analiz fonksiyonları."""
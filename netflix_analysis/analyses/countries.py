@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.dimensions import is_unknown_country
+
+# Ülke bazlı kategori analizinde hariç tutulan genel kategoriler
+EXCLUDED_TOP_CATEGORIES = ["International Movies", "International TV Shows"]
+EXCLUDED_COUNTRY_CATEGORIES = ['international movies', 'international tv shows', 'not given', 'british tv shows']
+
+
+def country_list(catalog):
+    """Veri setinde geçen tüm ülkeler (alfabetik)"""
+    return catalog.countries().names.tolist()
+
+
+def _known_countries(catalog, columns=(), codes=None):
+    """Ülkesi belirtilmiş (yer tutucu olmayan) satırların patlatılmış hali; seçim ülke kodlarıyla yapılır"""
+    known = catalog.countries().codes_for(known=True)
+    if codes is not None:
+        known = np.intersect1d(known, codes)
+    return catalog.exploded('country', columns, codes=known)
+
+
+def _is_known_country(values):
+    """Yer tutucu ("Not Given") olmayan ülke adları için boolean dizi (toplam durumundaki anahtarlar için)"""
+    return np.array([not is_unknown_country(value) for value in values], dtype=bool)
+
+
+def analyze_countries(catalog):
+    """İçerik türü dağılımı, ülke bazlı içerik sayıları ve kategoriler"""
+    df = catalog.df
+
+    # Film ve TV Show dağılımı
+    type_counts = df['type'].value_counts()
+
+    # Ülke bazlı içerik dağılımı ("Not Given" hariç)
+    country_expanded = _known_countries(catalog, ['type'])
+    country_type_counts = country_expanded.groupby(['country', 'type']).size().unstack(fill_value=0)
+    top_10_countries = country_type_counts.sum(axis=1).sort_values(ascending=False).head(10)
+    top_data = country_type_counts.loc[top_10_countries.index]
+
+    top_10_movies = country_type_counts['Movie'].sort_values(ascending=False).head(10)
+    top_10_shows = country_type_counts['TV Show'].sort_values(ascending=False).head(10)
+
+    # Kategori bazlı analiz ("International Movies" ve "International TV Shows" hariç)
+    category_expanded = catalog.exploded('category')['category']
+    category_expanded = category_expanded[~category_expanded.isin(EXCLUDED_TOP_CATEGORIES)]
+    top_10_categories = category_expanded.value_counts().head(10)
+
+    return {
+        'type_counts': type_counts,
+        'country_type_counts': country_type_counts,
+        'top_10_countries': top_10_countries,
+        'top_data': top_data,
+        'top_10_movies': top_10_movies,
+        'top_10_shows': top_10_shows,
+        'top_10_categories': top_10_categories,
+        'top_category_per_country': top_category_per_country(catalog, top_10_countries.index),
+    }
+
+
+def top_category_per_country(catalog, countries):
+    """Verilen ülkelerin her birinde en çok içerik sağlanan kategori (genel kategoriler hariç)"""
+    country_rows = _known_countries(catalog, codes=catalog.countries().codes_for(names=countries))
+
+    categories = catalog.exploded('category')
+    categories = categories[~categories['category'].str.lower().isin(EXCLUDED_COUNTRY_CATEGORIES)]
+
+    pairs = country_rows.join(categories, how='inner')
+    return _top_category_rows(pairs.groupby(['country', 'category']).size(), countries)
+
+
+def _top_category_rows(pair_counts, countries):
+    """(ülke, kategori) sayılarından her ülkenin en çok içerikli kategorisi, verilen ülke sırasıyla"""
+    result = (
+        pair_counts
+        .reset_index(name='count')
+        .sort_values(['country', 'count'], ascending=[True, False])
+        .drop_duplicates('country')
+    )
+
+    result['country'] = pd.Categorical(result['country'], categories=countries, ordered=True)
+    return result.sort_values('country')
+
+
+def countries_from_state(state):
+    """analyze_countries ile aynı sonuçlar; katalog yerine birleştirilebilir toplam durumundan"""
+    type_counts = state.top('type').rename('count')
+
+    country_type = state.series('country_type')
+    country_type = country_type[_is_known_country(country_type.index.get_level_values('country'))]
+    country_type_counts = country_type.unstack(fill_value=0)
+    top_10_countries = country_type_counts.sum(axis=1).sort_values(ascending=False).head(10)
+    top_data = country_type_counts.loc[top_10_countries.index]
+
+    top_10_movies = country_type_counts['Movie'].sort_values(ascending=False).head(10)
+    top_10_shows = country_type_counts['TV Show'].sort_values(ascending=False).head(10)
+
+    category_counts = state.top('category').rename('count')
+    top_10_categories = category_counts[~category_counts.index.isin(EXCLUDED_TOP_CATEGORIES)].head(10)
+
+    pair_counts = state.series('country_category')
+    countries = pair_counts.index.get_level_values('country')
+    categories = pair_counts.index.get_level_values('category')
+    pair_counts = pair_counts[countries.isin(top_10_countries.index)
+                              & ~categories.str.lower().isin(EXCLUDED_COUNTRY_CATEGORIES)]
+
+    return {
+        'type_counts': type_counts,
+        'country_type_counts': country_type_counts,
+        'top_10_countries': top_10_countries,
+        'top_data': top_data,
+        'top_10_movies': top_10_movies,
+        'top_10_shows': top_10_shows,
+        'top_10_categories': top_10_categories,
+        'top_category_per_country': _top_category_rows(pair_counts, top_10_countries.index),
+    }
@@ -0,0 +1,111 @@
+from collections import Counter
+
+import numpy as np
+
+import pandas as pd
+
+from netflix_analysis.catalog import RATING_GROUP_ORDER, pair_counts
+from netflix_analysis.parallel import map_groups
+
+
+def analyze_directors(catalog, workers=None):
+    """Direktörlerin içerik sayıları, tür/kategori/ülke/rating dağılımları"""
+    director_exploded = catalog.exploded('director', ['show_id', 'type', 'rating_group'])
+
+    # En çok içeriğe sahip direktörler
+    top_directors = director_exploded['director'].value_counts().head(15)
+    top10_directors = top_directors.head(10).index
+    top5_directors = top_directors.head(5).index
+
+    return {
+        'director_count': director_exploded['director'].nunique(),
+        'top_directors': top_directors,
+        'director_type_matrix': director_type_matrix(director_exploded, top10_directors),
+        'director_categories': director_categories(catalog, top5_directors, workers=workers),
+        'country_top_directors': country_top_directors(catalog, workers=workers),
+        'director_rating_matrix': director_rating_matrix(director_exploded, top5_directors),
+        'directors_text': ' '.join(director_exploded['director'].tolist()),
+    }
+
+
+def _sort_by_total(matrix):
+    """Satırları toplam içerik sayısına göre azalan sırala"""
+    matrix = matrix.copy()
+    matrix['Total'] = matrix.sum(axis=1)
+    matrix = matrix.sort_values('Total', ascending=False)
+    return matrix.drop('Total', axis=1)
+
+
+def director_type_matrix(director_exploded, directors):
+    """Direktör x tür (Film/Dizi) matrisi"""
+    director_type_df = director_exploded[director_exploded['director'].isin(directors)]
+    return _sort_by_total(pair_counts(director_type_df, 'director', 'type'))
+
+
+def _bridge_arrays(catalog, dimension):
+    bridge = catalog.bridge(dimension)
+    return {f'{dimension}_rows': bridge.rows, f'{dimension}_codes': bridge.codes}
+
+
+def _director_category_counts(arrays, group):
+    """Bir direktörün içeriklerindeki kategori kodlarının sayımı (işçi süreçlerinde çalışır)"""
+    director, n = group
+    rows = np.unique(arrays['director_rows'][arrays['director_codes'] == director])
+    # Kategoriler köprü tablosundaki sırayla (satır, satır içi yazım sırası) sayılır; eşitlikte ilk görülen önce
+    categories = arrays['category_codes'][np.isin(arrays['category_rows'], rows)]
+    return Counter(categories.tolist()).most_common(n)
+
+
+def director_categories(catalog, directors, n=5, workers=None):
+    """Her direktörün en çok çalıştığı `n` kategori"""
+    director_bridge = catalog.bridge('director')
+    categories = catalog.bridge('category').values
+    arrays = {**_bridge_arrays(catalog, 'director'), **_bridge_arrays(catalog, 'category')}
+    counts = map_groups(_director_category_counts, [(director_bridge.code_of(d), n) for d in directors],
+                        arrays, workers)
+    return {director: {str(categories[code]): count for code, count in director_counts}
+            for director, director_counts in zip(directors, counts)}
+
+
+def _country_director_counts(arrays, group):
+    """Bir ülkenin (ülke, direktör) çiftlerinde direktör kodlarının sayımı (işçi süreçlerinde çalışır)"""
+    country, n = group
+    # Ülkenin her köprü kaydı satırdaki tüm direktörlerle eşleşir (iç birleştirme ile aynı çokluk)
+    country_rows = arrays['country_rows'][arrays['country_codes'] == country]
+    director_rows, director_codes = arrays['director_rows'], arrays['director_codes']
+    start = np.searchsorted(director_rows, country_rows, side='left')
+    end = np.searchsorted(director_rows, country_rows, side='right')
+    if not (end - start).sum():
+        return [], []
+    positions = np.concatenate([np.arange(a, b) for a, b in zip(start.tolist(), end.tolist())])
+    codes, first, counts = np.unique(director_codes[positions], return_index=True, return_counts=True)
+    # Sayıya göre azalan; eşitlikte ilk görülen önce (value_counts ile aynı sıra)
+    order = np.lexsort((first, -counts))[:n]
+    return codes[order].tolist(), counts[order].tolist()
+
+
+def country_top_directors(catalog, n_countries=5, n_directors=5, workers=None):
+    """En çok içerik üreten ülkelerin en popüler direktörleri"""
+    # Ülkeler (ülke, direktör) çifti sayısına göre kodlarıyla sıralanır; yalnızca seçilenler patlatılır
+    country_bridge = catalog.bridge('country')
+    directors_per_row = np.bincount(catalog.bridge('director').rows, minlength=len(catalog))
+    country_pairs = np.bincount(country_bridge.codes, weights=directors_per_row[country_bridge.rows],
+                              minlength=len(country_bridge.values))
+    top_countries = np.argsort(-country_pairs, kind='stable')[:n_countries]
+
+    director_values = catalog.bridge('director').values
+    arrays = {**_bridge_arrays(catalog, 'country'), **_bridge_arrays(catalog, 'director')}
+    counts = map_groups(_country_director_counts, [(code, n_directors) for code in top_countries.tolist()],
+                        arrays, workers)
+    result = {}
+    for country, (codes, director_counts) in zip(country_bridge.values[top_countries].tolist(), counts):
+        index = pd.Index(director_values[codes].tolist() if codes else [], dtype='str', name='director')
+        result[country] = pd.Series(director_counts, index=index, name='count', dtype='int64')
+    return result
+
+
+def director_rating_matrix(director_exploded, directors):
+    """Direktör x rating grubu matrisi"""
+    director_rating_df = director_exploded[director_exploded['director'].isin(directors)]
+    matrix = _sort_by_total(pair_counts(director_rating_df, 'director', 'rating_group'))
+    return matrix.reindex(columns=[col for col in RATING_GROUP_ORDER if col in matrix.columns])
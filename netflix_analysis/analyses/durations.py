@@ -0,0 +1,53 @@
+from netflix_analysis.sketches import QuantileSketches
+from netflix_analysis.trends import TrendTable
+
+
+def _category_means(catalog, values, mask, name):
+    """Kategoriye göre ortalama (azalan): köprü tablosunda gruplu toplam, patlatılmış kopya yok"""
+    means = catalog.bridge('category').means(values, mask)
+    means.index.name = 'category'
+    return means.rename(name).sort_values(ascending=False)
+
+
+def analyze_durations(catalog):
+    """Film süreleri ve dizi sezon sayıları: yıllara ve kategorilere göre ortalamalar"""
+    df = catalog.df
+    # Tüm seçimler tek ayrıştırılmış tablo üzerinde boolean maskelerle yapılır (alt tablo kopyası yok)
+    dated = df['duration'].notna().values & df['year_added'].notna().values
+    types = df['type'].values
+    minutes = df['minutes'].values
+    seasons = df['seasons'].values
+
+    # Yıla göre ortalama süre / sezon sayısı: iki tür tek tabloda, tek sıralı geçişte
+    trends = TrendTable.build(df['year_added'].values[dated], types[dated],
+                              {'minutes': minutes[dated], 'seasons': seasons[dated]}, 'year_added', 'type')
+    movie_avg = trends.means('minutes', group='Movie').rename('minutes')
+    tv_avg = trends.means('seasons', group='TV Show').rename('seasons')
+
+    # Kategoriye göre ortalama süre / sezon sayısı (birden fazla kategori olabilir)
+    avg_duration_by_category = _category_means(catalog, minutes, dated & (types == 'Movie'), 'minutes')
+    avg_season_by_category = _category_means(catalog, seasons, dated & (types == 'TV Show'), 'seasons')
+
+    # Yıla göre medyan ve p90 (kantil özetlerinden)
+    sketches = QuantileSketches.from_frame(catalog.df)
+
+    return {
+        'movie_avg': movie_avg,
+        'tv_avg': tv_avg,
+        'avg_duration_by_category': avg_duration_by_category,
+        'avg_season_by_category': avg_season_by_category,
+        'movie_quantiles': sketches.quantiles('minutes', type='Movie'),
+        'tv_quantiles': sketches.quantiles('seasons', type='TV Show'),
+    }
+
+
+def durations_from_state(state):
+    """analyze_durations ile aynı sonuçlar; katalog yerine birleştirilebilir toplam durumundan"""
+    return {
+        'movie_avg': state.means('minutes_by_year_added').rename('minutes'),
+        'tv_avg': state.means('seasons_by_year_added').rename('seasons'),
+        'avg_duration_by_category': state.means('minutes_by_category').sort_values(ascending=False).rename('minutes'),
+        'avg_season_by_category': state.means('seasons_by_category').sort_values(ascending=False).rename('seasons'),
+        'movie_quantiles': state.quantiles('minutes', type='Movie'),
+        'tv_quantiles': state.quantiles('seasons', type='TV Show'),
+    }
@@ -0,0 +1,78 @@
+from netflix_analysis.catalog import pair_counts
+from netflix_analysis.trends import TrendTable
+
+
+def analyze_ratings(catalog):
+    """Rating dağılımı, rating grupları ve tür/yıl/ülke/kategori ilişkileri"""
+    df = catalog.df.copy()
+
+    # NaN değerlerini "Belirtilmemiş" olarak işaretleyelim
+    df['rating'] = df['rating'].fillna('Belirtilmemiş')
+    rating_counts = df['rating'].value_counts().sort_values(ascending=False)
+    rating_group_counts = df['rating_group'].value_counts()
+
+    # Rating ve içerik türü ilişkisi (en çok kullanılan 10 rating)
+    rating_type = df.groupby(['rating', 'type']).size().unstack(fill_value=0)
+    rating_type_filtered = rating_type.loc[rating_counts.head(10).index]
+
+    # Yıla ve en popüler 4 rating grubuna göre içerik sayısı (2008 sonrası)
+    popular_rating_groups = rating_group_counts.head(4).index
+    year_rating_df = df.dropna(subset=['year_added', 'rating_group'])
+    year_rating_filtered = year_rating_df[year_rating_df['rating_group'].isin(popular_rating_groups)]
+    rating_trend = TrendTable.from_frame(year_rating_filtered, 'year_added', by='rating_group').counts()
+    rating_trend = rating_trend[rating_trend.index >= 2008]
+
+    # Ülke-Rating matrisi (en çok içeriğe sahip 5 ülke); ülkeler kodlarıyla sayılıp seçilir
+    top_countries = catalog.bridge('country').top_codes(5)
+    country_rating_df = catalog.exploded('country', ['rating_group'], codes=top_countries)
+    country_rating_matrix = pair_counts(country_rating_df, 'country', 'rating_group')
+    country_rating_matrix = country_rating_matrix[popular_rating_groups]
+
+    # Kategori-Rating matrisi (en popüler 8 kategori)
+    category_exploded = catalog.exploded('category', ['rating_group']).dropna(subset=['rating_group'])
+    top_categories = category_exploded['category'].value_counts().head(8).index
+    category_rating_df = category_exploded[category_exploded['category'].isin(top_categories)]
+    category_rating_matrix = pair_counts(category_rating_df, 'category', 'rating_group')
+    category_rating_matrix = category_rating_matrix[popular_rating_groups]
+
+    return {
+        'rating_counts': rating_counts,
+        'rating_group_counts': rating_group_counts,
+        'rating_type_filtered': rating_type_filtered,
+        'popular_rating_groups': popular_rating_groups,
+        'rating_trend': rating_trend,
+        'country_rating_matrix': country_rating_matrix,
+        'category_rating_matrix': category_rating_matrix,
+    }
+
+
+def ratings_from_state(state):
+    """analyze_ratings ile aynı sonuçlar; katalog yerine birleştirilebilir toplam durumundan"""
+    rating_counts = state.top('rating').rename('count')
+    rating_group_counts = state.top('rating_group').rename('count')
+
+    rating_type = state.table('rating_type')
+    rating_type_filtered = rating_type.loc[rating_counts.head(10).index]
+
+    popular_rating_groups = rating_group_counts.head(4).index
+    year_rating = state.series('year_added_rating_group')
+    year_rating = year_rating[year_rating.index.get_level_values('rating_group').isin(popular_rating_groups)]
+    # TrendTable grupları sıralı tutar; sütunlar analyze_ratings ile aynı sırada olmalı
+    rating_trend = year_rating.unstack(fill_value=0).reindex(columns=sorted(popular_rating_groups), fill_value=0)
+    rating_trend = rating_trend[rating_trend.index >= 2008]
+
+    def top_matrix(name, dimension, n):
+        top_values = state.top(dimension, n).index
+        counts = state.series(name)
+        counts = counts[counts.index.get_level_values(dimension).isin(top_values)]
+        return counts.unstack(fill_value=0)[popular_rating_groups]
+
+    return {
+        'rating_counts': rating_counts,
+        'rating_group_counts': rating_group_counts,
+        'rating_type_filtered': rating_type_filtered,
+        'popular_rating_groups': popular_rating_groups,
+        'rating_trend': rating_trend,
+        'country_rating_matrix': top_matrix('country_rating_group', 'country', 5),
+        'category_rating_matrix': top_matrix('category_rating_group', 'category', 8),
+    }
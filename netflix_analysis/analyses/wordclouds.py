@@ -0,0 +1,23 @@
+import numpy as np
+
+
+def category_title_frequencies(catalog, content_type='Movie'):
+    """Her kategori için başlıklardaki kelime sıklıkları (kategori görülme sırasıyla).
+
+    Kelimeler başlık arama indeksinden okunur; başlıklar her kategori için yeniden bölünmez.
+    """
+    df = catalog.df
+    selected = ((df['type'] == content_type) & df['title'].notna()).values
+    titles = catalog.titles()
+
+    bridge = catalog.bridge('category')
+    keep = selected[bridge.rows]
+    rows, codes = bridge.rows[keep], bridge.codes[keep]
+
+    frequencies = {}
+    _, first = np.unique(codes, return_index=True)
+    for code in codes[np.sort(first)]:
+        counts = titles.token_counts(rows[codes == code])
+        if counts:
+            frequencies[bridge.values[code]] = counts
+    return frequencies
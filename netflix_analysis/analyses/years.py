@@ -0,0 +1,62 @@
+from netflix_analysis.sketches import QuantileSketches
+from netflix_analysis.trends import TrendTable
+
+
+def _empty_cells_as_nan(counts):
+    """groupby().size().unstack() gibi: boş hücre varsa tüm tablo float ve boş hücreler NaN"""
+    if (counts.values == 0).any():
+        return counts.astype(float).where(counts > 0)
+    return counts
+
+
+def analyze_years(catalog):
+    """Eklenme ve yayın yıllarına göre içerik sayıları ve eklenme gecikmesi"""
+    df = catalog.df.dropna(subset=['release_year', 'year_added'])
+    years_delay = (df['year_added'] - df['release_year']).values
+
+    # Her yıl ekseni için tek sıralı geçiş: türe göre sayılar ve gecikme toplamları birlikte çıkar
+    added = TrendTable.build(df['year_added'].values, df['type'].values, {'delay': years_delay},
+                             'year_added', 'type')
+    released = TrendTable.build(df['release_year'].values.astype(int), df['type'].values,
+                                year_field='release_year', group_field='type')
+
+    added_counts = added.counts(total=True).rename('count')
+
+    # 2000 sonrası içeriklerin piyasaya çıkış yılına göre sayısı
+    release_counts = released.counts(total=True).rename('count')
+    release_counts = release_counts[release_counts.index >= 2000]
+
+    # Netflix'e eklenme / piyasaya çıkış yılına göre içerik sayısı - Film vs Dizi ayrımı (boş hücreler NaN)
+    added_counts_by_type = _empty_cells_as_nan(added.counts())
+    release_counts_by_type = _empty_cells_as_nan(released.counts())
+
+    # Eklenme yılı ile yayın yılı arasındaki farkın yıllara göre ortalaması
+    delay_by_added_year = added.means('delay', total=True)
+    delay_quantiles = QuantileSketches.from_frame(catalog.df).quantiles('years_delay')
+
+    return {
+        'added_counts': added_counts,
+        'release_counts': release_counts,
+        'added_counts_by_type': added_counts_by_type,
+        'release_counts_by_type': release_counts_by_type,
+        'delay_by_added_year': delay_by_added_year,
+        'delay_quantiles': delay_quantiles,
+    }
+
+
+def years_from_state(state):
+    """analyze_years ile aynı sonuçlar; katalog yerine birleştirilebilir toplam durumundan"""
+    release_counts = state.series('dated_release_year').rename('count')
+    release_counts.index = release_counts.index.astype(int)
+
+    release_counts_by_type = state.series('dated_release_year_type').unstack()
+    release_counts_by_type.index = release_counts_by_type.index.astype(int)
+
+    return {
+        'added_counts': state.series('dated_year_added').rename('count'),
+        'release_counts': release_counts[release_counts.index >= 2000],
+        'added_counts_by_type': state.series('dated_year_added_type').unstack(),
+        'release_counts_by_type': release_counts_by_type,
+        'delay_by_added_year': state.means('delay_by_year_added'),
+        'delay_quantiles': state.quantiles('years_delay'),
+    }
@@ -0,0 +1,147 @@
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.growth_models import (
+    CLOSED_FORM_DEGREES,
+    MODEL_LABELS,
+    design_matrix,
+    fit_model,
+    predict,
+)
+
+BACKTEST_MODELS = ['linear', 'poly', 'exp']
+
+
+def rolling_origins(n, min_train):
+    """Rolling-origin bölmeleri: her başlangıç noktasında ilk `origin` gözlem eğitim kümesidir"""
+    return list(range(min_train, n))
+
+
+def _horizon_pairs(x, origin, max_horizon):
+    """Eğitim kümesinin son yılından en fazla `max_horizon` yıl sonraki test indeksleri"""
+    last_train_year = x[origin - 1]
+    for j in range(origin, len(x)):
+        horizon = int(round(x[j] - last_train_year))
+        if horizon > max_horizon:
+            break
+        yield j, horizon
+
+
+def _closed_form_rolling_fits(name, x, y, origins):
+    """Tüm başlangıç noktalarının katsayılarını tek seferde çöz.
+
+    Normal denklemler (X^T X, X^T y) kümülatif toplamlarla biriktirilir; böylece
+    her bölme için ayrı uydurma yapmak yerine tek bir toplu çözüm yeterli olur.
+    """
+    X = design_matrix(name, x)
+    xtx = np.cumsum(X[:, :, None] * X[:, None, :], axis=0)
+    xty = np.cumsum(X * y[:, None], axis=0)
+
+    idx = np.asarray(origins) - 1
+    return np.einsum('kij,kj->ki', np.linalg.pinv(xtx[idx]), xty[idx])
+
+
+def _iterative_rolling_fits(name, x, y, origins):
+    """Doğrusal olmayan modelleri her bölmede uydur; bir önceki bölmenin parametreleriyle başla"""
+    fits = []
+    p0 = None
+    for origin in origins:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                popt, _ = fit_model(name, x[:origin], y[:origin], p0=p0)
+            if not np.all(np.isfinite(popt)):
+                raise RuntimeError("sonlu olmayan parametreler")
+            p0 = popt
+        except (RuntimeError, ValueError, TypeError):
+            popt = None
+            p0 = None
+        fits.append(popt)
+    return fits
+
+
+def backtest_series(series_name, x, y, models=BACKTEST_MODELS, min_train=8, max_horizon=5):
+    """Tek bir seri için rolling-origin hatalarını hesapla"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    origins = rolling_origins(len(x), min_train)
+
+    records = []
+    if not origins:
+        return records
+
+    for model in models:
+        if model in CLOSED_FORM_DEGREES:
+            fits = _closed_form_rolling_fits(model, x, y, origins)
+        else:
+            fits = _iterative_rolling_fits(model, x, y, origins)
+
+        for origin, popt in zip(origins, fits):
+            for j, horizon in _horizon_pairs(x, origin, max_horizon):
+                if popt is None:
+                    records.append((series_name, model, horizon, y[j], np.nan))
+                else:
+                    records.append((series_name, model, horizon, y[j], float(predict(model, x[j], popt))))
+
+    return records
+
+
+def _backtest_task(args):
+    return backtest_series(*args)
+
+
+def run_backtest(series, models=BACKTEST_MODELS, min_train=8, max_horizon=5, workers=None):
+    """Tüm serileri bir işçi havuzunda değerlendir, tahmin-gerçek kayıtlarını döndür"""
+    tasks = [(name, x, y, models, min_train, max_horizon) for name, (x, y) in series.items()]
+
+    if workers is None:
+        workers = min(len(tasks), os.cpu_count() or 1)
+
+    if workers <= 1:
+        results = [_backtest_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_backtest_task, tasks))
+
+    records = [record for result in results for record in result]
+    return pd.DataFrame(records, columns=['series', 'model', 'horizon', 'actual', 'predicted'])
+
+
+def summarize_backtest(results):
+    """Model ve ufuk bazında MAE / MAPE özeti"""
+    results = results.copy()
+    results['abs_error'] = (results['predicted'] - results['actual']).abs()
+    nonzero = results['actual'] != 0
+    results['ape'] = np.where(nonzero, results['abs_error'] / results['actual'].abs().where(nonzero), np.nan)
+
+    summary = results.groupby(['model', 'horizon']).agg(
+        mae=('abs_error', 'mean'),
+        mape=('ape', 'mean'),
+        n_forecasts=('abs_error', 'count'),
+        n_failed=('predicted', lambda p: int(p.isna().sum())),
+    )
+    summary['mape'] = summary['mape'] * 100
+    return summary.reset_index()
+
+
+def print_summary(summary):
+    print("\n=== Rolling-Origin Backtest Sonuçları ===")
+    present = set(summary['model'])
+    models = [m for m in BACKTEST_MODELS if m in present] + sorted(present - set(BACKTEST_MODELS))
+    for model in models:
+        model_summary = summary[summary['model'] == model]
+        print(f"\n{MODEL_LABELS.get(model, model)} Model:")
+        for _, row in model_summary.iterrows():
+            print(f"  {int(row['horizon'])} yıl ileri: MAE={row['mae']:.2f}, MAPE=%{row['mape']:.2f} "
+                  f"({int(row['n_forecasts'])} tahmin, {int(row['n_failed'])} başarısız)")
+
+    weighted = summary.assign(weighted_mape=summary['mape'] * summary['n_forecasts'])
+    totals = weighted.groupby('model')[['weighted_mape', 'n_forecasts']].sum()
+    overall = totals['weighted_mape'] / totals['n_forecasts']
+    best_model = overall.idxmin()
+    print(f"\nÖrneklem dışı en iyi model: {MODEL_LABELS.get(best_model, best_model)} Model "
+          f"(ortalama MAPE=%{overall[best_model]:.2f})")
@@ -0,0 +1,378 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+DATA_PATH = 'data/netflix1.csv'
+CACHE_DIR = 'cache'
+
+# Önbellek biçimi değiştiğinde artırılır; eski önbellekler yeniden oluşturulur
+CACHE_FORMAT = 10
+
+# Tekilleştirilmiş verinin sürüm eki; tekrar tespiti kuralları değiştiğinde artırılır, böylece tekilleştirilmiş
+# veriden üretilen önbellekler (katalog, toplamlar, kümeler, pipeline, rapor) yeniden oluşturulur
+DEDUPE_SUFFIX = '-dedup2'
+
+# Veri setinde eksik değerler için kullanılan yer tutucu
+PLACEHOLDER = 'Not Given'
+
+RATING_GROUP_ORDER = ["Genel İzleyici", "Ebeveyn Rehberliği", "13+ Yaş", "Yetişkin", "Belirtilmemiş", "Diğer"]
+
+RATING_GROUPS = {
+    'G': "Genel İzleyici", 'TV-Y': "Genel İzleyici", 'TV-G': "Genel İzleyici",
+    'PG': "Ebeveyn Rehberliği", 'TV-Y7': "Ebeveyn Rehberliği", 'TV-Y7-FV': "Ebeveyn Rehberliği",
+    'TV-PG': "Ebeveyn Rehberliği",
+    'PG-13': "13+ Yaş", 'TV-14': "13+ Yaş",
+    'R': "Yetişkin", 'TV-MA': "Yetişkin", 'NC-17': "Yetişkin",
+}
+
+# Birden fazla değer içeren (virgülle ayrılmış) sütunlar: boyut adı -> sütun adı
+MULTI_VALUE_COLUMNS = {
+    'country': 'country',
+    'category': 'listed_in',
+    'director': 'director',
+}
+
+
+def classify_rating(rating):
+    if pd.isna(rating) or rating == 'Belirtilmemiş':
+        return "Belirtilmemiş"
+    return RATING_GROUPS.get(rating, "Diğer")
+
+
+def dataset_version(path=DATA_PATH):
+    """Veri dosyasının içeriğine bağlı kısa sürüm kimliği"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+class Bridge:
+    """Çok değerli bir sütunun satır <-> değer köprü tablosu ve ters indeksi.
+
+    `rows[i]` ve `codes[i]` i. (satır, değer) çiftidir; `values[code]` değerin kendisi.
+    `order` / `offsets` ile bir değere ait satırlar kopyalama yapmadan bulunur (CSR düzeni).
+    `aliases` verilirse değerlerin diğer yazımları da (ör. aksanlı hali) aynı koda çözülür.
+    """
+
+    def __init__(self, rows, codes, values, aliases=None):
+        self.rows = rows
+        self.codes = codes
+        self.values = values
+        self.order = np.argsort(codes, kind='stable')
+        self.offsets = np.searchsorted(codes[self.order], np.arange(len(values) + 1))
+        self.aliases = aliases
+        self._lookup = None
+
+    @classmethod
+    def from_arrays(cls, rows, codes, values, order, offsets, aliases=None):
+        """Önceden hesaplanmış dizilerden (ör. mmap ile açılmış depodan) kopyalamadan oluştur"""
+        bridge = cls.__new__(cls)
+        bridge.rows = rows
+        bridge.codes = codes
+        bridge.values = values
+        bridge.order = order
+        bridge.offsets = offsets
+        bridge.aliases = aliases
+        bridge._lookup = None
+        return bridge
+
+    @classmethod
+    def from_column(cls, column):
+        """', ' ile ayrılmış değerlerden köprü tablosu oluştur"""
+        exploded = column.str.split(',').explode().str.strip()
+        exploded = exploded[exploded.notna() & (exploded != '')]
+        codes, values = pd.factorize(exploded, sort=True)
+        return cls(exploded.index.values.astype(np.int64), codes.astype(np.int32), np.asarray(values, dtype=object))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def code_of(self, value):
+        if self._lookup is None:
+            # Değer -> kod sözlüğü ilk aramada oluşturulur
+            lookup = dict(self.aliases or {})
+            lookup.update((value, code) for code, value in enumerate(self.values.tolist()))
+            self._lookup = lookup
+        return self._lookup.get(value)
+
+    def rows_for(self, value):
+        """Bu değere sahip satırların konumları"""
+        code = self.code_of(value)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        return self.rows_for_code(code)
+
+    def rows_for_code(self, code):
+        return self.rows[self.order[self.offsets[code]:self.offsets[code + 1]]]
+
+    def counts(self, row_mask=None):
+        """Her değer için satır sayısı (isteğe bağlı satır maskesiyle)"""
+        codes = self.codes if row_mask is None else self.codes[row_mask[self.rows]]
+        return np.bincount(codes, minlength=len(self.values))
+
+    def sums(self, row_values, row_mask=None):
+        """Her değer için satır değerlerinin toplamı ve toplanan (değeri boş olmayan) satır sayısı.
+
+        Satır değerleri köprü üzerinden bincount ağırlıklarıyla toplanır; patlatılmış kopya oluşturulmaz.
+        """
+        selected = ~np.isnan(row_values[self.rows])
+        if row_mask is not None:
+            selected &= row_mask[self.rows]
+        codes = self.codes[selected]
+        totals = np.bincount(codes, weights=row_values[self.rows[selected]], minlength=len(self.values))
+        return totals, np.bincount(codes, minlength=len(self.values))
+
+    def means(self, row_values, row_mask=None):
+        """Her değer için satır değerlerinin ortalaması; hiç satırı olmayan değerler atlanır (pd.Series)"""
+        totals, counts = self.sums(row_values, row_mask)
+        present = counts > 0
+        return pd.Series(totals[present] / counts[present], index=self.values[present])
+
+    def top_codes(self, n, row_mask=None):
+        """En çok satırda geçen `n` değerin kodları (eşitlikte değere göre alfabetik)"""
+        counts = self.counts(row_mask)
+        return np.argsort(-counts, kind='stable')[:n]
+
+
+class Catalog:
+    """Ayrıştırılmış Netflix kataloğu ve çok değerli sütunların indeksleri"""
+
+    def __init__(self, df, version=None, bridges=None, title_index=None, country_table=None, columns=None,
+                 validation=None, duplicate_index=None, neighbor_index=None):
+        self._df = df
+        self.version = version
+        self.bridges = bridges if bridges is not None else {}
+        self.title_index = title_index
+        self.country_table = country_table
+        # Sütun deposundan açıldıysa DataFrame yalnızca `df` ilk kullanıldığında oluşturulur
+        self.columns = columns
+        # Yükleme sırasındaki doğrulama raporu (validation.ValidationReport); DataFrame'den kurulduysa None
+        self.validation = validation
+        self.duplicate_index = duplicate_index
+        self.neighbor_index = neighbor_index
+        self._record_table = None
+
+    @property
+    def df(self):
+        if self._df is None:
+            self._df = self.columns.frame()
+        return self._df
+
+    def __len__(self):
+        return len(self.columns) if self._df is None else len(self._df)
+
+    def bridge(self, dimension):
+        """Boyutun köprü tablosu; direktörlerde kodlar kanonik direktör kimlikleridir"""
+        if dimension not in self.bridges:
+            bridge = Bridge.from_column(self.df[MULTI_VALUE_COLUMNS[dimension]])
+            if dimension == 'director':
+                # Aynı kişinin yazım farkları (boşluk, aksan, baş harfler) tek kimlikte birleştirilir
+                from netflix_analysis.names import canonical_bridge
+
+                bridge = canonical_bridge(bridge)
+            self.bridges[dimension] = bridge
+        return self.bridges[dimension]
+
+    def countries(self):
+        """Ülke boyut tablosu (kod, ad, bölge, bilinmiyor bayrağı ve satırların ana ülke kodları)"""
+        if self.country_table is None:
+            from netflix_analysis.dimensions import CountryTable
+
+            self.country_table = CountryTable.from_bridge(self.bridge('country'), len(self))
+        return self.country_table
+
+    def records(self, mask=None):
+        """Satırları TitleRecord olarak dolaş (isteğe bağlı boolean maske veya satır konumlarıyla)"""
+        if self._record_table is None:
+            from netflix_analysis.records import RecordTable
+
+            if self._df is None:
+                # Depodaki sözlük kodlu sütunlar doğrudan (kopyasız) kullanılır
+                self._record_table = RecordTable.from_columns(self.columns)
+            else:
+                self._record_table = RecordTable.from_frame(self.df)
+        return self._record_table.records(mask)
+
+    def titles(self):
+        """Başlık arama indeksi (ilk kullanımda oluşturulur, katalog önbelleğiyle saklanır)"""
+        if self.title_index is None:
+            from netflix_analysis.title_index import TitleIndex
+
+            self.title_index = TitleIndex.build(self.df)
+        return self.title_index
+
+    def duplicates(self):
+        """Tekrar listelenen içeriklerin indeksi (ilk kullanımda oluşturulur, katalog önbelleğiyle saklanır)"""
+        if self.duplicate_index is None:
+            from netflix_analysis.duplicates import DuplicateIndex
+
+            self.duplicate_index = DuplicateIndex.build(self.df, self.titles(), self.bridge('director'))
+        return self.duplicate_index
+
+    def neighbors(self):
+        """İçerik özelliklerine göre en benzer içerikler (ilk kullanımda hesaplanır, katalog önbelleğiyle saklanır)"""
+        if self.neighbor_index is None:
+            from netflix_analysis.neighbors import NeighborIndex
+
+            bridges = {dimension: self.bridge(dimension) for dimension in MULTI_VALUE_COLUMNS}
+            self.neighbor_index = NeighborIndex.build(self.df, bridges)
+        return self.neighbor_index
+
+    def deduplicated(self):
+        """Her tekrar grubundan yalnızca kataloğa ilk eklenen satırın kaldığı yeni katalog.
+
+        Doğrulama raporu kalan satırlara göre yeniden numaralanarak taşınır; indeksler ilk kullanımda kurulur.
+        """
+        keep = self.duplicates().keep
+        version = f'{self.version}{DEDUPE_SUFFIX}' if self.version else None
+        validation = self.validation.subset(keep) if self.validation is not None else None
+        return Catalog(self.df.loc[keep].reset_index(drop=True), version=version, validation=validation)
+
+    def exploded(self, dimension, columns=(), codes=None):
+        """Çok değerli sütunun patlatılmış (explode) hali; metin yeniden bölünmeden köprü tablosundan oluşturulur.
+
+        Satır indeksi orijinal satırın indeksidir (DataFrame.explode ile aynı), değer sütununun adı `dimension`.
+        `codes` verilirse yalnızca bu kodlara sahip değerler alınır (seçim tamsayı maskesiyle yapılır).
+        """
+        bridge = self.bridge(dimension)
+        rows, value_codes = bridge.rows, bridge.codes
+        if codes is not None:
+            selected = np.isin(value_codes, codes)
+            rows, value_codes = rows[selected], value_codes[selected]
+        result = self.df.iloc[rows][list(columns)]
+        result.insert(0, dimension, bridge.values[value_codes])
+        return result
+
+    def mask(self, country=None, type=None, year_range=None, rating_group=None, year_field='release_year',
+             region=None):
+        """Filtrelere uyan satırlar için boolean maske"""
+        mask = np.ones(len(self.df), dtype=bool)
+
+        if country or region:
+            # Ülke ve bölge filtreleri ülke kodlarına çevrilip köprü tablosunda tamsayı karşılaştırmasıyla uygulanır
+            table = self.countries()
+            codes = table.codes_for(names=_as_list(country) if country else None,
+                                    regions=_as_list(region) if region else None)
+            bridge = self.bridge('country')
+            country_mask = np.zeros(len(self.df), dtype=bool)
+            country_mask[bridge.rows[np.isin(bridge.codes, codes)]] = True
+            mask &= country_mask
+
+        if type:
+            mask &= self.df['type'].isin(_as_list(type)).values
+
+        if year_range:
+            start, end = year_range
+            years = self.df[year_field].values
+            mask &= (years >= start) & (years <= end)
+
+        if rating_group:
+            mask &= self.df['rating_group'].isin(_as_list(rating_group)).values
+
+        return mask
+
+
+def pair_counts(df, row, column):
+    """İki sütunun çapraz sayım tablosu; pd.crosstab'ın aksine patlatılmış tablolardaki tekrarlı indekslerle çalışır"""
+    return df.groupby([row, column]).size().unstack(fill_value=0)
+
+
+def _as_list(value):
+    return [value] if isinstance(value, str) else list(value)
+
+
+def parse_catalog(df):
+    """Script'lerin ayrı ayrı yaptığı ayrıştırmaları tek seferde uygula"""
+    df = df.reset_index(drop=True)
+    df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce')
+    df['year_added'] = df['date_added'].dt.year
+    df['release_year'] = pd.to_numeric(df['release_year'], errors='coerce')
+    df['rating_group'] = df['rating'].map(classify_rating)
+
+    duration_value = df['duration'].str.extract(r'(\d+)', expand=False).astype(float)
+    df['minutes'] = duration_value.where(df['type'] == 'Movie')
+    df['seasons'] = duration_value.where(df['type'] == 'TV Show')
+    return df
+
+
+def _cache_key(path):
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+
+def _open_cached(store_root, key):
+    """Anahtarı ve biçimi tutan geçerli depoyu aç; yoksa veya okunamıyorsa None"""
+    from netflix_analysis import column_store
+
+    directory, manifest = column_store.current_store(store_root)
+    if manifest is not None and manifest.get('key') == list(key) and manifest.get('cache_format') == CACHE_FORMAT:
+        try:
+            return column_store.open_store(directory, manifest)
+        except (OSError, ValueError, KeyError):
+            pass
+    return None
+
+
+def load_catalog(path=DATA_PATH, cache_dir=CACHE_DIR, use_cache=True, dedupe=False):
+    """Kataloğu yükle; CSV değişmediyse ayrıştırılmış ve indekslenmiş hali sütun deposundan (mmap) açılır.
+
+    CSV yeniden okunduğunda veri doğrulanır; doğrulama raporu da depoya yazılır (`catalog.validation`).
+    `dedupe` verilirse farklı show_id'lerle tekrar listelenen içerikler bir kez sayılır; tekilleştirilmiş
+    katalog da indeksleriyle birlikte ayrı bir depoda saklanır.
+    """
+    from netflix_analysis import column_store
+
+    key = _cache_key(path)
+    caching = use_cache and cache_dir
+    store_root = os.path.join(cache_dir, 'catalog') if cache_dir else None
+    dedupe_root = os.path.join(cache_dir, 'catalog-dedup') if cache_dir else None
+
+    if caching and dedupe:
+        catalog = _open_cached(dedupe_root, key)
+        if catalog is not None:
+            return catalog
+
+    catalog = _open_cached(store_root, key) if caching else None
+    if catalog is None:
+        catalog = _build_catalog(path)
+        if caching:
+            os.makedirs(store_root, exist_ok=True)
+            column_store.write_store(catalog, store_root, key, cache_format=CACHE_FORMAT)
+
+    if not dedupe:
+        return catalog
+    catalog = catalog.deduplicated()
+    if caching:
+        os.makedirs(dedupe_root, exist_ok=True)
+        column_store.write_store(catalog, dedupe_root, key, cache_format=CACHE_FORMAT)
+    return catalog
+
+
+def _build_catalog(path):
+    """CSV'yi oku, doğrula ve tüm indeksleri kur"""
+    from netflix_analysis.validation import validate_frame
+
+    raw = pd.read_csv(path)
+    df = parse_catalog(raw)
+    catalog = Catalog(df, version=dataset_version(path), validation=validate_frame(raw, df))
+    for dimension in MULTI_VALUE_COLUMNS:
+        catalog.bridge(dimension)
+    catalog.countries()
+    catalog.titles()
+    catalog.duplicates()
+    catalog.neighbors()
+    return catalog
+
+
+def open_catalog(cache_dir=CACHE_DIR):
+    """Geçerli sütun deposunu CSV'yi kontrol etmeden aç (paralel işçiler için); depo yoksa None"""
+    from netflix_analysis import column_store
+
+    directory, manifest = column_store.current_store(os.path.join(cache_dir, 'catalog'))
+    if manifest is None:
+        return None
+    return column_store.open_store(directory, manifest)
@@ -0,0 +1 @@
+"""Analiz sonuçlarından grafik üreten fonksiyonlar."""
@@ -0,0 +1,114 @@
+import os
+
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+red = '#8E1616'
+gold = '#E8C999'
+
+
+def apply_theme():
+    """Netflix teması ayarları"""
+    plt.style.use('dark_background')
+    sns.set_style("dark", {"axes.facecolor": "#000000"})
+    plt.rcParams['axes.edgecolor'] = 'white'
+    plt.rcParams['axes.labelcolor'] = 'white'
+    plt.rcParams['xtick.color'] = 'white'
+    plt.rcParams['ytick.color'] = 'white'
+    plt.rcParams['text.color'] = 'white'
+    plt.rcParams['figure.facecolor'] = '#000000'
+    plt.rcParams['axes.facecolor'] = '#000000'
+    plt.rcParams['savefig.facecolor'] = '#000000'
+
+
+def plot_type_distribution(type_counts, fig_path):
+    plt.figure(figsize=(6, 6))
+    plt.pie(type_counts, labels=type_counts.index, autopct='%1.1f%%',
+            startangle=140, colors=[red, gold], textprops={'color': 'white'})
+    plt.title('(%) Film ve TV Show Dağılımı', pad=30)
+    plt.axis('equal')
+    plt.savefig(fig_path)
+
+
+def plot_top_countries(top_data, fig_path):
+    top_data.plot(kind='bar', stacked=True, figsize=(10, 6), color=[red, gold])
+    plt.title("En Fazla İçeriğe Sahip 10 Ülke (TV Show & Film)")
+    plt.xlabel("Ülke")
+    plt.ylabel("İçerik Sayısı")
+    plt.xticks(rotation=45, ha='right')
+    plt.legend(title="Tür")
+    plt.tight_layout()
+    plt.savefig(fig_path)
+
+
+def _top_bar(counts, fig_path, title, xlabel, ylabel):
+    counts.plot(kind='bar', color=red, figsize=(10, 6))
+    plt.title(title)
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    plt.savefig(fig_path)
+
+
+def plot_top_movie_countries(top_10_movies, fig_path):
+    _top_bar(top_10_movies, fig_path, "En Fazla Movie İçeriğine Sahip 10 Ülke", "Ülke", "Movie Sayısı")
+
+
+def plot_top_show_countries(top_10_shows, fig_path):
+    _top_bar(top_10_shows, fig_path, "En Fazla TV Show İçeriğine Sahip 10 Ülke", "Ülke", "TV Show Sayısı")
+
+
+def plot_top_categories(top_10_categories, fig_path):
+    _top_bar(top_10_categories, fig_path, "En Fazla Görülen 10 Kategori (Uluslararası Kategoriler Hariç)",
+             "Kategori", "Kategori Sayısı")
+
+
+def plot_top_category_per_country(top_category_per_country, fig_path):
+    plt.figure(figsize=(10, 6))
+    sns.barplot(
+        data=top_category_per_country,
+        x='count',
+        y='country',
+        hue='category',
+        dodge=False,
+        palette='Set3'
+    )
+    plt.title("En Fazla İçeriğe Sahip 10 Ülkede En Popüler Kategori (Filtreli)")
+    plt.xlabel("Kategori Sayısı")
+    plt.ylabel("Ülke")
+    plt.legend(title="Kategori", bbox_to_anchor=(1.05, 1), loc='upper left')
+    plt.tight_layout()
+    plt.savefig(fig_path)
+
+
+# Grafikler: (dosya adı, çizim fonksiyonu, sonuç anahtarı, etiket)
+CHARTS = [
+    ("type_distribution_pie.png", plot_type_distribution, 'type_counts',
+     "İçerik türü dağılımı grafiği"),
+    ("top_10_countries_tv_film_distribution.png", plot_top_countries, 'top_data',
+     "En çok içeriğe sahip 10 ülke grafiği"),
+    ("top_10_movies_by_country.png", plot_top_movie_countries, 'top_10_movies',
+     "Ülkelere göre film sayısı grafiği"),
+    ("top_10_tv_shows_by_country.png", plot_top_show_countries, 'top_10_shows',
+     "Ülkelere göre dizi sayısı grafiği"),
+    ("top_10_categories.png", plot_top_categories, 'top_10_categories',
+     "En popüler 10 kategori grafiği"),
+    ("top_category_per_top_10_countries.png", plot_top_category_per_country, 'top_category_per_country',
+     "Ülkelerin en popüler kategorisi grafiği"),
+]
+
+
+def render_countries(results, fig_dir='graphics', show=False):
+    """countries_and_categories.py grafiklerini üret; mevcut grafikler yeniden çizilmez"""
+    apply_theme()
+    os.makedirs(fig_dir, exist_ok=True)
+    for filename, plot, key, _ in CHARTS:
+        fig_path = os.path.join(fig_dir, filename)
+        if os.path.exists(fig_path):
+            continue
+
+        plot(results[key], fig_path)
+        if show:
+            plt.show()
+        plt.close('all')
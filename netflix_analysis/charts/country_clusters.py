@@ -0,0 +1,58 @@
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+import seaborn as sns
+
+from netflix_analysis.charts.countries import apply_theme, gold
+
+# Bu sayıdan fazla grup varsa eksen etiketleri okunamaz; yazılmaz
+MAX_TICK_LABELS = 100
+
+
+def plot_country_distances(clusters, fig_path):
+    frame = clusters.distance_frame()
+    n_groups = len(frame)
+    size = min(max(8, n_groups * 0.14), 30)
+    plt.figure(figsize=(size + 2, size))
+    ticks = n_groups <= MAX_TICK_LABELS
+    ax = sns.heatmap(frame, cmap='rocket_r', square=True, xticklabels=ticks, yticklabels=ticks,
+                     cbar_kws={'label': "Uzaklık", 'shrink': 0.6})
+
+    # Küme sınırları: gruplar ısı haritasında küme sırasıyla ardışık
+    labels = clusters.groups['cluster'].values[clusters.order]
+    for boundary in np.flatnonzero(np.diff(labels)) + 1:
+        ax.axhline(boundary, color=gold, linewidth=1)
+        ax.axvline(boundary, color=gold, linewidth=1)
+    if ticks:
+        ax.tick_params(labelsize=6)
+
+    settings = clusters.settings
+    plt.title(f"Ülke Profili Uzaklıkları ({settings['metric']}, {settings['method']}, "
+              f"{labels.max() if n_groups else 0} küme)")
+    plt.xlabel("")
+    plt.ylabel("")
+    plt.tight_layout()
+    plt.savefig(fig_path)
+
+
+# Grafikler: (dosya adı, çizim fonksiyonu, sonuç anahtarı, etiket)
+CHARTS = [
+    ("country_distance_heatmap.png", plot_country_distances, 'clusters',
+     "Ülke profili uzaklıkları ısı haritası"),
+]
+
+
+def render_country_clusters(results, fig_dir='graphics', show=False):
+    """Ülke kümeleri grafiklerini üret; mevcut grafikler yeniden çizilmez"""
+    apply_theme()
+    os.makedirs(fig_dir, exist_ok=True)
+    for filename, plot, key, _ in CHARTS:
+        fig_path = os.path.join(fig_dir, filename)
+        if os.path.exists(fig_path):
+            continue
+
+        plot(results[key], fig_path)
+        if show:
+            plt.show()
+        plt.close('all')
@@ -0,0 +1,163 @@
+import os
+
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+
+def _style_axes(ax, grid_axis):
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['bottom'].set_color('#333333')
+    ax.spines['left'].set_color('#333333')
+    ax.grid(axis=grid_axis, linestyle='--', alpha=0.3, color='#555555')
+
+
+def plot_top_directors(top_directors, fig_path):
+    plt.figure(figsize=(12, 10))
+    plt.style.use('dark_background')
+
+    # Netflix kırmızısı ve tonları
+    colors = sns.color_palette("Reds_r", n_colors=len(top_directors))
+
+    ax = sns.barplot(y=top_directors.index, x=top_directors.values, palette=colors)
+
+    # Bar değerlerini göster
+    for i, v in enumerate(top_directors.values):
+        ax.text(v + 0.1, i, str(v), va='center', color='white', fontweight='bold')
+
+    plt.title("Netflix'te En Çok İçeriğe Sahip Direktörler", fontsize=16, color='white')
+    plt.xlabel("İçerik Sayısı", fontsize=14, color='white')
+    plt.ylabel("Direktör", fontsize=14, color='white')
+
+    _style_axes(ax, 'x')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_director_content_type(director_type_matrix, fig_path):
+    plt.figure(figsize=(12, 8))
+    plt.style.use('dark_background')
+
+    colors = ['#E50914', '#831010']
+
+    director_type_matrix.plot(kind='bar', color=colors, width=0.8)
+
+    plt.title("En Popüler Direktörlerin Film ve Dizi Dağılımı", fontsize=16, color='white')
+    plt.xlabel("Direktör", fontsize=14, color='white')
+    plt.ylabel("İçerik Sayısı", fontsize=14, color='white')
+    plt.legend(facecolor='#222222', edgecolor='#444444', labelcolor='white')
+
+    _style_axes(plt.gca(), 'y')
+    plt.tick_params(axis='both', colors='white')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def _barh_panels(panels, fig_path, suptitle):
+    """Her panel için (başlık, etiketler, sayılar) yatay çubuk grafiği"""
+    fig, axs = plt.subplots(len(panels), 1, figsize=(12, 15))
+    plt.style.use('dark_background')
+
+    for i, (title, labels, counts) in enumerate(panels):
+        # Netflix kırmızısı ve tonları
+        colors = sns.color_palette("Reds_r", n_colors=len(labels))
+
+        axs[i].barh(labels, counts, color=colors)
+        axs[i].set_title(f"{title}", color='white')
+        axs[i].set_xlabel("İçerik Sayısı", color='white')
+        axs[i].tick_params(axis='both', colors='white')
+        _style_axes(axs[i], 'x')
+
+        # Etiketleri ekle
+        for j, v in enumerate(counts):
+            axs[i].text(v + 0.1, j, str(v), va='center', color='white')
+
+    plt.suptitle(suptitle, fontsize=16, color='white', y=0.98)
+    plt.tight_layout(rect=[0, 0, 1, 0.97])
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_director_categories(director_categories, fig_path):
+    panels = [(director, list(categories.keys()), list(categories.values()))
+              for director, categories in director_categories.items()]
+    _barh_panels(panels, fig_path, "En Popüler 5 Direktörün En Çok Çalıştığı Kategoriler")
+
+
+def plot_country_top_directors(country_top_directors, fig_path):
+    panels = [(country, directors.index, directors.values)
+              for country, directors in country_top_directors.items()]
+    _barh_panels(panels, fig_path, "En Çok İçerik Üreten 5 Ülkenin En Popüler Direktörleri")
+
+
+def plot_director_rating_heatmap(director_rating_matrix, fig_path):
+    plt.figure(figsize=(12, 8))
+    plt.style.use('dark_background')
+
+    # Kırmızı tonlarında bir renk haritası
+    cmap = sns.color_palette("Reds", as_cmap=True)
+
+    # Heatmap oluştur
+    ax = sns.heatmap(director_rating_matrix, annot=True, fmt='d', cmap=cmap,
+                     linewidths=0.5, cbar_kws={'label': 'İçerik Sayısı'})
+
+    plt.title("En Popüler Direktörlerin Rating Tercihleri", fontsize=16, color='white')
+    plt.xlabel("Rating Grubu", fontsize=14, color='white')
+    plt.ylabel("Direktör", fontsize=14, color='white')
+
+    # Renk çubuğu etiketini beyaz yap
+    cbar = ax.collections[0].colorbar
+    cbar.ax.yaxis.label.set_color('white')
+    cbar.ax.tick_params(colors='white')
+
+    plt.tick_params(axis='both', colors='white')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_directors_wordcloud(directors_text, fig_path):
+    from wordcloud import WordCloud
+
+    wordcloud = WordCloud(width=800, height=400, background_color='black',
+                          colormap='Reds', max_words=100).generate(directors_text)
+
+    plt.figure(figsize=(10, 8))
+    plt.style.use('dark_background')
+    plt.imshow(wordcloud, interpolation='bilinear')
+    plt.axis('off')
+    plt.title("Netflix Direktörleri Kelime Bulutu", fontsize=16, color='white')
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+# Grafikler: (dosya adı, çizim fonksiyonu, sonuç anahtarı, etiket)
+CHARTS = [
+    ("netflix_top_directors.png", plot_top_directors, 'top_directors',
+     "En popüler direktörler grafiği"),
+    ("netflix_director_content_type.png", plot_director_content_type, 'director_type_matrix',
+     "Direktör-tür dağılımı grafiği"),
+    ("netflix_director_categories.png", plot_director_categories, 'director_categories',
+     "Direktör-kategori ilişkisi grafiği"),
+    ("netflix_country_top_directors.png", plot_country_top_directors, 'country_top_directors',
+     "Ülke-direktör ilişkisi grafiği"),
+    ("netflix_director_rating_heatmap.png", plot_director_rating_heatmap, 'director_rating_matrix',
+     "Direktör-rating heatmap grafiği"),
+    ("netflix_directors_wordcloud.png", plot_directors_wordcloud, 'directors_text',
+     "Direktörler kelime bulutu"),
+]
+
+
+def render_directors(results, fig_dir='graphics'):
+    """directors_analysis.py grafiklerini üret; mevcut grafikler yeniden çizilmez"""
+    os.makedirs(fig_dir, exist_ok=True)
+    for filename, plot, key, label in CHARTS:
+        fig_path = os.path.join(fig_dir, filename)
+        if os.path.exists(fig_path):
+            print(f"{label} zaten mevcut: {fig_path}")
+            continue
+
+        plot(results[key], fig_path)
+        print(f"{label} kaydedildi: {fig_path}")
+        plt.close('all')
@@ -0,0 +1,149 @@
+import os
+
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+# Netflix kırmızısı ve tonları
+NETFLIX_COLORS = ["#E50914", "#B20710", "#831010", "#6E0D10", "#5C0B0B",
+                  "#DB0000", "#A30000", "#CF0000", "#B9090B", "#960000",
+                  "#FF0000", "#BF0000", "#FF1E1E", "#FF3939", "#FF5252",
+                  "#D22F26", "#C11119", "#F85C4D", "#EA3C53", "#FF4D4D"]
+
+
+def _yearly_line(series, fig_path, title, ylabel):
+    plt.figure(figsize=(10, 5))
+
+    plt.style.use('dark_background')
+
+    plt.plot(series.index, series.values, marker='o', color="#E50914", linewidth=2.5)
+
+    plt.title(title, color='white', fontsize=14)
+    plt.xlabel("Yıl", color='white', fontsize=12)
+    plt.ylabel(ylabel, color='white', fontsize=12)
+
+    plt.grid(True, color='#333333', linestyle='--', alpha=0.7)
+
+    plt.gca().spines['bottom'].set_color('#333333')
+    plt.gca().spines['left'].set_color('#333333')
+    plt.gca().spines['top'].set_visible(False)
+    plt.gca().spines['right'].set_visible(False)
+
+    plt.tick_params(axis='both', colors='white')
+
+    plt.tight_layout()
+
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_movie_duration_trend(movie_avg, fig_path):
+    _yearly_line(movie_avg, fig_path, "Yıllara Göre Film Süresi Ortalaması (dk)", "Ortalama Süre (dk)")
+
+
+def plot_tv_season_trend(tv_avg, fig_path):
+    _yearly_line(tv_avg, fig_path, "Yıllara Göre Dizi Sezon Ortalaması", "Ortalama Sezon")
+
+
+def _yearly_quantiles(quantiles, fig_path, title, ylabel):
+    """Yıllara göre yüzdelik çizgileri (her sütun bir yüzdelik, örn. p50 ve p90)"""
+    plt.figure(figsize=(10, 5))
+
+    plt.style.use('dark_background')
+
+    for column, color in zip(quantiles.columns, ["#E50914", "#FF5252", "#831010"]):
+        plt.plot(quantiles.index, quantiles[column].values, marker='o', color=color, linewidth=2.5, label=column)
+
+    plt.title(title, color='white', fontsize=14)
+    plt.xlabel("Yıl", color='white', fontsize=12)
+    plt.ylabel(ylabel, color='white', fontsize=12)
+
+    plt.grid(True, color='#333333', linestyle='--', alpha=0.7)
+
+    plt.gca().spines['bottom'].set_color('#333333')
+    plt.gca().spines['left'].set_color('#333333')
+    plt.gca().spines['top'].set_visible(False)
+    plt.gca().spines['right'].set_visible(False)
+
+    plt.tick_params(axis='both', colors='white')
+    plt.legend(facecolor='#222222', edgecolor='#444444', labelcolor='white')
+
+    plt.tight_layout()
+
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_movie_duration_quantiles(movie_quantiles, fig_path):
+    _yearly_quantiles(movie_quantiles, fig_path, "Yıllara Göre Film Süresi Medyanı ve p90 (dk)", "Süre (dk)")
+
+
+def plot_tv_season_quantiles(tv_quantiles, fig_path):
+    _yearly_quantiles(tv_quantiles, fig_path, "Yıllara Göre Dizi Sezon Sayısı Medyanı ve p90", "Sezon")
+
+
+def _category_bars(averages, fig_path, title, xlabel, offset, fmt):
+    plt.figure(figsize=(12, 8))
+
+    plt.style.use('dark_background')
+
+    ax = sns.barplot(x=averages.values,
+                     y=averages.index,
+                     palette=NETFLIX_COLORS)
+
+    for i, v in enumerate(averages.values):
+        ax.text(v + offset, i, format(v, fmt), va='center', color='white', fontweight='bold')
+
+    plt.title(title, fontsize=14, color='white')
+    plt.xlabel(xlabel, fontsize=12, color='white')
+    plt.ylabel("Kategori", fontsize=12, color='white')
+
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['bottom'].set_color('#333333')
+    ax.spines['left'].set_color('#333333')
+
+    ax.grid(axis='x', linestyle='--', alpha=0.2, color='#555555')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_duration_by_category(avg_duration_by_category, fig_path):
+    _category_bars(avg_duration_by_category, fig_path, "Film Süresi (dk) - Kategorilere Göre Ortalama",
+                   "Ortalama Süre (dk)", 0.5, ".1f")
+
+
+def plot_seasons_by_category(avg_season_by_category, fig_path):
+    _category_bars(avg_season_by_category, fig_path, "TV Show Sezon Sayısı - Kategorilere Göre Ortalama",
+                   "Ortalama Sezon Sayısı", 0.05, ".2f")
+
+
+# Grafikler: (dosya adı, çizim fonksiyonu, sonuç anahtarı, kaydedildi etiketi, mevcut etiketi)
+CHARTS = [
+    ("film_sure_trendi_netflix.png", plot_movie_duration_trend, 'movie_avg',
+     "Netflix temalı film süresi grafiği", "Film süresi grafiği"),
+    ("tvshow_sezon_trendi_netflix.png", plot_tv_season_trend, 'tv_avg',
+     "Netflix temalı dizi sezon grafiği", "Dizi sezon grafiği"),
+    ("film_sure_kategoriye_gore_netflix.png", plot_duration_by_category, 'avg_duration_by_category',
+     "Netflix temalı kategori grafiği", "Kategori grafiği"),
+    ("tvshow_sezon_kategoriye_gore_netflix.png", plot_seasons_by_category, 'avg_season_by_category',
+     "Netflix temalı TV Show kategori grafiği", "TV Show kategori grafiği"),
+    ("film_sure_yuzdelikleri_netflix.png", plot_movie_duration_quantiles, 'movie_quantiles',
+     "Netflix temalı film süresi yüzdelik grafiği", "Film süresi yüzdelik grafiği"),
+    ("tvshow_sezon_yuzdelikleri_netflix.png", plot_tv_season_quantiles, 'tv_quantiles',
+     "Netflix temalı dizi sezon yüzdelik grafiği", "Dizi sezon yüzdelik grafiği"),
+]
+
+
+def render_durations(results, fig_dir='graphics', show=False):
+    """durations.py grafiklerini üret; mevcut grafikler yeniden çizilmez"""
+    os.makedirs(fig_dir, exist_ok=True)
+    for filename, plot, key, saved_label, existing_label in CHARTS:
+        fig_path = os.path.join(fig_dir, filename)
+        if os.path.exists(fig_path):
+            print(f"{existing_label} zaten mevcut: {fig_path}")
+            continue
+
+        plot(results[key], fig_path)
+        print(f"{saved_label} kaydedildi: {fig_path}")
+        if show:
+            plt.show()
+        plt.close()
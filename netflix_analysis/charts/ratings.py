@@ -0,0 +1,160 @@
+import os
+
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+
+def _style_axes(ax, grid_axis=None):
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['bottom'].set_color('#333333')
+    ax.spines['left'].set_color('#333333')
+    if grid_axis is not None:
+        ax.grid(axis=grid_axis, linestyle='--', alpha=0.3, color='#555555')
+
+
+def plot_rating_distribution(rating_counts, fig_path):
+    plt.figure(figsize=(12, 8))
+    plt.style.use('dark_background')
+
+    # Netflix kırmızısı ve tonları
+    colors = sns.color_palette("Reds_r", n_colors=len(rating_counts))
+
+    ax = sns.barplot(y=rating_counts.index, x=rating_counts.values, palette=colors)
+
+    # Bar değerleri
+    for i, v in enumerate(rating_counts.values):
+        ax.text(v + 10, i, str(v), va='center', color='white', fontweight='bold')
+
+    plt.title("Netflix İçerik Rating Dağılımı", fontsize=16, color='white')
+    plt.xlabel("İçerik Sayısı", fontsize=14, color='white')
+    plt.ylabel("Rating (Yaş Sınırı)", fontsize=14, color='white')
+
+    _style_axes(ax, 'x')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_rating_groups_pie(rating_group_counts, fig_path):
+    plt.figure(figsize=(10, 8))
+    plt.style.use('dark_background')
+
+    # Netflix kırmızısı ve tonları
+    colors = ['#E50914', '#B20710', '#831010', '#5C0B0B', '#DB0000', '#A30000']
+
+    plt.pie(rating_group_counts.values, labels=rating_group_counts.index, autopct='%1.1f%%',
+            startangle=90, colors=colors, wedgeprops={'edgecolor': 'black', 'linewidth': 1},
+            textprops={'color': 'white'})
+
+    plt.title("Netflix İçeriklerinin Yaş Sınıfı Dağılımı", fontsize=16, color='white')
+    plt.axis('equal')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_rating_by_type(rating_type_filtered, fig_path):
+    plt.figure(figsize=(12, 8))
+    plt.style.use('dark_background')
+
+    # Netflix kırmızısı ve tonları
+    colors = ['#E50914', '#831010']
+
+    rating_type_filtered.plot(kind='bar', color=colors, width=0.8)
+
+    plt.title("Rating Türlerine Göre Film ve Dizi Dağılımı", fontsize=16, color='white')
+    plt.xlabel("Rating", fontsize=14, color='white')
+    plt.ylabel("İçerik Sayısı", fontsize=14, color='white')
+    plt.legend(facecolor='#222222', edgecolor='#444444', labelcolor='white')
+
+    _style_axes(plt.gca(), 'y')
+    plt.tick_params(axis='both', colors='white')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_rating_trend(rating_trend, fig_path):
+    plt.figure(figsize=(12, 8))
+    plt.style.use('dark_background')
+
+    colors = ['#E50914', '#B20710', '#831010', '#5C0B0B']
+
+    rating_trend.plot(kind='line', marker='o', color=colors, linewidth=2.5)
+
+    plt.title("Yıllara Göre Rating Gruplarının Değişimi", fontsize=16, color='white')
+    plt.xlabel("Yıl", fontsize=14, color='white')
+    plt.ylabel("İçerik Sayısı", fontsize=14, color='white')
+    plt.legend(facecolor='#222222', edgecolor='#444444', labelcolor='white')
+
+    plt.grid(linestyle='--', alpha=0.3, color='#555555')
+    _style_axes(plt.gca())
+    plt.tick_params(axis='both', colors='white')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def _rating_heatmap(matrix, fig_path, title, ylabel, figsize):
+    plt.figure(figsize=figsize)
+    plt.style.use('dark_background')
+
+    # Kırmızı tonlarında bir renk haritası
+    cmap = sns.color_palette("Reds", as_cmap=True)
+
+    ax = sns.heatmap(matrix, annot=True, fmt='d', cmap=cmap,
+                     linewidths=0.5, cbar_kws={'label': 'İçerik Sayısı'})
+
+    plt.title(title, fontsize=16, color='white')
+    plt.xlabel("Rating Grubu", fontsize=14, color='white')
+    plt.ylabel(ylabel, fontsize=14, color='white')
+
+    # Renk çubuğu etiketini beyaz yap
+    cbar = ax.collections[0].colorbar
+    cbar.ax.yaxis.label.set_color('white')
+    cbar.ax.tick_params(colors='white')
+
+    plt.tick_params(axis='both', colors='white')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_country_rating_heatmap(country_rating_matrix, fig_path):
+    _rating_heatmap(country_rating_matrix, fig_path, "Ülkelere Göre Rating Dağılımı", "Ülke", (12, 8))
+
+
+def plot_category_rating_heatmap(category_rating_matrix, fig_path):
+    _rating_heatmap(category_rating_matrix, fig_path, "Kategorilere Göre Rating Dağılımı", "Kategori", (12, 10))
+
+
+# Grafikler: (dosya adı, çizim fonksiyonu, sonuç anahtarı, etiket)
+CHARTS = [
+    ("netflix_rating_distribution.png", plot_rating_distribution, 'rating_counts',
+     "Rating dağılımı grafiği"),
+    ("netflix_rating_groups_pie.png", plot_rating_groups_pie, 'rating_group_counts',
+     "Rating grupları pasta grafiği"),
+    ("netflix_rating_by_type.png", plot_rating_by_type, 'rating_type_filtered',
+     "Rating-tür ilişkisi grafiği"),
+    ("netflix_rating_trend_by_year.png", plot_rating_trend, 'rating_trend',
+     "Rating trendi grafiği"),
+    ("netflix_country_rating_heatmap.png", plot_country_rating_heatmap, 'country_rating_matrix',
+     "Ülke-Rating heatmap grafiği"),
+    ("netflix_category_rating_heatmap.png", plot_category_rating_heatmap, 'category_rating_matrix',
+     "Kategori-Rating heatmap grafiği"),
+]
+
+
+def render_ratings(results, fig_dir='graphics'):
+    """netflix_rating_analysis.py grafiklerini üret; mevcut grafikler yeniden çizilmez"""
+    os.makedirs(fig_dir, exist_ok=True)
+    for filename, plot, key, label in CHARTS:
+        fig_path = os.path.join(fig_dir, filename)
+        if os.path.exists(fig_path):
+            print(f"{label} zaten mevcut: {fig_path}")
+            continue
+
+        plot(results[key], fig_path)
+        print(f"{label} kaydedildi: {fig_path}")
+        plt.close('all')
@@ -0,0 +1,39 @@
+import os
+
+STOPWORDS_EXTRA = ["Movie", "Film", "Series", "Season", "Netflix", "the", "The"]
+
+
+def wordcloud_filename(category):
+    return f"{category.lower().replace('&', 'and').replace(' ', '_')}_titles_wordcloud.png"
+
+
+def _filter_words(counts, stopwords):
+    """WordCloud.generate ile aynı eleme: durak kelimeler, tek harfler ve sayılar"""
+    return {word: count for word, count in counts.items()
+            if word not in stopwords and len(word) > 1 and not word.isdigit()}
+
+
+def render_title_wordclouds(frequencies, wordcloud_dir="wordclouds"):
+    """Her kategori için başlık kelime bulutu oluştur (kategori -> kelime sıklıkları)"""
+    from wordcloud import STOPWORDS, WordCloud
+
+    os.makedirs(wordcloud_dir, exist_ok=True)
+    # İndeksteki kelimeler küçük harfli ve kesme işaretsiz ("don't" -> "dont")
+    stopwords = {word.lower().replace("'", "") for word in list(STOPWORDS) + STOPWORDS_EXTRA}
+
+    for category, counts in frequencies.items():
+        counts = _filter_words(counts, stopwords)
+        if not counts:
+            continue
+
+        wordcloud = WordCloud(
+            background_color='black',
+            width=800,
+            height=400,
+            colormap='plasma'
+        ).generate_from_frequencies(counts)
+
+        filepath = os.path.join(wordcloud_dir, wordcloud_filename(category))
+
+        wordcloud.to_file(filepath)
+        print(f"{category} için kelime bulutu kaydedildi: {filepath}")
@@ -0,0 +1,151 @@
+import os
+
+import matplotlib.pyplot as plt
+
+
+def _netflix_axes(ax):
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['bottom'].set_color('#333333')
+    ax.spines['left'].set_color('#333333')
+
+
+def plot_added_year_distribution(added_counts, fig_path):
+    plt.figure(figsize=(12, 6))
+
+    plt.style.use('dark_background')
+    ax = added_counts.plot(kind='bar', color='#E50914', edgecolor='black', width=0.8)
+
+    plt.title("Netflix'e Eklenme Yılına Göre İçerik Sayısı", fontsize=14, color='white')
+    plt.xlabel("Eklenme Yılı", fontsize=12, color='white')
+    plt.ylabel("İçerik Sayısı", fontsize=12, color='white')
+    plt.grid(axis='y', linestyle='--', alpha=0.3, color='#555555')
+
+    _netflix_axes(ax)
+
+    plt.tick_params(axis='both', colors='white')
+
+    for i, v in enumerate(added_counts.values):
+        ax.text(i, v + 20, str(v), ha='center', va='bottom', color='white', fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_release_year_distribution(release_counts, fig_path):
+    plt.figure(figsize=(12, 6))
+    plt.style.use('dark_background')
+    plt.plot(release_counts.index, release_counts.values, marker='o', color='#E50914', linewidth=2.5)
+
+    plt.title("Yıllara Göre Film ve Dizilerin Piyasaya Çıkış Yoğunluğu", fontsize=14, color='white')
+    plt.xlabel("Yayın Yılı", fontsize=12, color='white')
+    plt.ylabel("İçerik Sayısı", fontsize=12, color='white')
+
+    for x, y in zip(release_counts.index, release_counts.values):
+        plt.text(x, y + 20, str(y), ha='center', va='bottom', fontsize=9, color='white')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.3, color='#555555')
+    plt.tick_params(axis='both', colors='white')
+    _netflix_axes(plt.gca())
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_added_year_by_type(added_counts_by_type, fig_path):
+    plt.figure(figsize=(12, 6))
+
+    plt.style.use('dark_background')
+    colors = ['#E50914', '#831010']
+
+    added_counts_by_type.plot(kind='bar', color=colors, edgecolor='black', width=0.8, ax=plt.gca())
+
+    plt.title("Netflix'e Eklenme Yılına Göre Film ve Dizi Sayısı", fontsize=14, color='white')
+    plt.xlabel("Eklenme Yılı", fontsize=12, color='white')
+    plt.ylabel("İçerik Sayısı", fontsize=12, color='white')
+
+    plt.grid(axis='y', linestyle='--', alpha=0.3, color='#555555')
+
+    _netflix_axes(plt.gca())
+
+    plt.tick_params(axis='both', colors='white')
+
+    plt.legend(facecolor='#222222', edgecolor='#444444', labelcolor='white')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_delay_trend(delay_by_added_year, fig_path):
+    plt.figure(figsize=(12, 6))
+
+    plt.style.use('dark_background')
+    plt.plot(delay_by_added_year.index, delay_by_added_year.values, marker='o', linewidth=2.5, color='#E50914')
+
+    plt.title("Yıllara Göre Netflix'e Eklenme Gecikmesi Trendi", fontsize=14, color='white')
+    plt.xlabel("Eklenme Yılı", fontsize=12, color='white')
+    plt.ylabel("Ortalama Gecikme (Yıl)", fontsize=12, color='white')
+
+    plt.grid(linestyle='--', alpha=0.3, color='#555555')
+
+    _netflix_axes(plt.gca())
+
+    plt.tick_params(axis='both', colors='white')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+def plot_delay_quantiles(delay_quantiles, fig_path):
+    plt.figure(figsize=(12, 6))
+
+    plt.style.use('dark_background')
+    for column, color in zip(delay_quantiles.columns, ['#E50914', '#FF5252', '#831010']):
+        plt.plot(delay_quantiles.index, delay_quantiles[column].values, marker='o', linewidth=2.5, color=color,
+                 label=column)
+
+    plt.title("Yıllara Göre Netflix'e Eklenme Gecikmesi: Medyan ve p90", fontsize=14, color='white')
+    plt.xlabel("Eklenme Yılı", fontsize=12, color='white')
+    plt.ylabel("Gecikme (Yıl)", fontsize=12, color='white')
+
+    plt.grid(linestyle='--', alpha=0.3, color='#555555')
+
+    _netflix_axes(plt.gca())
+
+    plt.tick_params(axis='both', colors='white')
+
+    plt.legend(facecolor='#222222', edgecolor='#444444', labelcolor='white')
+
+    plt.tight_layout()
+    plt.savefig(fig_path, facecolor='black', edgecolor='none')
+
+
+# Grafikler: (dosya adı, çizim fonksiyonu, sonuç anahtarı, etiket)
+CHARTS = [
+    ("netflix_added_year_distribution_netflix.png", plot_added_year_distribution, 'added_counts',
+     "Netflix'e eklenme yılı grafiği"),
+    ("netflix_release_year_distribution_2000s.png", plot_release_year_distribution, 'release_counts',
+     "Piyasaya çıkış yılı grafiği"),
+    ("netflix_added_year_by_type_netflix.png", plot_added_year_by_type, 'added_counts_by_type',
+     "Film vs Dizi eklenme yılı grafiği"),
+    ("netflix_delay_trend_netflix.png", plot_delay_trend, 'delay_by_added_year',
+     "Gecikme trendi grafiği"),
+    ("netflix_delay_quantiles_netflix.png", plot_delay_quantiles, 'delay_quantiles',
+     "Gecikme yüzdelikleri grafiği"),
+]
+
+
+def render_years(results, fig_dir='graphics', show=False):
+    """years.py grafiklerini üret; mevcut grafikler yeniden çizilmez"""
+    os.makedirs(fig_dir, exist_ok=True)
+    for filename, plot, key, label in CHARTS:
+        fig_path = os.path.join(fig_dir, filename)
+        if os.path.exists(fig_path):
+            print(f"{label} zaten mevcut: {fig_path}")
+            continue
+
+        plot(results[key], fig_path)
+        print(f"{label} kaydedildi: {fig_path}")
+        if show:
+            plt.show()
+        plt.close()
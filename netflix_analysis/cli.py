@@ -0,0 +1,314 @@
+"""netflix-analysis: grafik çizmeden toplu sorguları yanıtlayan komut satırı aracı.
+
+Örnekler:
+    python -m netflix_analysis counts --by rating_group --type Movie
+    python -m netflix_analysis top country -n 5 --year-range 2015-2020
+    python -m netflix_analysis trend --year-field year_added --by type --format csv
+    python -m netflix_analysis trend --year-field year_added --by type --metric minutes --window 3 --yoy
+    python -m netflix_analysis crosstab country type --rating-group Yetişkin
+    python -m netflix_analysis top country --region "Latin Amerika" -n 5
+    python -m netflix_analysis forecast --country "United States" --model poly --year 2025
+    python -m netflix_analysis forecast --model exp --interval bootstrap --level 0.9
+    python -m netflix_analysis search "stranger thin" --mode prefix
+    python -m netflix_analysis search "narcos mexco" --mode fuzzy -n 5
+    python -m netflix_analysis similar "Stranger Things" -n 5
+    python -m netflix_analysis similar s123 --type Movie --country India
+    python -m netflix_analysis duplicates -n 20
+    python -m netflix_analysis clusters -k 8 --metric cosine --method kmeans
+    python -m netflix_analysis clusters --by-year --year-field year_added --format csv
+    python -m netflix_analysis counts --by year_added --dedupe
+    python -m netflix_analysis validate --severity error
+    python -m netflix_analysis validate --rule placeholder --rows -n 20 --format csv
+    python -m netflix_analysis snapshot add --data dumps/2024-05-02.csv --date 2024-05-02
+    python -m netflix_analysis snapshot diff 2024-05-01 2024-05-02 --format csv
+
+Ağır modüller (pandas, scipy) yalnızca ilgili alt komut çalışırken içe aktarılır.
+"""
+import argparse
+import csv
+import json
+import sys
+
+# queries.DIMENSIONS ile aynı; pandas'ı yüklememek için burada tekrar tanımlı
+DIMENSIONS = ['type', 'rating', 'rating_group', 'release_year', 'year_added', 'country', 'category', 'director']
+YEAR_FIELDS = ['release_year', 'year_added']
+FORECAST_MODELS = ['linear', 'poly', 'exp', 'logistic']
+# queries.TREND_METRICS ile aynı
+TREND_METRICS = ['minutes', 'seasons', 'delay']
+# intervals.INTERVAL_METHODS ile aynı
+INTERVAL_METHODS = ['delta', 'bootstrap']
+# title_index.SEARCH_MODES ile aynı
+SEARCH_MODES = ['exact', 'tokens', 'prefix', 'fuzzy']
+# validation.RULES ve validation.SEVERITIES ile aynı
+VALIDATION_RULES = ['missing_value', 'duplicate_id', 'invalid_type', 'unparseable_date', 'invalid_year',
+                    'release_after_added', 'malformed_duration', 'duration_unit_mismatch', 'placeholder']
+SEVERITIES = ['error', 'warning']
+# country_clusters.METRICS ve country_clusters.METHODS ile aynı
+CLUSTER_METRICS = ['jensenshannon', 'cosine']
+CLUSTER_METHODS = ['hierarchical', 'kmeans']
+
+
+def parse_year_range(text):
+    """'2015-2020' veya '2018' biçimindeki yıl aralığı"""
+    try:
+        if '-' in text:
+            start, end = text.split('-', 1)
+            return int(start), int(end)
+        return int(text), int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"geçersiz yıl aralığı: {text!r} (örnek: 2015-2020)")
+
+
+def parse_level(text):
+    try:
+        level = float(text)
+    except ValueError:
+        level = None
+    if level is None or not 0 < level < 1:
+        raise argparse.ArgumentTypeError(f"geçersiz aralık düzeyi: {text!r} (0 ile 1 arasında olmalı, örn. 0.9)")
+    return level
+
+
+def parse_window(text):
+    try:
+        window = int(text)
+    except ValueError:
+        window = None
+    if window is None or window < 1:
+        raise argparse.ArgumentTypeError(f"geçersiz pencere: {text!r} (pozitif bir yıl sayısı olmalı, örn. 3)")
+    return window
+
+
+def parse_count(text):
+    try:
+        count = int(text)
+    except ValueError:
+        count = None
+    if count is None or count < 0:
+        raise argparse.ArgumentTypeError(f"geçersiz sayı: {text!r} (negatif olmayan bir tam sayı olmalı, örn. 10)")
+    return count
+
+
+def build_parser():
+    # Tüm alt komutların ortak seçenekleri (alt komuttan sonra da yazılabilsin diye)
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument('--data', default='data/netflix1.csv', help="veri dosyası")
+    filters.add_argument('--no-cache', action='store_true', help="katalog önbelleğini kullanma")
+    filters.add_argument('--format', choices=['json', 'csv'], default='json', help="çıktı biçimi")
+    filters.add_argument('--country', action='append', help="ülke filtresi (birden fazla verilebilir)")
+    filters.add_argument('--type', action='append', choices=['Movie', 'TV Show'], help="içerik türü filtresi")
+    filters.add_argument('--year-range', type=parse_year_range, help="yıl aralığı, örn. 2015-2020")
+    filters.add_argument('--year-field', choices=YEAR_FIELDS, default='release_year',
+                         help="yıl filtresinin ve trendin kullandığı sütun (varsayılan: release_year)")
+    filters.add_argument('--rating-group', action='append', help="rating grubu filtresi, örn. Yetişkin")
+    filters.add_argument('--region', action='append', help="ülke bölgesi filtresi, örn. Avrupa")
+    filters.add_argument('--dedupe', action='store_true', help="tekrar listelenen içerikleri bir kez say")
+
+    parser = argparse.ArgumentParser(prog='netflix-analysis', description="Netflix kataloğu üzerinde hızlı sorgular")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    counts = subparsers.add_parser('counts', parents=[filters], help="bir boyuta göre içerik sayıları")
+    counts.add_argument('--by', choices=DIMENSIONS, required=True)
+
+    top = subparsers.add_parser('top', parents=[filters], help="en çok içeriğe sahip değerler")
+    top.add_argument('dimension', choices=DIMENSIONS)
+    top.add_argument('-n', type=parse_count, default=10)
+
+    trend = subparsers.add_parser('trend', parents=[filters], help="yıllara göre içerik sayısı")
+    trend.add_argument('--by', choices=DIMENSIONS)
+    trend.add_argument('--metric', choices=TREND_METRICS,
+                       help="sayı yerine ortalaması alınacak metrik (delay: eklenme yılı - yayın yılı)")
+    trend.add_argument('--window', type=parse_window, help="kayan pencere genişliği (yıl)")
+    trend.add_argument('--yoy', action='store_true', help="bir önceki yıla göre büyüme oranı")
+
+    crosstab = subparsers.add_parser('crosstab', parents=[filters], help="iki boyutun çapraz tablosu")
+    crosstab.add_argument('row', choices=DIMENSIONS)
+    crosstab.add_argument('column', choices=DIMENSIONS)
+
+    forecast = subparsers.add_parser('forecast', parents=[filters], help="büyüme modeli tahmini")
+    forecast.add_argument('--model', choices=FORECAST_MODELS, default='poly')
+    forecast.add_argument('--year', type=int, default=2025)
+    forecast.add_argument('--interval', choices=INTERVAL_METHODS, default='delta',
+                          help="tahmin aralığı yöntemi: delta (kovaryanstan) veya bootstrap (artık bootstrap)")
+    forecast.add_argument('--level', type=parse_level, default=0.95, help="aralık düzeyi (varsayılan: 0.95)")
+
+    search = subparsers.add_parser('search', parents=[filters], help="başlık araması")
+    search.add_argument('query')
+    search.add_argument('--mode', choices=SEARCH_MODES, default='tokens',
+                        help="exact: başlığın tamamı, tokens: tüm kelimeler, prefix: son kelime önek, "
+                             "fuzzy: yazım hatalarına toleranslı (varsayılan: tokens)")
+    search.add_argument('-n', type=parse_count, default=10)
+
+    similar = subparsers.add_parser('similar', parents=[filters], help="içerik özelliklerine göre benzer içerikler")
+    similar.add_argument('title', help="show_id veya başlık")
+    similar.add_argument('-n', type=parse_count, default=10)
+
+    duplicates = subparsers.add_parser('duplicates', parents=[filters],
+                                       help="farklı show_id'lerle tekrar listelenen içerikler")
+    duplicates.add_argument('-n', type=parse_count, help="en fazla bu kadar grup")
+
+    clusters = subparsers.add_parser('clusters', parents=[filters],
+                                     help="ülkelerin kategori/tür/yaş sınırı profillerine göre kümeleri")
+    clusters.add_argument('-k', '--clusters', type=int, default=6, help="küme sayısı (varsayılan: 6)")
+    clusters.add_argument('--metric', choices=CLUSTER_METRICS, default='jensenshannon', help="profil uzaklığı")
+    clusters.add_argument('--method', choices=CLUSTER_METHODS, default='hierarchical', help="kümeleme yöntemi")
+    clusters.add_argument('--by-year', action='store_true',
+                          help="ülke yerine ülke-yıl gruplarını kümele (yıl: --year-field)")
+
+    validate = subparsers.add_parser('validate', parents=[filters], help="veri doğrulama raporu")
+    validate.add_argument('--rule', action='append', choices=VALIDATION_RULES, help="kural filtresi")
+    validate.add_argument('--severity', choices=SEVERITIES, help="yalnızca bu düzeydeki ihlaller")
+    validate.add_argument('--rows', action='store_true', help="sayılar yerine ihlal eden satırları listele")
+    validate.add_argument('-n', type=parse_count, default=100, help="--rows ile listelenecek en fazla satır")
+
+    snapshot = subparsers.add_parser('snapshot', help="tarihli katalog dökümleri ve aralarındaki farklar")
+    snapshot_commands = snapshot.add_subparsers(dest='snapshot_command', required=True)
+    snapshot_options = argparse.ArgumentParser(add_help=False)
+    snapshot_options.add_argument('--snapshot-dir', default='cache/snapshots', help="anlık görüntü dizini")
+    snapshot_options.add_argument('--format', choices=['json', 'csv'], default='json', help="çıktı biçimi")
+
+    snapshot_add = snapshot_commands.add_parser('add', parents=[snapshot_options],
+                                                help="dökümü kaydet ve önceki anlık görüntüyle farkını göster")
+    snapshot_add.add_argument('--data', default='data/netflix1.csv', help="veri dosyası")
+    snapshot_add.add_argument('--date', type=parse_date, help="döküm tarihi, örn. 2024-05-01 (varsayılan: bugün)")
+
+    snapshot_diff = snapshot_commands.add_parser('diff', parents=[snapshot_options],
+                                                 help="iki anlık görüntü arasındaki fark")
+    snapshot_diff.add_argument('old', type=parse_date)
+    snapshot_diff.add_argument('new', type=parse_date)
+
+    snapshot_commands.add_parser('list', parents=[snapshot_options], help="kayıtlı anlık görüntüler")
+
+    return parser
+
+
+def parse_date(text):
+    """'YYYY-MM-DD' biçimindeki tarih"""
+    import datetime
+
+    try:
+        return datetime.date.fromisoformat(text).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"geçersiz tarih: {text!r} (örnek: 2024-05-01)")
+
+
+def run_snapshot(args):
+    import datetime
+
+    from netflix_analysis import snapshots
+
+    store = snapshots.SnapshotStore(args.snapshot_dir)
+
+    if args.snapshot_command == 'list':
+        return [{'date': date} for date in store.dates()]
+
+    if args.snapshot_command == 'add':
+        date = args.date or datetime.date.today().isoformat()
+        delta, changes, _ = snapshots.record_snapshot(store, args.data, date)
+    else:
+        for date in (args.old, args.new):
+            if date not in store.dates():
+                raise ValueError(f"{date} tarihli anlık görüntü yok")
+        delta, changes = snapshots.diff_snapshots(store, args.old, args.new)
+
+    if delta is not None:
+        summary = delta.summary()
+        print(f"{summary['old_date']} -> {summary['new_date']}: {summary['added']} eklendi, "
+              f"{summary['removed']} silindi, {summary['changed']} değişti", file=sys.stderr)
+    return snapshots.change_records(delta, changes)
+
+
+def run_query(args):
+    from netflix_analysis import queries
+    from netflix_analysis.catalog import load_catalog
+
+    catalog = load_catalog(args.data, use_cache=not args.no_cache, dedupe=args.dedupe)
+    filters = {
+        'country': args.country,
+        'type': args.type,
+        'year_range': args.year_range,
+        'rating_group': args.rating_group,
+        'region': args.region,
+    }
+    mask = catalog.mask(year_field=args.year_field, **filters)
+
+    if args.command == 'counts':
+        return queries.counts(catalog, args.by, mask)
+    if args.command == 'top':
+        return queries.top(catalog, args.dimension, mask, n=args.n)
+    if args.command == 'trend':
+        return queries.trend(catalog, mask, year_field=args.year_field, by=args.by, metric=args.metric,
+                             window=args.window, yoy=args.yoy)
+    if args.command == 'crosstab':
+        return queries.crosstab(catalog, args.row, args.column, mask)
+    if args.command == 'search':
+        return queries.search(catalog, args.query, mask, mode=args.mode, n=args.n)
+    if args.command == 'similar':
+        return queries.similar(catalog, args.title, mask, n=args.n)
+    if args.command == 'duplicates':
+        return queries.duplicates(catalog, mask, n=args.n)
+    if args.command == 'clusters':
+        from netflix_analysis.country_clusters import CLUSTERS_DIR
+
+        return queries.country_clusters(catalog, mask, n_clusters=args.clusters, metric=args.metric,
+                                        method=args.method, by_year=args.by_year, year_field=args.year_field,
+                                        cache_dir=CLUSTERS_DIR if not args.no_cache else None)
+    if args.command == 'validate':
+        if catalog.validation is not None:
+            summary = catalog.validation.summary(mask)
+            errors = sum(record['rows'] for record in summary if record['severity'] == 'error')
+            warnings = sum(record['rows'] for record in summary if record['severity'] == 'warning')
+            print(f"{int(mask.sum())} içerik doğrulandı: {errors} hata, {warnings} uyarı", file=sys.stderr)
+        return queries.validation(catalog, mask, rules=args.rule, severity=args.severity, rows=args.rows, n=args.n)
+    if args.command == 'forecast':
+        from netflix_analysis.model_registry import REGISTRY_PATH, ModelRegistry
+
+        registry = ModelRegistry(REGISTRY_PATH if not args.no_cache else None)
+        if args.year_range and args.year_field != 'release_year':
+            # Seri adı hangi yıl sütununun filtrelendiğini de içermeli
+            filters[f'{args.year_field}_range'] = filters.pop('year_range')
+        result = queries.forecast(catalog, registry, filters, mask, model=args.model, year=args.year,
+                                  interval=args.interval, level=args.level)
+        registry.save()
+        return result
+
+    raise ValueError(f"bilinmeyen komut: {args.command}")
+
+
+def write_records(records, fmt, out=sys.stdout):
+    if fmt == 'json':
+        json.dump(records, out, ensure_ascii=False, indent=2)
+        out.write('\n')
+        return
+
+    fieldnames = []
+    for record in records:
+        for key in record:
+            if key not in fieldnames:
+                fieldnames.append(key)
+    writer = csv.DictWriter(out, fieldnames=fieldnames, lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(records)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        records = run_snapshot(args) if args.command == 'snapshot' else run_query(args)
+    except FileNotFoundError as e:
+        print(f"Veri dosyası bulunamadı: {getattr(args, 'data', None) or e.filename}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"Sorgu çalıştırılamadı: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        write_records(records, args.format)
+    except BrokenPipeError:
+        # Çıktı `head` gibi bir komuta bağlandığında sessizce çık
+        sys.stderr.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
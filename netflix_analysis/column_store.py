@@ -0,0 +1,225 @@
+"""Kataloğun bellek eşlemeli (mmap) sütun deposu.
+
+Her sütun ve indeks dizisi ayrı bir .npy dosyasıdır; metin sütunları int32 kodlar ve sabit genişlikli
+(numpy 'U') bir sözlük olarak saklanır. Dosyalar `np.load(mmap_mode='r')` ile açıldığından istenen sayıda
+süreç aynı depoyu kopyalamadan okur; paylaşımı işletim sisteminin sayfa önbelleği yapar.
+
+Depo `cache/catalog/<anahtar>/` dizinine yazılır, `cache/catalog/CURRENT` geçerli dizinin adını tutar.
+Yeni bir depo önce geçici dizine yazılıp CURRENT atomik olarak değiştirilir. `open_store` deponun bütün
+dosyalarını açılışta eşler; eski dizin silindiğinde onu açmış süreçler eşlenmiş dosyalardan okumaya devam eder.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.catalog import MULTI_VALUE_COLUMNS, Bridge, Catalog
+from netflix_analysis.dimensions import CountryTable
+from netflix_analysis.duplicates import DuplicateIndex
+from netflix_analysis.neighbors import NeighborIndex
+from netflix_analysis.title_index import TitleIndex
+
+# Depo biçimi değiştiğinde artırılır; eski depolar yeniden oluşturulur
+STORE_FORMAT = 1
+
+CURRENT_FILE = 'CURRENT'
+
+
+def _save(directory, name, array):
+    np.save(os.path.join(directory, f'{name}.npy'), np.ascontiguousarray(array), allow_pickle=False)
+
+
+def _load(directory, name):
+    return np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r', allow_pickle=False)
+
+
+def _dictionary(values):
+    """Metin değerlerini sabit genişlikli numpy dizisine çevir (boş sözlükte de en az 1 karakter)"""
+    values = [str(value) for value in values]
+    width = max([len(value) for value in values] + [1])
+    return np.array(values, dtype=f'U{width}')
+
+
+def encode_strings(values):
+    """Metin sütununu (kodlar, sözlük) olarak kodla; eksik değerlerin kodu -1"""
+    codes, uniques = pd.factorize(values)
+    return codes.astype(np.int32), _dictionary(uniques)
+
+
+def decode_strings(codes, dictionary, dtype):
+    values = np.empty(len(codes), dtype=object)
+    present = codes >= 0
+    values[present] = dictionary[codes[present]].tolist()
+    values[~present] = None
+    return pd.Series(values, dtype=dtype)
+
+
+class StoredColumns:
+    """Depodaki DataFrame sütunları; DataFrame yalnızca istendiğinde oluşturulur.
+
+    Dosyalar burada eşlenir (mmap, veri okunmaz): dizin daha sonra silinse de sütunlar okunabilir kalır.
+    """
+
+    def __init__(self, directory, specs, length):
+        self.directory = directory
+        self.specs = specs
+        self.length = length
+        self.arrays = {}
+        for name, spec in specs.items():
+            if spec['kind'] == 'strings':
+                self.arrays[name] = _load(directory, f'df.{name}.codes'), _load(directory, f'df.{name}.dict')
+            else:
+                self.arrays[name] = _load(directory, f'df.{name}')
+
+    def __len__(self):
+        return self.length
+
+    def encoded(self, name):
+        """Metin sütunları için (kodlar, sözlük), diğerleri için değer dizisi (mmap, kopyasız)"""
+        return self.arrays[name]
+
+    def frame(self):
+        columns = {}
+        for name, spec in self.specs.items():
+            if spec['kind'] == 'strings':
+                codes, dictionary = self.encoded(name)
+                columns[name] = decode_strings(codes, dictionary, spec['dtype'])
+            else:
+                # Sayısal sütunlar mmap dizisinin kopyası olarak alınır (pandas yazılabilir dizi bekler)
+                columns[name] = pd.Series(np.array(self.encoded(name)), dtype=spec['dtype'])
+        return pd.DataFrame(columns)
+
+
+def _write_bridge(directory, prefix, bridge):
+    for part in ('rows', 'codes', 'order', 'offsets'):
+        _save(directory, f'{prefix}.{part}', getattr(bridge, part))
+    _save(directory, f'{prefix}.values', _dictionary(bridge.values))
+    if bridge.aliases:
+        _save(directory, f'{prefix}.alias_names', _dictionary(bridge.aliases))
+        _save(directory, f'{prefix}.alias_codes', np.array(list(bridge.aliases.values()), dtype=np.int32))
+
+
+def _read_bridge(directory, prefix):
+    aliases = None
+    if os.path.exists(os.path.join(directory, f'{prefix}.alias_names.npy')):
+        names = _load(directory, f'{prefix}.alias_names').tolist()
+        aliases = dict(zip(names, _load(directory, f'{prefix}.alias_codes').tolist()))
+    return Bridge.from_arrays(*(_load(directory, f'{prefix}.{part}')
+                                for part in ('rows', 'codes', 'values', 'order', 'offsets')), aliases=aliases)
+
+
+def write_store(catalog, root, key, cache_format=None):
+    """Kataloğu (sütunlar, köprü tabloları, başlık indeksi, ülke tablosu) depoya yaz"""
+    name = hashlib.sha1(json.dumps(key).encode('utf-8')).hexdigest()[:16]
+    directory = os.path.join(root, name)
+    tmp_directory = directory + '.tmp'
+    shutil.rmtree(tmp_directory, ignore_errors=True)
+    os.makedirs(tmp_directory)
+
+    specs = {}
+    for column, values in catalog.df.items():
+        if values.dtype.kind in 'biufmM':
+            specs[column] = {'kind': 'values', 'dtype': str(values.dtype)}
+            _save(tmp_directory, f'df.{column}', values.values)
+        else:
+            codes, dictionary = encode_strings(values)
+            specs[column] = {'kind': 'strings', 'dtype': str(values.dtype)}
+            _save(tmp_directory, f'df.{column}.codes', codes)
+            _save(tmp_directory, f'df.{column}.dict', dictionary)
+
+    for dimension in MULTI_VALUE_COLUMNS:
+        _write_bridge(tmp_directory, f'bridge.{dimension}', catalog.bridge(dimension))
+
+    titles = catalog.titles()
+    _save(tmp_directory, 'titles.normalized', _dictionary(titles.normalized))
+    _save(tmp_directory, 'titles.trigram_counts', titles.trigram_counts)
+    _write_bridge(tmp_directory, 'titles.tokens', titles.tokens)
+    _write_bridge(tmp_directory, 'titles.trigrams', titles.trigrams)
+
+    countries = catalog.countries()
+    _save(tmp_directory, 'countries.names', _dictionary(countries.names))
+    _save(tmp_directory, 'countries.main_codes', countries.main_codes)
+
+    duplicates = catalog.duplicates()
+    _save(tmp_directory, 'duplicates.representatives', duplicates.representatives)
+    _save(tmp_directory, 'duplicates.exact', duplicates.exact)
+
+    neighbors = catalog.neighbors()
+    _save(tmp_directory, 'neighbors.rows', neighbors.rows)
+    _save(tmp_directory, 'neighbors.scores', neighbors.scores)
+
+    # Doğrulama raporu: her (kural, sütun) için ihlal eden satırlar ve sözlük kodlu ham değerler
+    validation = None
+    if catalog.validation is not None:
+        validation = []
+        for i, ((rule, column), (rows, values)) in enumerate(catalog.validation.entries.items()):
+            codes, dictionary = encode_strings(values)
+            _save(tmp_directory, f'validation.{i}.rows', rows)
+            _save(tmp_directory, f'validation.{i}.codes', codes)
+            _save(tmp_directory, f'validation.{i}.dict', dictionary)
+            validation.append([rule, column])
+
+    manifest = {'format': STORE_FORMAT, 'cache_format': cache_format, 'key': list(key), 'version': catalog.version,
+                'length': len(catalog.df), 'columns': specs, 'validation': validation}
+    with open(os.path.join(tmp_directory, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_directory, directory)
+
+    current_tmp = os.path.join(root, CURRENT_FILE + '.tmp')
+    with open(current_tmp, 'w', encoding='utf-8') as f:
+        f.write(name)
+    os.replace(current_tmp, os.path.join(root, CURRENT_FILE))
+
+    # Eski depolar silinir; open_store bütün dosyaları açılışta eşlediğinden onları açmış süreçler okumaya devam eder
+    for entry in os.listdir(root):
+        if entry not in (name, CURRENT_FILE) and os.path.isdir(os.path.join(root, entry)):
+            shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+    return directory
+
+
+def current_store(root):
+    """Geçerli deponun dizini ve manifest'i; depo yoksa veya bozuksa (None, None)"""
+    try:
+        with open(os.path.join(root, CURRENT_FILE), encoding='utf-8') as f:
+            directory = os.path.join(root, f.read().strip())
+        with open(os.path.join(directory, 'manifest.json'), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None, None
+    if manifest.get('format') != STORE_FORMAT:
+        return None, None
+    return directory, manifest
+
+
+def open_store(directory, manifest=None):
+    """Depoyu kopyalamadan aç ve Catalog döndür"""
+    if manifest is None:
+        with open(os.path.join(directory, 'manifest.json'), encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    bridges = {dimension: _read_bridge(directory, f'bridge.{dimension}') for dimension in MULTI_VALUE_COLUMNS}
+    titles = TitleIndex(_load(directory, 'titles.normalized'), _read_bridge(directory, 'titles.tokens'),
+                        _read_bridge(directory, 'titles.trigrams'), _load(directory, 'titles.trigram_counts'))
+    countries = CountryTable(_load(directory, 'countries.names'), _load(directory, 'countries.main_codes'))
+    duplicates = DuplicateIndex(_load(directory, 'duplicates.representatives'), _load(directory, 'duplicates.exact'))
+    neighbors = NeighborIndex(_load(directory, 'neighbors.rows'), _load(directory, 'neighbors.scores'))
+
+    validation = None
+    if manifest.get('validation') is not None:
+        from netflix_analysis.validation import ValidationReport
+
+        entries = {}
+        for i, (rule, column) in enumerate(manifest['validation']):
+            codes = _load(directory, f'validation.{i}.codes')
+            entries[rule, column] = (_load(directory, f'validation.{i}.rows'),
+                                     _load(directory, f'validation.{i}.dict')[codes])
+        validation = ValidationReport(entries, manifest['length'])
+
+    columns = StoredColumns(directory, manifest['columns'], manifest['length'])
+    return Catalog(None, manifest['version'], bridges, titles, countries, columns=columns, validation=validation,
+                   duplicate_index=duplicates, neighbor_index=neighbors)
@@ -0,0 +1,309 @@
+"""Ülkelerin içerik profillerine göre kümelenmesi.
+
+Her ülkenin (veya `by_year` ile her ülke ve eklenme yılının) profili kategori, tür ve yaş sınırı dağılımlarının
+ağırlıklı birleşimidir; her blok kendi içinde 1'e normalize edildiğinden profil bir olasılık dağılımıdır.
+Profiller tek bir seyrek çarpımla hesaplanır: grup x satır üyelik matrisi ile satır x özellik matrisi çarpılır,
+grup ya da satır başına Python döngüsü yoktur. Uzaklıklar (kosinüs veya Jensen-Shannon) bütün çiftler için
+vektörel olarak, satır blokları halinde hesaplanır.
+
+Kümeleme hiyerarşik (tam bağlantı) veya k-ortalamalar (Hellinger gömmesi, yani profillerin karekökü
+üzerinde) olabilir. Sonuçlar veri sürümü, filtre ve ayarlarla anahtarlanarak cache/country_clusters/ altında
+saklanır; aynı istek tekrarlandığında yeniden hesaplanmaz.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.catalog import CACHE_DIR, PLACEHOLDER
+
+CLUSTERS_DIR = os.path.join(CACHE_DIR, 'country_clusters')
+
+# Önbellek anahtarına katılır; profil veya kümeleme kuralları değiştiğinde artırılır
+CLUSTERS_FORMAT = 1
+
+# Profil blokları ve ağırlıkları (toplamı 1)
+PROFILE_WEIGHTS = {'category': 0.5, 'type': 0.25, 'rating': 0.25}
+
+METRICS = ['jensenshannon', 'cosine']
+METHODS = ['hierarchical', 'kmeans']
+
+DEFAULT_CLUSTERS = 6
+# Hiyerarşik kümelemede bağlantı türü; ortalama bağlantı tek içerikli ülkeleri ayrı kümelere ayırıyor
+LINKAGE = 'complete'
+# Profili bu sayıdan az içeriğe dayanan gruplar kümelenmez
+MIN_TITLES = 1
+
+# Ülke-yıl grup anahtarında yılın basamak tabanı
+YEAR_BASE = 10_000
+
+# Jensen-Shannon hesabında bir blokta tutulan (grup x grup x özellik) hücre sayısı üst sınırı; bloklar
+# önbelleğe sığacak kadar küçük tutulduğunda daha hızlı
+DISTANCE_CELLS = 1 << 20
+
+
+def _one_hot(values):
+    """Tek değerli sütundan (satır, kod) çiftleri ve değer adları; boş ve yer tutucu değerler atlanır"""
+    codes, names = pd.factorize(pd.Series(values).where(lambda column: column != PLACEHOLDER), sort=True)
+    rows = np.flatnonzero(codes >= 0)
+    return rows, codes[rows], [str(name) for name in names]
+
+
+def _blocks(catalog):
+    """Profil bloğu -> (satır, kod, özellik adları)"""
+    bridge = catalog.bridge('category')
+    placeholder = bridge.code_of(PLACEHOLDER)
+    known = bridge.codes != (placeholder if placeholder is not None else -1)
+    df = catalog.df
+    return {
+        'category': (bridge.rows[known], bridge.codes[known], [str(value) for value in bridge.values]),
+        'type': _one_hot(df['type'].values),
+        'rating': _one_hot(df['rating'].values),
+    }
+
+
+def _groups(catalog, mask, by_year, year_field):
+    """(grup, satır) üyelik çiftleri ve grup tablosu (ülke[, yıl])"""
+    table = catalog.countries()
+    bridge = catalog.bridge('country')
+    selected = np.isin(bridge.codes, table.codes_for(known=True)) & mask[bridge.rows]
+    rows, keys = bridge.rows[selected], bridge.codes[selected].astype(np.int64)
+    if by_year:
+        years = catalog.df[year_field].values[rows]
+        present = ~np.isnan(years)
+        # Grup anahtarı ülke kodu ve yıldan tek bir tamsayı
+        rows, keys = rows[present], keys[present] * YEAR_BASE + years[present].astype(np.int64)
+
+    codes, uniques = pd.factorize(keys, sort=True)
+    groups = pd.DataFrame({'country': table.names[uniques // YEAR_BASE if by_year else uniques]})
+    if by_year:
+        groups[year_field] = uniques % YEAR_BASE
+    return codes, rows, groups
+
+
+def profile_matrix(catalog, mask=None, by_year=False, year_field='year_added'):
+    """(grup tablosu, özellik adları, sayım matrisi, profil matrisi).
+
+    Grup tablosunda ülke ([yıl]) ve içerik sayısı bulunur. Sayımlar grup x özellik, profiller her bloğu
+    PROFILE_WEIGHTS ağırlığıyla 1'e normalize edilmiş ve satır toplamı 1 olan dağılımlardır.
+    """
+    from scipy import sparse
+
+    if mask is None:
+        mask = np.ones(len(catalog), dtype=bool)
+    group_codes, group_rows, groups = _groups(catalog, mask, by_year, year_field)
+    n_groups, n_rows = len(groups), len(catalog)
+    membership = sparse.csr_matrix((np.ones(len(group_rows)), (group_codes, group_rows)), shape=(n_groups, n_rows))
+    groups['titles'] = np.asarray(membership.sum(axis=1)).ravel().astype(np.int64)
+
+    names, counts, profiles = [], [], []
+    for block, (rows, codes, block_names) in _blocks(catalog).items():
+        features = sparse.csr_matrix((np.ones(len(rows)), (rows, codes)), shape=(n_rows, len(block_names)))
+        block_counts = (membership @ features).toarray()
+        totals = block_counts.sum(axis=1, keepdims=True)
+        counts.append(block_counts)
+        profiles.append(PROFILE_WEIGHTS[block] * np.divide(block_counts, totals, out=np.zeros_like(block_counts),
+                                                           where=totals > 0))
+        names.extend(f'{block}:{name}' for name in block_names)
+
+    profiles = np.hstack(profiles)
+    # Bloklarından biri boş olan grupların (ör. yaş sınırı hiç belirtilmemiş) profili yeniden 1'e tamamlanır
+    totals = profiles.sum(axis=1, keepdims=True)
+    profiles = np.divide(profiles, totals, out=np.zeros_like(profiles), where=totals > 0)
+    return groups, names, np.hstack(counts), profiles
+
+
+def pairwise_distances(profiles, metric='jensenshannon'):
+    """Bütün profil çiftleri arasındaki uzaklıklar (kare matris, köşegen 0).
+
+    jensenshannon: 2 tabanlı Jensen-Shannon uzaklığı (ıraksamanın karekökü, 0-1 arası).
+    cosine: 1 - kosinüs benzerliği.
+    """
+    n_groups = len(profiles)
+    if metric == 'cosine':
+        norms = np.linalg.norm(profiles, axis=1, keepdims=True)
+        unit = np.divide(profiles, norms, out=np.zeros_like(profiles), where=norms > 0)
+        distances = 1 - unit @ unit.T
+    elif metric == 'jensenshannon':
+        # p log p terimleri bir kez hesaplanır; her blokta yalnızca karışım (m = (p + q) / 2) terimi kalır:
+        # JS = (sum p log p + sum q log q) / 2 - sum m log m
+        # Yalnızca üst üçgen hesaplanır (her blok kendisinden sonraki gruplarla), alt üçgen aynalanır
+        entropy = _plogp(profiles).sum(axis=1)
+        distances = np.zeros((n_groups, n_groups))
+        block = max(1, DISTANCE_CELLS // max(n_groups * profiles.shape[1], 1))
+        for start in range(0, n_groups, block):
+            stop = min(start + block, n_groups)
+            mixture = (profiles[start:stop, None, :] + profiles[None, start:, :]) / 2
+            divergence = (entropy[start:stop, None] + entropy[None, start:]) / 2 - _plogp(mixture).sum(axis=2)
+            distances[start:stop, start:] = np.sqrt(np.maximum(divergence, 0))
+        distances = np.triu(distances, 1)
+        distances += distances.T
+    else:
+        raise ValueError(f"geçersiz uzaklık: {metric} (seçenekler: {', '.join(METRICS)})")
+    distances = np.clip((distances + distances.T) / 2, 0, None)
+    np.fill_diagonal(distances, 0)
+    return distances
+
+
+def _plogp(values):
+    """p * log2(p); p = 0 için 0"""
+    return values * np.log2(values, out=np.zeros_like(values), where=values > 0)
+
+
+def _relabel(labels, titles):
+    """Küme numaralarını toplam içerik sayısına göre azalan sırayla 1'den başlat"""
+    _, labels = np.unique(labels, return_inverse=True)
+    totals = np.bincount(labels, weights=titles)
+    rank = np.empty(len(totals), dtype=np.int64)
+    rank[np.argsort(-totals, kind='stable')] = np.arange(len(totals))
+    return rank[labels] + 1
+
+
+def cluster_profiles(profiles, distances, titles, n_clusters=DEFAULT_CLUSTERS, method='hierarchical', seed=0):
+    """(küme numaraları, ısı haritası sırası); numaralar toplam içerik sayısına göre büyükten küçüğe"""
+    from scipy.cluster.hierarchy import fcluster, leaves_list, linkage
+    from scipy.spatial.distance import squareform
+
+    n_groups = len(profiles)
+    n_clusters = max(1, min(n_clusters, n_groups))
+    if n_groups < 2:
+        return np.ones(n_groups, dtype=np.int64), np.arange(n_groups)
+
+    tree = linkage(squareform(distances, checks=False), method=LINKAGE)
+    order = leaves_list(tree)
+    if method == 'hierarchical':
+        labels = fcluster(tree, n_clusters, criterion='maxclust')
+    elif method == 'kmeans':
+        from scipy.cluster.vq import kmeans2
+
+        # Profillerin karekökleri arasındaki öklid uzaklığı Hellinger uzaklığıyla orantılıdır
+        _, labels = kmeans2(np.sqrt(profiles), n_clusters, minit='++', seed=seed)
+    else:
+        raise ValueError(f"geçersiz kümeleme yöntemi: {method} (seçenekler: {', '.join(METHODS)})")
+
+    labels = _relabel(labels, titles)
+    # Isı haritasında kümeler ardışık, küme içinde hiyerarşik yaprak sırası korunur
+    position = np.empty(n_groups, dtype=np.int64)
+    position[order] = np.arange(n_groups)
+    return labels, np.lexsort((position, labels))
+
+
+class CountryClusters:
+    """Kümeleme sonucu: grup tablosu (ülke[, yıl], içerik sayısı, küme), profiller ve uzaklıklar.
+
+    `order` ısı haritasındaki grup sırasıdır (kümeler ardışık).
+    """
+
+    def __init__(self, groups, features, profiles, distances, order, settings):
+        self.groups = groups
+        self.features = features
+        self.profiles = profiles
+        self.distances = distances
+        self.order = order
+        self.settings = settings
+
+    def __len__(self):
+        return len(self.groups)
+
+    @property
+    def labels(self):
+        """Isı haritası etiketleri: ülke veya 'ülke yıl'"""
+        year_field = self.settings.get('year_field')
+        if self.settings.get('by_year'):
+            return (self.groups['country'] + ' ' + self.groups[year_field].astype(str)).tolist()
+        return self.groups['country'].tolist()
+
+    def distance_frame(self):
+        """Isı haritası sırasıyla etiketlenmiş uzaklık tablosu"""
+        labels = np.asarray(self.labels, dtype=object)[self.order]
+        return pd.DataFrame(self.distances[np.ix_(self.order, self.order)], index=labels, columns=labels)
+
+    def top_features(self, n=3):
+        """Her kümenin ortalama profilinde en ağır basan `n` kategori (kümeler numara sırasıyla)"""
+        clusters = self.groups['cluster'].values
+        categories = np.array([name.startswith('category:') for name in self.features])
+        names = np.array([name.split(':', 1)[1] for name in self.features], dtype=object)[categories]
+        result = {}
+        for cluster in np.unique(clusters).tolist():
+            mean = self.profiles[clusters == cluster][:, categories].mean(axis=0)
+            result[cluster] = names[np.argsort(-mean, kind='stable')[:n]].tolist()
+        return result
+
+    def records(self):
+        """Grup başına kayıt: ülke[, yıl], içerik sayısı ve küme (küme ve içerik sayısına göre sıralı)"""
+        table = self.groups.sort_values(['cluster', 'titles'], ascending=[True, False], kind='stable')
+        return [{key: _plain(value) for key, value in record.items()} for record in table.to_dict('records')]
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp.npz'
+        meta = {'settings': self.settings, 'features': self.features, 'columns': list(self.groups.columns)}
+        np.savez(tmp_path, meta=np.array(json.dumps(meta, ensure_ascii=False)),
+                 countries=self.groups['country'].to_numpy(dtype=str),
+                 values=self.groups.drop(columns='country').values.astype(np.int64),
+                 profiles=self.profiles, distances=self.distances, order=self.order)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Kaydedilmiş sonucu oku; dosya yoksa veya bozuksa None"""
+        try:
+            with np.load(path) as data:
+                meta = json.loads(str(data['meta']))
+                groups = pd.DataFrame(data['values'], columns=meta['columns'][1:])
+                groups.insert(0, 'country', data['countries'].astype(object))
+                return cls(groups, meta['features'], data['profiles'], data['distances'], data['order'],
+                           meta['settings'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def _plain(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _cache_path(catalog, mask, settings, cache_dir):
+    if cache_dir is None or catalog.version is None:
+        return None
+    digest = hashlib.sha1(json.dumps([CLUSTERS_FORMAT, catalog.version, settings], sort_keys=True).encode())
+    if mask is not None and not mask.all():
+        digest.update(np.packbits(mask).tobytes())
+    return os.path.join(cache_dir, f'{digest.hexdigest()[:16]}.npz')
+
+
+def cluster_countries(catalog, mask=None, n_clusters=DEFAULT_CLUSTERS, metric='jensenshannon',
+                      method='hierarchical', by_year=False, year_field='year_added', min_titles=MIN_TITLES,
+                      cache_dir=CLUSTERS_DIR):
+    """Ülkeleri (veya ülke-yıl gruplarını) profillerine göre kümele; sonuç önbellekte varsa oradan okunur"""
+    if metric not in METRICS:
+        raise ValueError(f"geçersiz uzaklık: {metric} (seçenekler: {', '.join(METRICS)})")
+    if method not in METHODS:
+        raise ValueError(f"geçersiz kümeleme yöntemi: {method} (seçenekler: {', '.join(METHODS)})")
+    if n_clusters < 1:
+        raise ValueError(f"küme sayısı pozitif olmalı: {n_clusters}")
+    settings = {'n_clusters': n_clusters, 'metric': metric, 'method': method, 'by_year': by_year,
+                'year_field': year_field, 'min_titles': min_titles}
+    path = _cache_path(catalog, mask, settings, cache_dir)
+    if path is not None:
+        cached = CountryClusters.load(path)
+        if cached is not None:
+            return cached
+
+    groups, features, _, profiles = profile_matrix(catalog, mask, by_year, year_field)
+    kept = (groups['titles'] >= min_titles).values
+    groups, profiles = groups[kept].reset_index(drop=True), profiles[kept]
+    distances = pairwise_distances(profiles, metric)
+    labels, order = cluster_profiles(profiles, distances, groups['titles'].values, n_clusters, method)
+    groups['cluster'] = labels
+
+    clusters = CountryClusters(groups, features, profiles, distances, order, settings)
+    if path is not None:
+        clusters.save(path)
+    return clusters
+
+
+def analyze_country_clusters(catalog):
+    """Rapor için varsayılan ayarlarla ülke kümeleri"""
+    return {'clusters': cluster_countries(catalog)}
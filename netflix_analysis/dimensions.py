@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.catalog import PLACEHOLDER
+
+UNKNOWN_REGION = "Bilinmiyor"
+OTHER_REGION = "Diğer"
+
+REGION_COUNTRIES = {
+    "Kuzey Amerika": ['Canada', 'United States'],
+    "Latin Amerika": ['Argentina', 'Brazil', 'Chile', 'Colombia', 'Guatemala', 'Jamaica', 'Mexico', 'Paraguay',
+                      'Peru', 'Puerto Rico', 'Uruguay', 'Venezuela'],
+    "Avrupa": ['Austria', 'Belarus', 'Belgium', 'Bulgaria', 'Croatia', 'Cyprus', 'Czech Republic', 'Denmark',
+               'Finland', 'France', 'Georgia', 'Germany', 'Greece', 'Hungary', 'Iceland', 'Ireland', 'Italy',
+               'Luxembourg', 'Netherlands', 'Norway', 'Poland', 'Portugal', 'Romania', 'Russia', 'Serbia',
+               'Slovenia', 'Soviet Union', 'Spain', 'Sweden', 'Switzerland', 'Turkey', 'Ukraine', 'United Kingdom',
+               'West Germany'],
+    "Orta Doğu ve Kuzey Afrika": ['Egypt', 'Iran', 'Israel', 'Jordan', 'Kuwait', 'Lebanon', 'Saudi Arabia', 'Syria',
+                                  'United Arab Emirates'],
+    "Sahra Altı Afrika": ['Cameroon', 'Ghana', 'Kenya', 'Mauritius', 'Mozambique', 'Namibia', 'Nigeria', 'Senegal',
+                          'Somalia', 'South Africa', 'Zimbabwe'],
+    "Asya": ['Bangladesh', 'Cambodia', 'China', 'Hong Kong', 'India', 'Indonesia', 'Japan', 'Malaysia', 'Pakistan',
+             'Philippines', 'Singapore', 'South Korea', 'Taiwan', 'Thailand', 'Vietnam'],
+    "Okyanusya": ['Australia', 'New Zealand'],
+}
+
+COUNTRY_REGIONS = {country: region for region, countries in REGION_COUNTRIES.items() for country in countries}
+
+
+def is_unknown_country(name):
+    """Yer tutucu ("Not Given") içeren ülke değerleri"""
+    return PLACEHOLDER.lower() in name.lower()
+
+
+class CountryTable:
+    """Ülke boyut tablosu: kod -> ad, bölge ve "bilinmiyor" bayrağı.
+
+    Kodlar ülke köprü tablosunun kodlarıdır (ada göre alfabetik); filtreler ve sayımlar metin
+    karşılaştırması yerine bu kodlar üzerinden tamsayı dizileriyle yapılır. `main_codes[row]`
+    satırda ilk sırada yazılan ülkenin kodu, ülkesi olmayan satırlarda -1'dir.
+    """
+
+    def __init__(self, names, main_codes):
+        self.names = np.asarray(names, dtype=object)
+        self.unknown = np.array([is_unknown_country(name) for name in self.names], dtype=bool)
+        self.regions = np.array([UNKNOWN_REGION if unknown else COUNTRY_REGIONS.get(name, OTHER_REGION)
+                                 for name, unknown in zip(self.names, self.unknown)], dtype=object)
+        self.main_codes = main_codes
+        self._codes = {name: code for code, name in enumerate(self.names)}
+
+    @classmethod
+    def from_bridge(cls, bridge, n_rows):
+        # Köprü satırları satır içindeki yazım sırasını korur; her satırın ilk çifti ana ülkedir
+        main_codes = np.full(n_rows, -1, dtype=np.int16)
+        rows, first = np.unique(bridge.rows, return_index=True)
+        main_codes[rows] = bridge.codes[first]
+        return cls(bridge.values, main_codes)
+
+    def __len__(self):
+        return len(self.names)
+
+    def code_of(self, name):
+        return self._codes.get(name)
+
+    def codes_for(self, names=None, regions=None, known=None):
+        """Verilen adlara / bölgelere uyan ülke kodları (known=True ise yer tutucular hariç)"""
+        selected = np.ones(len(self), dtype=bool)
+        if names is not None:
+            named = np.zeros(len(self), dtype=bool)
+            named[[self._codes[name] for name in names if name in self._codes]] = True
+            selected &= named
+        if regions is not None:
+            selected &= np.isin(self.regions, list(regions))
+        if known is not None:
+            selected &= self.unknown != known
+        return np.flatnonzero(selected)
+
+    def main_counts(self):
+        """Her ülkenin ana ülke olarak geçtiği satır sayısı"""
+        return np.bincount(self.main_codes[self.main_codes >= 0], minlength=len(self))
+
+    def frame(self):
+        return pd.DataFrame({
+            'code': np.arange(len(self)),
+            'name': self.names,
+            'region': self.regions,
+            'unknown': self.unknown,
+        })
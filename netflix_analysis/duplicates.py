@@ -0,0 +1,296 @@
+"""Aynı içeriğin farklı show_id'lerle tekrar listelenmesinin (yeniden listeleme, bölgesel kopya) tespiti.
+
+Kesin tekrarlar: normalize edilmiş (başlık, yayın yılı, tür, direktörler) demetinin 64 bitlik parmak izi aynı
+olan satırlar. Direktörü bilinmeyen satırlarda direktörlerin yerine ana ülke (ilk listelenen ülke) kullanılır;
+ikisi de bilinmeyen satırlar kesin tekrar sayılmaz. Parmak izleri sütunlar üzerinde vektörel olarak hashlenir
+ve tek bir factorize ile gruplanır.
+
+Yakın tekrarlar: başlık trigramlarının Dice benzerliği eşiği geçen, türü ve başlıktaki sayıları aynı, yayın
+yılları en fazla bir yıl farklı ve direktörleri çelişmeyen satırlar; iki satırın da direktörü bilinmiyorsa
+ana ülkeleri bilinmeli ve aynı olmalı. Adaylar önek süzmesiyle bulunur:
+trigramlar seyreklik sırasına dizildiğinde iki başlık ancak ilk (en seyrek) birkaç trigramından birini
+paylaşıyorsa eşiği geçebilir. Bu trigramlar (tür, yıl, sayılar) anahtarıyla bloklanır ve yalnızca aynı
+bloktaki satırlar karşılaştırılır; tüm çiftler hiçbir zaman karşılaştırılmaz. Eşiği geçen az sayıdaki çift
+son olarak kelime kelime karşılaştırılır: yazım farkları tekrar sayılır, eklenmiş kelimeler sayılmaz.
+
+Eşleşmeler bağlı bileşenlere ayrılır; her grubun temsilcisi kataloğa ilk eklenen satırdır.
+"""
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.catalog import MULTI_VALUE_COLUMNS, PLACEHOLDER, Bridge
+from netflix_analysis.title_index import TitleIndex, title_trigrams
+
+# Yakın tekrar sayılması için gereken en düşük başlık trigram benzerliği (Dice katsayısı)
+SIMILARITY_THRESHOLD = 0.85
+
+# Yakın tekrarlarda yayın yılları arasında izin verilen en büyük fark
+YEAR_TOLERANCE = 1
+
+# Tekrar gruplarındaki satırların eşleşme türleri
+MATCH_KINDS = ['original', 'exact', 'near']
+
+# Grup kayıtlarında döndürülen sütunlar
+DUPLICATE_COLUMNS = ['show_id', 'title', 'type', 'release_year', 'director', 'country', 'date_added']
+
+# Başlıktaki sayılar ve Roma rakamları (devam filmleri): yakın tekrarlarda birebir aynı olmalı
+NUMBERS = r'\b(?:\d+|ii|iii|iv|vi|vii|viii|ix)\b'
+
+# Yakın tekrarlarda farklı yazılan kelimelerin trigram benzerliği en az bu kadar olmalı (yazım farkı)
+WORD_THRESHOLD = 0.5
+
+_MULTIPLIERS = (np.uint64(0xbf58476d1ce4e5b9), np.uint64(0x94d049bb133111eb))
+
+
+def _mix(values):
+    """splitmix64 karıştırma adımı; uint64 taşmaları sarmalanır"""
+    values = np.asarray(values).astype(np.uint64)
+    values ^= values >> np.uint64(30)
+    values *= _MULTIPLIERS[0]
+    values ^= values >> np.uint64(27)
+    values *= _MULTIPLIERS[1]
+    values ^= values >> np.uint64(31)
+    return values
+
+
+def _combine(*hashes):
+    """Hash dizilerini sıraya duyarlı olarak birleştir"""
+    result = np.zeros(len(hashes[0]), dtype=np.uint64)
+    for values in hashes:
+        result = _mix(result ^ values)
+    return result
+
+
+def _text_hash(values):
+    return pd.util.hash_array(np.asarray(values, dtype=object), categorize=True)
+
+
+def same_words(a, b):
+    """Normalize edilmiş iki başlık kelime kelime aynı mı; farklı kelimeler yalnızca yazım farkı olabilir.
+
+    Eklenmiş bir kelime (alt başlık, devam filmi, dil sürümü) başlığı başka bir içerik yapar; boşlukları
+    atılınca aynı olan başlıklar ('spider man' / 'spiderman') aynı sayılır.
+    """
+    a, b = a.split(), b.split()
+    if ''.join(a) == ''.join(b):
+        return True
+    # Kelimelerin hiçbiri birebir aynı değilse ('borderline' / 'borderliner') kanıt yetersiz sayılır
+    if len(a) != len(b) or not any(x == y for x, y in zip(a, b)):
+        return False
+    for x, y in zip(a, b):
+        if x != y:
+            x, y = title_trigrams(x), title_trigrams(y)
+            if 2 * len(x & y) < WORD_THRESHOLD * (len(x) + len(y)):
+                return False
+    return True
+
+
+def _director_sets(bridge, n_rows):
+    """Satır başına (yer tutucu hariç) kanonik direktör kümesinin sıradan bağımsız hash'i ve köprü çiftleri"""
+    placeholder = bridge.code_of(PLACEHOLDER)
+    known = bridge.codes != (placeholder if placeholder is not None else -1)
+    rows, codes = bridge.rows[known], bridge.codes[known]
+    hashes = np.zeros(n_rows, dtype=np.uint64)
+    np.add.at(hashes, rows, _mix(codes.astype(np.uint64) + np.uint64(1)))
+    return hashes, rows, codes
+
+
+def _main_countries(df):
+    """Satır başına ana ülkenin (ilk listelenen ülke) hash'i ve ülkenin bilinip bilinmediği"""
+    countries = df[MULTI_VALUE_COLUMNS['country']].str.split(',').str[0].str.strip()
+    known = (countries.notna() & (countries != '') & (countries != PLACEHOLDER)).values
+    return np.where(known, _text_hash(countries.fillna('').values), np.uint64(0)), known
+
+
+def _prefix_entries(trigrams, sizes, candidates, threshold):
+    """Aday satırların önek trigramları: (satır, trigram kodu) dizileri.
+
+    |x| trigramlı bir başlığın Dice >= t olan bir başlıkla en az a = ceil(t |x| / (2 - t)) trigramı ortaktır;
+    seyreklik sırasında ilk |x| - a + 1 trigramdan birini paylaşmayan iki başlık eşiği geçemez.
+    """
+    frequency = np.bincount(trigrams.codes, minlength=len(trigrams.values))
+    rank = np.empty(len(frequency), dtype=np.int64)
+    rank[np.lexsort((np.arange(len(frequency)), frequency))] = np.arange(len(frequency))
+
+    selected = candidates[trigrams.rows]
+    rows, codes = trigrams.rows[selected], trigrams.codes[selected]
+    order = np.lexsort((rank[codes], rows))
+    rows, codes = rows[order], codes[order]
+
+    first = np.r_[True, rows[1:] != rows[:-1]] if len(rows) else np.zeros(0, dtype=bool)
+    positions = np.arange(len(rows))
+    positions -= np.maximum.accumulate(np.where(first, positions, 0))
+    minimum_overlap = np.ceil(threshold * sizes[rows] / (2 - threshold) - 1e-9)
+    keep = positions < sizes[rows] - minimum_overlap + 1
+    return rows[keep], codes[keep]
+
+
+def _pairs(keys, rows, shifted_keys):
+    """Aynı blok anahtarını paylaşan satır çiftleri (i < j); kaydırılmış anahtarlar bir sonraki yılla eşleşir"""
+    entries = pd.DataFrame({'key': keys, 'j': rows})
+    same = pd.DataFrame({'key': keys, 'i': rows}).merge(entries, on='key')
+    same = same[same['i'] < same['j']]
+    shifted = pd.DataFrame({'key': shifted_keys, 'i': rows}).merge(entries, on='key')
+    i = np.concatenate([same['i'].values, shifted['i'].values])
+    j = np.concatenate([same['j'].values, shifted['j'].values])
+    # Çiftler tek bir int64 anahtarla tekilleştirilir (satır sayısı 2^31'i geçmez)
+    pairs = np.unique(np.minimum(i, j).astype(np.int64) << 32 | np.maximum(i, j))
+    return pairs >> 32, pairs & 0xffffffff
+
+
+class DuplicateIndex:
+    """Satır -> tekrar grubunun temsilci satırı; tekrarı olmayan satırlar kendilerini gösterir.
+
+    `exact[row]`, satırın temsilcisiyle aynı parmak izine sahip olduğunu (yakın değil kesin tekrar) belirtir.
+    """
+
+    def __init__(self, representatives, exact):
+        self.representatives = representatives
+        self.exact = exact
+
+    @classmethod
+    def build(cls, df, titles=None, directors=None, threshold=SIMILARITY_THRESHOLD):
+        """Ayrıştırılmış (veya ham) tablodan tekrarları bul.
+
+        `titles` (TitleIndex) ve `directors` (kanonik direktör köprüsü) verilmezse tablodan oluşturulur.
+        """
+        from scipy import sparse
+        from scipy.sparse.csgraph import connected_components
+
+        if titles is None:
+            titles = TitleIndex.build(df)
+        if directors is None:
+            from netflix_analysis.names import canonical_bridge
+
+            directors = canonical_bridge(Bridge.from_column(df[MULTI_VALUE_COLUMNS['director']]))
+
+        n_rows = len(df)
+        normalized = np.asarray(titles.normalized, dtype=object)
+        years = pd.to_numeric(df['release_year'], errors='coerce').values
+        year_codes = np.where(np.isnan(years), -1, years).astype(np.int64)
+        types = df['type'].values
+        type_hash = _text_hash(types)
+        director_hash, director_rows, director_codes = _director_sets(directors, n_rows)
+        known = np.bincount(director_rows, minlength=n_rows) > 0
+        country_hash, known_country = _main_countries(df)
+        has_title = normalized != ''
+
+        # Kesin tekrarlar: parmak izi aynı olan satırlar. Direktörü bilinmeyen satırlarda ana ülke de aynı
+        # olmalı; yalnızca başlığı, yılı ve türü aynı olan farklı yapımlar birleşmez
+        people_hash = np.where(known, director_hash, country_hash)
+        fingerprints = _combine(_text_hash(normalized), _mix(year_codes.view(np.uint64)), type_hash, people_hash)
+        groups, _ = pd.factorize(fingerprints)
+        groups = np.where(has_title & (known | known_country), groups, -1 - np.arange(n_rows))
+        first_of_group = pd.Series(np.arange(n_rows)).groupby(groups).transform('min').values
+
+        # Yakın tekrarlar: her kesin grubun bir satırı aday; önek trigramları (tür, yıl, sayılar) ile bloklanır
+        sizes = np.asarray(titles.trigram_counts, dtype=np.int64)
+        candidates = has_title & (first_of_group == np.arange(n_rows)) & (sizes > 0)
+        rows, codes = _prefix_entries(titles.trigrams, sizes, candidates, threshold)
+        digits = _text_hash(pd.Series(normalized).str.findall(NUMBERS).str.join(' ').values)
+        block = _combine(type_hash, digits)[rows]
+        code_hash = _mix(codes.astype(np.uint64))
+        keys = _combine(block, _mix(year_codes[rows].view(np.uint64)), code_hash)
+        shifted_keys = _combine(block, _mix((year_codes[rows] + YEAR_TOLERANCE).view(np.uint64)), code_hash)
+        i, j = _pairs(keys, rows, shifted_keys)
+
+        # Bloklama yalnızca adayları eler; her çift gerçek benzerlik ve alan kontrolünden geçer
+        ok = (types[i] == types[j]) & (np.abs(year_codes[i] - year_codes[j]) <= YEAR_TOLERANCE)
+        ok &= (year_codes[i] >= 0) & (year_codes[j] >= 0)
+        i, j = i[ok], j[ok]
+        trigrams = titles.trigrams
+        matrix = sparse.csr_matrix((np.ones(len(trigrams.rows)), (trigrams.rows, trigrams.codes)),
+                                   shape=(n_rows, len(trigrams.values)))
+        overlap = np.asarray(matrix[i].multiply(matrix[j]).sum(axis=1)).ravel()
+        ok = 2 * overlap >= threshold * (sizes[i] + sizes[j])
+
+        # Direktörler: ikisi de biliniyorsa en az bir ortak direktör olmalı; ikisi de bilinmiyorsa ana ülkeler
+        # bilinmeli ve aynı olmalı
+        people = sparse.csr_matrix((np.ones(len(director_rows)), (director_rows, director_codes)),
+                                   shape=(n_rows, len(directors.values)))
+        shared = np.asarray(people[i].multiply(people[j]).sum(axis=1)).ravel() > 0
+        same_country = known_country[i] & (country_hash[i] == country_hash[j])
+        ok &= shared | (known[i] != known[j]) | (~known[i] & ~known[j] & same_country)
+        i, j = i[ok], j[ok]
+
+        # Son kontrol kelime kelime yapılır; yalnızca bütün eşikleri geçen az sayıdaki çift için
+        ok = np.array([same_words(normalized[a], normalized[b]) for a, b in zip(i.tolist(), j.tolist())], dtype=bool)
+        i, j = i[ok], j[ok]
+
+        # Kesin gruplar ve yakın eşleşmeler tek grafikte birleştirilir
+        graph = sparse.coo_matrix((np.ones(n_rows + len(i)), (np.r_[np.arange(n_rows), i],
+                                                              np.r_[first_of_group, j])), shape=(n_rows, n_rows))
+        _, components = connected_components(graph, directed=False)
+
+        # Temsilci: kataloğa ilk eklenen satır (tarihi olmayanlar sona), eşitlikte ilk satır
+        added = pd.to_datetime(df['date_added'], errors='coerce').values.astype('datetime64[ns]').view(np.int64)
+        added = np.where(added == np.iinfo(np.int64).min, np.iinfo(np.int64).max, added)
+        order = np.lexsort((np.arange(n_rows), added, components))
+        first = np.r_[True, np.diff(components[order]) != 0] if n_rows else np.zeros(0, dtype=bool)
+        leaders = np.empty(components.max() + 1 if n_rows else 0, dtype=np.int64)
+        leaders[components[order[first]]] = order[first]
+        representatives = leaders[components]
+        exact = (fingerprints == fingerprints[representatives]) & (known | known_country)
+        return cls(representatives, exact)
+
+    def __len__(self):
+        return len(self.representatives)
+
+    @property
+    def keep(self):
+        """Tekilleştirilmiş katalogda kalan satırlar (her grubun temsilcisi ve tekrarı olmayanlar)"""
+        return self.representatives == np.arange(len(self))
+
+    @property
+    def duplicated(self):
+        return ~self.keep
+
+    def group_rows(self):
+        """Birden fazla satırı olan gruplardaki satırlar (temsilci, satır sırasıyla)"""
+        sizes = np.bincount(self.representatives, minlength=len(self))
+        rows = np.flatnonzero(sizes[self.representatives] > 1)
+        return rows[np.lexsort((rows, self.representatives[rows]))]
+
+    def match_kinds(self, rows):
+        return np.where(self.keep[rows], 'original', np.where(self.exact[rows], 'exact', 'near'))
+
+    def records(self, df, mask=None, n=None):
+        """Tekrar gruplarının satırları: grup (temsilcinin show_id'si), eşleşme türü ve içerik bilgileri.
+
+        `mask` verilirse en az bir satırı maskede olan gruplar, `n` verilirse ilk n grup alınır.
+        """
+        rows = self.group_rows()
+        groups = self.representatives[rows]
+        if mask is not None:
+            selected = np.zeros(len(self), dtype=bool)
+            selected[groups[mask[rows]]] = True
+            rows, groups = rows[selected[groups]], groups[selected[groups]]
+        if n is not None:
+            leaders = np.unique(groups)[:n]
+            keep = np.isin(groups, leaders)
+            rows, groups = rows[keep], groups[keep]
+
+        show_ids = df['show_id'].values
+        values = {column: df[column].values[rows] for column in DUPLICATE_COLUMNS if column in df}
+        kinds = self.match_kinds(rows)
+        records = []
+        for position, (row, group) in enumerate(zip(rows.tolist(), groups.tolist())):
+            record = {'group': show_ids[group], 'match': str(kinds[position])}
+            record.update({column: _plain(column_values[position]) for column, column_values in values.items()})
+            records.append(record)
+        return records
+
+
+def _plain(value):
+    if isinstance(value, np.datetime64):
+        return None if np.isnat(value) else str(value)[:10]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def dedupe_frame(df):
+    """Tekrarları atılmış tablo (her gruptan kataloğa ilk eklenen satır kalır); ham CSV tablolarıyla da çalışır"""
+    return df[DuplicateIndex.build(df).keep].reset_index(drop=True)
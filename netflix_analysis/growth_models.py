@@ -0,0 +1,236 @@
+import numpy as np
+
+# Yıllar hesaplamaları kolaylaştırmak için bu yıla göre normalize ediliyor (x = yıl - 2000)
+BASE_YEAR = 2000
+
+
+# İlk model: Lineer fonksiyon
+def linear_func(x, a, b):
+    return a * x + b
+
+
+# İkinci model: Polinom fonksiyon (2. derece)
+def poly_func(x, a, b, c):
+    return a * x ** 2 + b * x + c
+
+
+# Üçüncü model: Exponential fonksiyon
+def exp_func(x, a, b, c):
+    return a * np.exp(b * x) + c
+
+
+# Dördüncü model: Lojistik fonksiyon
+def logistic_func(x, L, k, x0):
+    return L / (1 + np.exp(-k * (x - x0)))
+
+
+MODELS = {
+    'linear': linear_func,
+    'poly': poly_func,
+    'exp': exp_func,
+    'logistic': logistic_func,
+}
+
+MODEL_LABELS = {
+    'linear': 'Lineer',
+    'poly': 'Polinom',
+    'exp': 'Üstel',
+    'logistic': 'Lojistik',
+}
+
+# Kapalı formda (en küçük kareler) çözülebilen modellerin polinom dereceleri
+CLOSED_FORM_DEGREES = {
+    'linear': 1,
+    'poly': 2,
+}
+
+# Üstel büyüme oranı için sınır: x = yıl - 2000 olduğundan |b| > 1 birkaç on yılda taşmaya yol açar
+MAX_EXP_RATE = 1.0
+MAX_LOGISTIC_RATE = 5.0
+
+
+def _jac_columns(*columns):
+    """Türev sütunlarını son eksende birleştir (n, k); sütunlar (B, n) ise (B, n, k)"""
+    return np.stack(np.broadcast_arrays(*columns), axis=-1)
+
+
+# Analitik Jacobian'lar (her sütun bir parametreye göre türev)
+def linear_jac(x, a, b):
+    x = np.asarray(x, dtype=float)
+    return _jac_columns(x, np.ones_like(x))
+
+
+def poly_jac(x, a, b, c):
+    x = np.asarray(x, dtype=float)
+    return _jac_columns(x ** 2, x, np.ones_like(x))
+
+
+def exp_jac(x, a, b, c):
+    x = np.asarray(x, dtype=float)
+    e = np.exp(b * x)
+    return _jac_columns(e, a * x * e, np.ones_like(x))
+
+
+def logistic_jac(x, L, k, x0):
+    x = np.asarray(x, dtype=float)
+    e = np.exp(-k * (x - x0))
+    s = 1 / (1 + e)
+    ds = L * e * s ** 2
+    return _jac_columns(s, (x - x0) * ds, -k * ds)
+
+
+JACOBIANS = {
+    'linear': linear_jac,
+    'poly': poly_jac,
+    'exp': exp_jac,
+    'logistic': logistic_jac,
+}
+
+
+def _log_linear_fit(x, z):
+    """log(z) = log(a) + b * x doğrusunu uydur; (a, b) döndür"""
+    slope, intercept = np.polyfit(x, np.log(z), 1)
+    return np.exp(intercept), slope
+
+
+def exp_initial_guess(x, y):
+    """Üstel model için log-lineer uydurmadan başlangıç değerleri.
+
+    Hem büyüyen (a > 0) hem de doyuma giden (a < 0) biçim denenir,
+    kareler toplamı küçük olan seçilir.
+    """
+    spread = max(np.ptp(y), 1.0)
+    candidates = []
+
+    # a > 0: y - c pozitif olacak şekilde c'yi minimumun biraz altına al
+    c_low = np.min(y) - 0.05 * spread
+    a, b = _log_linear_fit(x, y - c_low)
+    candidates.append([a, b, c_low])
+
+    # a < 0: c - y pozitif olacak şekilde c'yi maksimumun biraz üstüne al
+    c_high = np.max(y) + 0.05 * spread
+    a, b = _log_linear_fit(x, c_high - y)
+    candidates.append([-a, b, c_high])
+
+    def sse(p):
+        with np.errstate(over='ignore', invalid='ignore'):
+            residuals = y - exp_func(x, *np.clip(p, *_exp_bounds(x, y)))
+        value = np.sum(residuals ** 2)
+        return value if np.isfinite(value) else np.inf
+
+    return min(candidates, key=sse)
+
+
+def logistic_initial_guess(x, y):
+    """Lojistik model için logit dönüşümlü lineer uydurmadan başlangıç değerleri"""
+    L = max(np.max(y), 1.0) * 1.2
+    ratio = np.clip(y, 1e-3 * L, 0.999 * L) / L
+    k, intercept = np.polyfit(x, np.log(ratio / (1 - ratio)), 1)
+    if abs(k) < 1e-6:
+        k = 1e-6
+    x0 = -intercept / k
+    return [L, k, x0]
+
+
+INITIAL_GUESSES = {
+    'exp': exp_initial_guess,
+    'logistic': logistic_initial_guess,
+}
+
+
+def _exp_bounds(x, y):
+    return ([-np.inf, -MAX_EXP_RATE, -np.inf], [np.inf, MAX_EXP_RATE, np.inf])
+
+
+def _logistic_bounds(x, y):
+    span = max(np.ptp(x), 1.0)
+    upper_L = max(np.max(np.abs(y)), 1.0) * 100
+    return ([0.0, -MAX_LOGISTIC_RATE, np.min(x) - 10 * span],
+            [upper_L, MAX_LOGISTIC_RATE, np.max(x) + 10 * span])
+
+
+BOUNDS = {
+    'exp': _exp_bounds,
+    'logistic': _logistic_bounds,
+}
+
+
+def initial_guess(name, x, y):
+    """Veriden türetilen başlangıç değerleri (sınırların içine çekilmiş)"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    p0 = np.asarray(INITIAL_GUESSES[name](x, y), dtype=float)
+    return _clip_to_bounds(name, x, y, p0)
+
+
+def _clip_to_bounds(name, x, y, p0):
+    lower, upper = BOUNDS[name](x, y)
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    # Sınırın tam üstünde başlamak 'trf' yöntemine uygun değil, biraz içeri çek
+    margin = np.where(np.isfinite(upper - lower), 1e-6 * (upper - lower), 0.0)
+    return np.clip(np.nan_to_num(p0), lower + margin, upper - margin)
+
+
+# R-kare değerini hesaplama
+def r_squared(y_true, y_pred):
+    ss_res = np.sum((y_true - y_pred) ** 2)
+    ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
+    return 1 - (ss_res / ss_tot)
+
+
+def design_matrix(name, x):
+    """Polinom modeller için (x^d, ..., x, 1) tasarım matrisi"""
+    return np.vander(np.asarray(x, dtype=float), CLOSED_FORM_DEGREES[name] + 1)
+
+
+def fit_closed_form(name, x, y):
+    """Lineer/polinom modeli normal denklemlerle uydur, curve_fit ile aynı (popt, pcov) döndür"""
+    X = design_matrix(name, x)
+    y = np.asarray(y, dtype=float)
+    popt, _, _, _ = np.linalg.lstsq(X, y, rcond=None)
+
+    n_params = X.shape[1]
+    dof = len(y) - n_params
+    if dof > 0:
+        residuals = y - X @ popt
+        s_sq = residuals @ residuals / dof
+        pcov = s_sq * np.linalg.pinv(X.T @ X)
+    else:
+        # curve_fit gibi: serbestlik derecesi yoksa kovaryans tanımsız
+        pcov = np.full((n_params, n_params), np.inf)
+
+    return popt, pcov
+
+
+def fit_model(name, x, y, p0=None):
+    """Verilen modeli uydur; mümkünse kapalı form çözümü kullan.
+
+    Doğrusal olmayan modellerde p0 verilmezse veriden başlangıç değeri türetilir,
+    analitik Jacobian ve parametre sınırları kullanılır.
+    """
+    if name in CLOSED_FORM_DEGREES:
+        return fit_closed_form(name, x, y)
+
+    # scipy yalnızca doğrusal olmayan uydurmalarda gerekiyor
+    from scipy.optimize import curve_fit
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    if p0 is None:
+        p0 = initial_guess(name, x, y)
+    else:
+        p0 = _clip_to_bounds(name, x, y, np.asarray(p0, dtype=float))
+
+    return curve_fit(MODELS[name], x, y, p0=p0, jac=JACOBIANS[name], bounds=BOUNDS[name](x, y),
+                     method='trf', maxfev=5000)
+
+
+def n_params(name):
+    """Modelin parametre sayısı (ilk argüman x hariç)"""
+    return MODELS[name].__code__.co_argcount - 1
+
+
+def predict(name, x, popt):
+    return MODELS[name](np.asarray(x, dtype=float), *popt)
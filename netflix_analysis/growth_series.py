@@ -0,0 +1,50 @@
+from collections import Counter
+
+import pandas as pd
+
+from netflix_analysis.growth_models import BASE_YEAR
+
+
+def yearly_counts(data, start_year=BASE_YEAR):
+    """Yıla göre içerik sayısı; (x, y) olarak x = yıl - 2000"""
+    release_year = pd.to_numeric(data['release_year'], errors='coerce')
+    counts = release_year.value_counts().sort_index()
+    counts = counts[counts.index >= start_year]
+    x = counts.index.values.astype(float) - BASE_YEAR
+    y = counts.values.astype(float)
+    return x, y
+
+
+def collect_growth_series(data):
+    """curve_fitting.py ve content_type_curve_fitting.py'nin uydurduğu tüm yıllık serileri topla"""
+    series = {}
+
+    # curve_fitting.py: toplam içerik ve türlere göre içerik
+    series['overall'] = yearly_counts(data)
+    for content_type in data['type'].dropna().unique():
+        series[f'type/{content_type}'] = yearly_counts(data[data['type'] == content_type])
+
+    # content_type_curve_fitting.py: en popüler 10 tür
+    genres = Counter()
+    for g in data['listed_in']:
+        if isinstance(g, str):
+            genres.update(genre.strip() for genre in g.split(','))
+    for genre, _ in genres.most_common(10):
+        genre_data = data[data['listed_in'].apply(lambda x: isinstance(x, str) and genre in x)]
+        series[f'genre/{genre}'] = yearly_counts(genre_data)
+
+    # content_type_curve_fitting.py: ilk ülkeye göre en çok içeriği olan 6 ülke
+    country_data = data.dropna(subset=['country'])
+    main_country = country_data['country'].apply(lambda x: x.split(',')[0].strip())
+    for country in main_country.value_counts().head(6).index:
+        series[f'country/{country}'] = yearly_counts(country_data[main_country == country])
+
+    # content_type_curve_fitting.py: en çok kullanılan 6 derecelendirme (en az 4 veri noktası)
+    rating_data = data.dropna(subset=['rating'])
+    for rating in rating_data['rating'].value_counts().head(6).index:
+        x, y = yearly_counts(rating_data[rating_data['rating'] == rating])
+        if len(x) > 3:
+            series[f'rating/{rating}'] = (x, y)
+
+    return {name: (x, y) for name, (x, y) in series.items() if len(x) > 0}
+
@@ -0,0 +1,187 @@
+"""Büyüme modeli tahminleri için tahmin aralıkları.
+
+Delta yöntemi: parametre kovaryansı (pcov) tahmin noktasındaki Jacobian ile eğrinin varyansına taşınır,
+artık varyansı eklenir ve t dağılımı kantiliyle aralık kurulur.
+
+Artık bootstrap: uydurulan eğriye yeniden örneklenmiş artıklar eklenerek binlerce yapay seri üretilir ve
+hepsi tek bir toplu dizi işlemiyle uydurulur (polinom modellerde normal denklemler, diğerlerinde toplu
+Levenberg-Marquardt adımları); örnek başına curve_fit çağrısı yapılmaz.
+"""
+import csv
+import math
+import os
+from statistics import NormalDist
+
+import numpy as np
+
+from netflix_analysis.growth_models import BOUNDS, CLOSED_FORM_DEGREES, JACOBIANS, MODELS, design_matrix, predict
+
+DEFAULT_LEVEL = 0.95
+N_BOOTSTRAP = 2000
+INTERVAL_METHODS = ['delta', 'bootstrap']
+
+# Doğrusal olmayan modellerde toplu Levenberg-Marquardt adımlarının üst sınırı ve yakınsama ölçütü
+# (kareler toplamındaki göreli iyileşme); adımlar uydurulmuş parametrelerden başlar
+LM_ITERATIONS = 200
+LM_TOLERANCE = 1e-10
+
+INTERVAL_FIELDS = ['series', 'model', 'year', 'forecast', 'lower', 'upper', 'level', 'interval']
+
+
+def t_quantile(p, dof):
+    """Student t dağılımının p kantili (scipy olmadan).
+
+    1 ve 2 serbestlik derecesinde kapalı form, diğerlerinde normal kantilin Cornish-Fisher açılımı
+    kullanılır (3 serbestlik derecesinde hata %1'in altında, 10 ve üzerinde 1e-4'ün altında).
+    """
+    if dof == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if dof == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+
+    z = NormalDist().inv_cdf(p)
+    v = float(dof)
+    return (z
+            + (z ** 3 + z) / (4 * v)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * v ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * v ** 3)
+            + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / (92160 * v ** 4))
+
+
+def _nan_interval(pred):
+    nan = np.full(pred.shape, np.nan)
+    return pred, nan, nan.copy()
+
+
+def delta_interval(name, x, y, popt, pcov, x_new, level=DEFAULT_LEVEL):
+    """Delta yöntemiyle tahmin aralığı; (tahmin, alt, üst) dizileri"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x_new = np.atleast_1d(np.asarray(x_new, dtype=float))
+    popt = np.asarray(popt, dtype=float)
+    pcov = np.asarray(pcov, dtype=float)
+
+    pred = predict(name, x_new, popt)
+    dof = len(x) - len(popt)
+    if dof <= 0 or not np.all(np.isfinite(pcov)):
+        # Kovaryans tanımsız (ör. parametre sayısı kadar gözlem): aralık verilemez
+        return _nan_interval(pred)
+
+    residuals = y - predict(name, x, popt)
+    s_sq = residuals @ residuals / dof
+
+    jac = JACOBIANS[name](x_new, *popt)
+    curve_var = np.einsum('mi,ij,mj->m', jac, pcov, jac)
+    half_width = t_quantile(0.5 + level / 2, dof) * np.sqrt(np.maximum(curve_var, 0) + s_sq)
+    return pred, pred - half_width, pred + half_width
+
+
+def _sse(name, x, Y, P):
+    with np.errstate(over='ignore', invalid='ignore'):
+        residuals = Y - MODELS[name](x, *P.T[:, :, None])
+        sse = np.sum(residuals ** 2, axis=1)
+    return np.where(np.isfinite(sse), sse, np.inf)
+
+
+def batched_fit(name, x, Y, popt, bounds):
+    """Y'nin (B, n) her satırını aynı anda uydur; (B, k) parametreler ve başarılı satırların maskesi"""
+    if name in CLOSED_FORM_DEGREES:
+        # Tüm seriler aynı tasarım matrisini paylaşır: tek bir sözde ters ile çözülür
+        return Y @ np.linalg.pinv(design_matrix(name, x)).T, np.ones(len(Y), dtype=bool)
+
+    lower, upper = (np.asarray(bound, dtype=float) for bound in bounds)
+    P = np.tile(np.asarray(popt, dtype=float), (len(Y), 1))
+    sse = _sse(name, x, Y, P)
+    damping = np.full(len(Y), 1e-3)
+    identity = np.eye(P.shape[1])
+    # Yakınsayan örnekler sonraki adımlardan çıkarılır; adımlar yalnızca kalan satırlar üzerinde yapılır
+    active = np.flatnonzero(np.isfinite(sse))
+
+    for _ in range(LM_ITERATIONS):
+        if not len(active):
+            break
+        Pa, Ya = P[active], Y[active]
+        with np.errstate(over='ignore', invalid='ignore'):
+            residuals = Ya - MODELS[name](x, *Pa.T[:, :, None])
+            jac = np.broadcast_to(JACOBIANS[name](x, *Pa.T[:, :, None]), Ya.shape + (P.shape[1],))
+            jtj = np.einsum('bni,bnj->bij', jac, jac)
+            gradient = np.einsum('bni,bn->bi', jac, residuals)
+            # Marquardt ölçeklemesi: sönüm terimi J^T J köşegeniyle orantılı
+            system = jtj + damping[active, None, None] * (jtj * identity + 1e-12 * identity)
+            step = np.linalg.solve(system, gradient[..., None])[..., 0]
+        candidate = np.clip(Pa + np.nan_to_num(step), lower, upper)
+        candidate_sse = _sse(name, x, Ya, candidate)
+
+        better = candidate_sse < sse[active]
+        improvement = (sse[active] - candidate_sse) / np.maximum(sse[active], 1e-300)
+        P[active[better]] = candidate[better]
+        sse[active[better]] = candidate_sse[better]
+        damping[active] = np.where(better, damping[active] / 3, damping[active] * 4)
+
+        converged = (better & (improvement < LM_TOLERANCE)) | (damping[active] > 1e8)
+        active = active[~converged]
+
+    return P, np.isfinite(sse) & np.all(np.isfinite(P), axis=1)
+
+
+def bootstrap_interval(name, x, y, popt, x_new, level=DEFAULT_LEVEL, n_bootstrap=N_BOOTSTRAP, seed=0):
+    """Artık bootstrap ile tahmin aralığı; (tahmin, alt, üst) dizileri"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x_new = np.atleast_1d(np.asarray(x_new, dtype=float))
+    popt = np.asarray(popt, dtype=float)
+
+    pred = predict(name, x_new, popt)
+    dof = len(x) - len(popt)
+    if dof <= 0:
+        return _nan_interval(pred)
+
+    # Uydurma artıkları gerçek hatalardan küçük kalır; serbestlik derecesine göre büyütülür
+    fitted = predict(name, x, popt)
+    residuals = y - fitted
+    residuals = (residuals - residuals.mean()) * math.sqrt(len(x) / dof)
+
+    rng = np.random.default_rng(seed)
+    Y = fitted + rng.choice(residuals, size=(n_bootstrap, len(x)))
+    P, ok = batched_fit(name, x, Y, popt, BOUNDS[name](x, y) if name in BOUNDS else None)
+    if not ok.any():
+        return _nan_interval(pred)
+
+    # Her örneğin eğrisine yeni bir artık eklenir: parametre belirsizliği + gözlem gürültüsü
+    with np.errstate(over='ignore', invalid='ignore'):
+        curves = MODELS[name](x_new, *P[ok].T[:, :, None])
+    future = curves + rng.choice(residuals, size=curves.shape)
+    lower, upper = np.nanquantile(future, [(1 - level) / 2, (1 + level) / 2], axis=0)
+    return pred, lower, upper
+
+
+def forecast_interval(name, x, y, popt, pcov, x_new, level=DEFAULT_LEVEL, method='delta',
+                      n_bootstrap=N_BOOTSTRAP, seed=0):
+    """Tahmin ve aralığı; `x_new` skaler ise skalerler, dizi ise diziler döndürür"""
+    if method == 'delta':
+        result = delta_interval(name, x, y, popt, pcov, x_new, level)
+    elif method == 'bootstrap':
+        result = bootstrap_interval(name, x, y, popt, x_new, level, n_bootstrap, seed)
+    else:
+        raise ValueError(f"bilinmeyen aralık yöntemi: {method} (seçenekler: {', '.join(INTERVAL_METHODS)})")
+
+    if np.ndim(x_new) == 0:
+        return tuple(float(values[0]) for values in result)
+    return result
+
+
+def format_interval(lower, upper, level=DEFAULT_LEVEL, digits=0):
+    if not (np.isfinite(lower) and np.isfinite(upper)):
+        return "aralık hesaplanamadı"
+    return f"%{level * 100:.0f} tahmin aralığı: [{lower:.{digits}f}, {upper:.{digits}f}]"
+
+
+def write_intervals(rows, path):
+    """Tahmin ve aralık kayıtlarını (INTERVAL_FIELDS) CSV olarak yaz"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=INTERVAL_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from netflix_analysis.growth_models import BASE_YEAR, CLOSED_FORM_DEGREES, MODELS, fit_model
+
+REGISTRY_PATH = 'cache/model_registry.json'
+
+
+def series_fingerprint(x, y):
+    """Yıllık sayıların özeti; değişmeyen seriler yeniden uydurulmaz"""
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(x, dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(y, dtype=float).tobytes())
+    return digest.hexdigest()[:16]
+
+
+class RegistryEntry:
+    __slots__ = ('series', 'model', 'popt', 'pcov', 'fingerprint', 'data_version', 'fitted_at')
+
+    def __init__(self, series, model, popt, pcov, fingerprint, data_version, fitted_at):
+        self.series = series
+        self.model = model
+        self.popt = np.asarray(popt, dtype=float)
+        self.pcov = np.asarray(pcov, dtype=float)
+        self.fingerprint = fingerprint
+        self.data_version = data_version
+        self.fitted_at = fitted_at
+
+    def to_dict(self):
+        return {
+            'series': self.series,
+            'model': self.model,
+            'popt': self.popt.tolist(),
+            'pcov': self.pcov.tolist(),
+            'fingerprint': self.fingerprint,
+            'data_version': self.data_version,
+            'fitted_at': self.fitted_at,
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d['series'], d['model'], d['popt'], d['pcov'], d['fingerprint'],
+                   d['data_version'], d['fitted_at'])
+
+
+class ModelRegistry:
+    """Seri ve model bazında uydurulmuş parametreleri (popt, pcov) saklayan küçük kayıt defteri"""
+
+    def __init__(self, path=REGISTRY_PATH, data_version=None):
+        self.path = path
+        self.data_version = data_version
+        self.entries = {}
+        self.refit_count = 0
+        self.reused_count = 0
+        self._dirty = False
+
+        if path is not None and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for d in json.load(f)['entries']:
+                    entry = RegistryEntry.from_dict(d)
+                    self.entries[(entry.series, entry.model)] = entry
+
+    def get(self, series, model):
+        return self.entries.get((series, model))
+
+    def fit(self, series, model, x, y, data_version=None):
+        """Seri değişmediyse kayıtlı parametreleri döndür, değiştiyse önceki parametrelerden başlayarak uydur"""
+        if data_version is None:
+            data_version = self.data_version
+
+        fingerprint = series_fingerprint(x, y)
+        previous = self.entries.get((series, model))
+
+        if previous is not None and previous.fingerprint == fingerprint:
+            self.reused_count += 1
+            if data_version is not None and previous.data_version != data_version:
+                previous.data_version = data_version
+                self._dirty = True
+            return previous
+
+        p0 = None
+        if previous is not None and model not in CLOSED_FORM_DEGREES:
+            p0 = previous.popt
+
+        try:
+            popt, pcov = fit_model(model, x, y, p0=p0)
+        except RuntimeError:
+            if p0 is None:
+                raise
+            # Önceki parametrelerle yakınsamadıysa varsayılan başlangıç değerleriyle tekrar dene
+            popt, pcov = fit_model(model, x, y)
+
+        entry = RegistryEntry(series, model, popt, pcov, fingerprint, data_version,
+                              time.strftime('%Y-%m-%d %H:%M:%S'))
+        self.entries[(series, model)] = entry
+        self.refit_count += 1
+        self._dirty = True
+        return entry
+
+    def refresh(self, series, models, data_version=None):
+        """Tüm serileri güncelle; yalnızca yıllık sayıları değişenler yeniden uydurulur"""
+        failed = []
+        for name, (x, y) in series.items():
+            for model in models:
+                try:
+                    self.fit(name, model, x, y, data_version)
+                except (RuntimeError, ValueError, TypeError):
+                    failed.append((name, model))
+        return failed
+
+    def subset(self, keys):
+        """Yalnızca verilen (seri, model) kayıtlarını içeren, dosyaya yazılmayan kayıt defteri (işçiler için)"""
+        registry = ModelRegistry(path=None, data_version=self.data_version)
+        registry.entries = {key: self.entries[key] for key in keys if key in self.entries}
+        return registry
+
+    def merge(self, other):
+        """Başka bir kayıt defterinde (ör. bir işçide) yapılan uydurmaları ve sayaçları bu deftere al"""
+        self.entries.update(other.entries)
+        self.refit_count += other.refit_count
+        self.reused_count += other.reused_count
+        self._dirty = self._dirty or other._dirty
+
+    def forecast(self, series, model, year):
+        """Tahmini doğrudan kayıtlı parametrelerden hesapla (yeniden uydurma yok)"""
+        entry = self.entries.get((series, model))
+        if entry is None:
+            raise KeyError(f"{series} / {model} için kayıtlı model bulunamadı")
+        return MODELS[model](year - BASE_YEAR, *entry.popt)
+
+    def save(self):
+        if self.path is None or not self._dirty:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'entries': [entry.to_dict() for entry in self.entries.values()]}, f, indent=1)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def main():
+    from curve_fitting import load_data
+    from netflix_analysis.catalog import dataset_version
+    from netflix_analysis.growth_series import collect_growth_series
+
+    netflix_data = load_data()
+
+    if netflix_data is not None:
+        version = dataset_version()
+        registry = ModelRegistry(data_version=version)
+
+        start_time = time.time()
+        series = collect_growth_series(netflix_data)
+        failed = registry.refresh(series, ['linear', 'poly', 'exp'])
+        registry.save()
+        duration = time.time() - start_time
+
+        print(f"Model kayıt defteri güncellendi (veri sürümü {version}): "
+              f"{registry.refit_count} model yeniden uyduruldu, {registry.reused_count} model değişmedi "
+              f"({duration:.2f} saniye).")
+        for name, model in failed:
+            print(f"{name} için {model} modeli uydurulamadı.")
+
+        print("\n2025 Yılı İçerik Sayısı Tahminleri (Polinom Model):")
+        for name in series:
+            if registry.get(name, 'poly') is not None:
+                print(f"{name}: {int(registry.forecast(name, 'poly', 2025))} içerik")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import re
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+from netflix_analysis.catalog import PLACEHOLDER, Bridge
+
+# Aynı kişi sayılması için gereken en düşük trigram benzerliği (Dice katsayısı)
+SIMILARITY_THRESHOLD = 0.85
+
+# Bundan büyük bloklarda tüm çiftler yerine sıralı komşuluk penceresi karşılaştırılır
+MAX_BLOCK_SIZE = 200
+NEIGHBOURHOOD_WINDOW = 20
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def name_key(name):
+    """Karşılaştırma anahtarı: aksanlar, büyük/küçük harf, noktalama ve boşluk farkları atılır.
+
+    'Roman Polański' ve 'Roman Polanski', 'Andrew Lau Wai-Keung' ve 'Andrew Lau Wai keung' aynı anahtarı alır.
+    """
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    return ' '.join(TOKEN_PATTERN.findall(name.casefold()))
+
+
+def _trigrams(key):
+    padded = f'  {key} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _dice(a, b):
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def _abbreviates(short, full):
+    """`short` adının baş harfli yazımı `full` ile uyumlu mu ('m j bassett' / 'michael j bassett').
+
+    Yalnızca ad + soyaddan oluşan isimler ('r balki' / 'rizki balki') kanıt yetersiz olduğundan eşleşmez.
+    """
+    if len(short) != len(full) or len(short) < 3 or short[-1] != full[-1] or len(short[-1]) < 2:
+        return False
+    has_initial = False
+    for s, f in zip(short[:-1], full[:-1]):
+        if s == f:
+            continue
+        if len(s) == 1 and f.startswith(s):
+            has_initial = True
+            continue
+        return False
+    return has_initial
+
+
+class _UnionFind:
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        i, j = self.find(i), self.find(j)
+        if i != j:
+            self.parent[max(i, j)] = min(i, j)
+
+
+def _blocks(keys):
+    """Benzer olabilecek anahtar grupları: aynı soyad veya aynı ad + soyadın ilk iki harfi.
+
+    Karşılaştırmalar yalnızca blok içinde yapılır; tüm çiftler hiçbir zaman karşılaştırılmaz.
+    """
+    blocks = defaultdict(list)
+    for i, key in enumerate(keys):
+        tokens = key.split()
+        if len(tokens) < 2:
+            continue
+        blocks[('last', tokens[-1])].append(i)
+        blocks[('first', tokens[0], tokens[-1][:2])].append(i)
+    return blocks.values()
+
+
+def _candidate_pairs(members, keys):
+    if len(members) <= MAX_BLOCK_SIZE:
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                yield members[a], members[b]
+        return
+
+    members = sorted(members, key=keys.__getitem__)
+    for a in range(len(members)):
+        for b in range(a + 1, min(a + 1 + NEIGHBOURHOOD_WINDOW, len(members))):
+            yield members[a], members[b]
+
+
+def cluster_keys(keys, threshold=SIMILARITY_THRESHOLD):
+    """Anahtarları yakın yazımlara göre kümele; her anahtar için küme temsilcisinin konumunu döndür"""
+    trigrams = [_trigrams(key) for key in keys]
+    sizes = [len(grams) for grams in trigrams]
+    clusters = _UnionFind(len(keys))
+
+    for members in _blocks(keys):
+        for i, j in _candidate_pairs(members, keys):
+            # Küme boyutları farkı eşiği zaten aşılmaz kılıyorsa kesişimi hesaplama
+            if 2 * min(sizes[i], sizes[j]) < threshold * (sizes[i] + sizes[j]):
+                continue
+            if _dice(trigrams[i], trigrams[j]) >= threshold:
+                clusters.union(i, j)
+
+    # Baş harfli yazımlar yalnızca aynı baş harf dizisine ve soyada sahip isimlerle karşılaştırılır
+    signatures = defaultdict(list)
+    tokens = [key.split() for key in keys]
+    for i, key_tokens in enumerate(tokens):
+        if len(key_tokens) >= 3:
+            signatures[(tuple(token[0] for token in key_tokens[:-1]), key_tokens[-1])].append(i)
+
+    for members in signatures.values():
+        for i in members:
+            if not any(len(token) == 1 for token in tokens[i][:-1]):
+                continue
+            # Uyumlu tek bir açık yazım varsa ona bağlanır
+            # (birden fazlaysa 'J. A. Smith' hem 'John A. Smith' hem 'Jane A. Smith' ile birleşmesin diye bağlanmaz)
+            matches = {clusters.find(j) for j in members if j != i and _abbreviates(tokens[i], tokens[j])}
+            matches.discard(clusters.find(i))
+            if len(matches) == 1:
+                clusters.union(i, matches.pop())
+
+    return [clusters.find(i) for i in range(len(keys))]
+
+
+def resolve_names(names, weights=None, threshold=SIMILARITY_THRESHOLD):
+    """Ham isimleri kanonik kimliklere eşle.
+
+    Döndürür: (her isim için kimlik dizisi, kimlik -> kanonik isim dizisi). Kanonik isim kümede en çok
+    kullanılan yazımdır (eşitlikte daha uzun, sonra alfabetik önce gelen); kimlikler kanonik isme göre sıralıdır.
+    """
+    names = list(names)
+    weights = np.ones(len(names)) if weights is None else np.asarray(weights)
+
+    keys = []
+    key_index = {}
+    name_keys = []
+    for name in names:
+        # Yer tutucu hiçbir isimle birleştirilmez
+        key = name_key(name) if name != PLACEHOLDER else PLACEHOLDER
+        if key not in key_index:
+            key_index[key] = len(keys)
+            keys.append(key)
+        name_keys.append(key_index[key])
+
+    key_cluster = cluster_keys(keys, threshold)
+    clusters = defaultdict(list)
+    for position, key in enumerate(name_keys):
+        clusters[key_cluster[key]].append(position)
+
+    canonical = {root: min(members, key=lambda p: (-weights[p], -len(names[p]), names[p]))
+                 for root, members in clusters.items()}
+    roots = sorted(canonical, key=lambda root: names[canonical[root]])
+    cluster_id = {root: i for i, root in enumerate(roots)}
+
+    ids = np.array([cluster_id[key_cluster[key]] for key in name_keys], dtype=np.int32)
+    return ids, np.array([names[canonical[root]] for root in roots], dtype=object)
+
+
+def canonical_bridge(bridge):
+    """Değerleri kanonik isimler, kodları kanonik kimlikler olan köprü tablosu.
+
+    Aynı satırda iki farklı yazımla geçen kişi o satırda bir kez sayılır; satır sırası korunur.
+    Ham yazımlar `aliases` ile kimliklere eşlenir, böylece `code_of` / `rows_for` her yazımla çalışır.
+    """
+    weights = np.bincount(bridge.codes, minlength=len(bridge.values))
+    ids, names = resolve_names(bridge.values, weights)
+
+    codes = ids[bridge.codes]
+    _, first = np.unique(bridge.rows * len(names) + codes, return_index=True)
+    keep = np.sort(first)
+    aliases = {name: int(i) for name, i in zip(bridge.values, ids)}
+    return Bridge(bridge.rows[keep], codes[keep], names, aliases)
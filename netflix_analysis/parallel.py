@@ -0,0 +1,95 @@
+"""Grup bazlı analizlerin işçi havuzunda çalıştırılması.
+
+Grupların ortak kullandığı numpy dizileri bir kez `multiprocessing.shared_memory` bloklarına kopyalanır;
+işçiler blokları adlarıyla açar, böylece diziler her görevle birlikte yeniden gönderilmez. Görevlere yalnızca
+küçük grup tanımları gider ve sonuçlar grupların sırasıyla toplanır (çalışma sırasından bağımsız).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# İşçi süreçlerinde açılmış paylaşımlı diziler (işçi başlatılırken bir kez doldurulur)
+_worker_arrays = None
+_worker_blocks = []
+
+# `workers` verilmediğinde süreç havuzu yalnızca tahmini iş (en uzun dizinin boyu x grup sayısı) bu eşiği
+# geçerse açılır; daha küçük işlerde havuzun açılış maliyeti işin kendisinden büyüktür
+PARALLEL_MIN_WORK = 50_000_000
+
+
+class SharedArrays:
+    """Dizilerin paylaşımlı bellekteki kopyaları; `with` bloğundan çıkınca bloklar silinir"""
+
+    def __init__(self, arrays):
+        self.blocks = {}
+        self.specs = {}
+        try:
+            for name, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                # Boş diziler için de en az 1 baytlık blok açılır
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self.blocks[name] = block
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                self.specs[name] = (block.name, array.shape, array.dtype.str)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach(specs):
+    """Paylaşımlı blokları aç ve salt okunur diziler olarak döndür"""
+    arrays = {}
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        # Blok nesnesi dizi kullanıldığı sürece açık kalmalı
+        _worker_blocks.append(block)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        array.flags.writeable = False
+        arrays[name] = array
+    return arrays
+
+
+def _init_worker(specs):
+    global _worker_arrays
+    _worker_arrays = attach(specs)
+
+
+def _run_group(task):
+    function, group = task
+    return function(_worker_arrays, group)
+
+
+def map_groups(function, groups, arrays, workers=None):
+    """Her grup için `function(arrays, group)` sonucunu grupların sırasıyla döndür.
+
+    `function` modül düzeyinde tanımlı olmalı (işçilere adıyla gönderilir) ve `arrays` sözlüğünü
+    değiştirmemelidir. `workers` verilmezse iş PARALLEL_MIN_WORK eşiğini geçmedikçe süreç açılmadan sırayla
+    çalıştırılır; tek işçi veya tek grup varsa her zaman sırayla çalıştırılır.
+    """
+    groups = list(groups)
+    if workers is None:
+        rows = max((len(array) for array in arrays.values()), default=0)
+        workers = (os.cpu_count() or 1) if rows * len(groups) >= PARALLEL_MIN_WORK else 1
+    workers = min(workers, len(groups))
+
+    if workers <= 1:
+        return [function(arrays, group) for group in groups]
+
+    with SharedArrays(arrays) as shared:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shared.specs,)) as executor:
+            return list(executor.map(_run_group, [(function, group) for group in groups]))
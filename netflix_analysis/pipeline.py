@@ -0,0 +1,356 @@
+"""Analizlerin bildirimsel bağımlılık grafiği (DAG) ve zamanlayıcısı.
+
+Her düğüm bir ada, onu üreten fonksiyona ve girdisi olan düğümlerin adlarına sahiptir: kaynaklar (katalog,
+toplam durumu), analiz sonuçları ve grafik dosyaları. Bir düğüm istendiğinde yalnızca onun ataları hesaplanır;
+bellekte veya diskte hazır olan bir düğümün ataları hiç ziyaret edilmez. Girdileri hazır olan düğümler iş
+parçacığı havuzunda paralel çalışır; aynı kilidi paylaşan düğümler (pyplot ile çizen grafikler, aynı önbellek
+dosyalarını yazan kaynaklar) sırayla çalışır.
+
+Hesaplanan her düğüm bellekte tutulur. Kalıcı düğümler ayrıca veri sürümü ve ayarlarla anahtarlanarak
+cache/pipeline/ altına yazılır (grafiklerde dosyanın yolu saklanır ve dosya silinmişse yeniden çizilir).
+
+    python -m netflix_analysis.pipeline type_distribution_pie netflix_top_directors
+    python -m netflix_analysis.pipeline --all --workers 4
+    python -m netflix_analysis.pipeline --list
+"""
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import pickle
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from netflix_analysis.catalog import CACHE_DIR, DATA_PATH, DEDUPE_SUFFIX
+
+PIPELINE_DIR = os.path.join(CACHE_DIR, 'pipeline')
+
+# Önbellek anahtarına katılır; düğüm tanımları veya analiz çıktıları değiştiğinde artırılır
+PIPELINE_FORMAT = 1
+
+# Düğümler: ad -> (modül, fonksiyon, girdi düğümleri, diske yazılır mı, kilit).
+# Fonksiyon girdilerin değerleriyle (sırasıyla) çağrılır; 'settings' her çalıştırmanın ayarlarıdır.
+# Kaynakların kendi önbellekleri (sütun deposu, toplam durumu) olduğundan diske ayrıca yazılmazlar; ikisi de
+# tekilleştirmede aynı sütun deposunu yazabildiği için aynı kilidi paylaşır.
+NODES = {
+    'catalog': ('netflix_analysis.pipeline', 'load_catalog_node', ['settings'], False, 'cache'),
+    'aggregates': ('netflix_analysis.pipeline', 'load_aggregates_node', ['settings'], False, 'cache'),
+    'countries': ('netflix_analysis.analyses.countries', 'countries_from_state', ['aggregates'], True, None),
+    'ratings': ('netflix_analysis.analyses.ratings', 'ratings_from_state', ['aggregates'], True, None),
+    'directors': ('netflix_analysis.analyses.directors', 'analyze_directors', ['catalog'], True, None),
+    'years': ('netflix_analysis.analyses.years', 'years_from_state', ['aggregates'], True, None),
+    'durations': ('netflix_analysis.analyses.durations', 'durations_from_state', ['aggregates'], True, None),
+    # Kümelerin kendi önbelleği var (cache/country_clusters)
+    'country_clusters': ('netflix_analysis.country_clusters', 'analyze_country_clusters', ['catalog'], False,
+                         None),
+    'title_words': ('netflix_analysis.analyses.wordclouds', 'category_title_frequencies', ['catalog'], True, None),
+    'wordclouds': ('netflix_analysis.pipeline', 'draw_wordclouds', ['title_words', 'settings'], True, 'pyplot'),
+}
+
+# Grafik modülü olan analiz düğümleri: her CHARTS girdisi ayrı bir grafik düğümüdür (ad: dosya adı uzantısız)
+CHART_SECTIONS = ['countries', 'ratings', 'directors', 'years', 'durations', 'country_clusters']
+
+
+def load_catalog_node(settings):
+    from netflix_analysis.catalog import load_catalog
+
+    return load_catalog(settings['data_path'], dedupe=settings['dedupe'])
+
+
+def load_aggregates_node(settings):
+    from netflix_analysis.aggregates import load_aggregates
+
+    return load_aggregates(settings['data_path'], dedupe=settings['dedupe'])
+
+
+def draw_chart(results, settings, section, filename):
+    """Analiz sonucundan tek bir grafiği çiz; dosyanın yolunu döndür"""
+    import matplotlib.pyplot as plt
+
+    charts = importlib.import_module(f'netflix_analysis.charts.{section}')
+    plot, key = next((plot, key) for name, plot, key, *_ in charts.CHARTS if name == filename)
+    fig_path = os.path.join(settings['fig_dir'], filename)
+    os.makedirs(settings['fig_dir'], exist_ok=True)
+    with plt.rc_context():
+        if hasattr(charts, 'apply_theme'):
+            charts.apply_theme()
+        plot(results[key], fig_path)
+        plt.close('all')
+    return fig_path
+
+
+def draw_wordclouds(frequencies, settings):
+    from netflix_analysis.charts.wordclouds import render_title_wordclouds
+
+    render_title_wordclouds(frequencies, wordcloud_dir=settings['wordcloud_dir'])
+    return settings['wordcloud_dir']
+
+
+def chart_nodes():
+    """Grafik düğümleri: ad -> (bölüm, dosya adı); grafik modülleri içe aktarılır"""
+    nodes = {}
+    for section in CHART_SECTIONS:
+        charts = importlib.import_module(f'netflix_analysis.charts.{section}')
+        for filename, *_ in charts.CHARTS:
+            nodes[os.path.splitext(filename)[0]] = (section, filename)
+    return nodes
+
+
+class PipelineError(RuntimeError):
+    """Bir veya daha fazla düğüm hesaplanamadı; `failures` ad -> hata, `missing` üretilemeyen hedefler"""
+
+    def __init__(self, failures, missing):
+        self.failures = failures
+        self.missing = missing
+        details = '; '.join(f"{name}: {error}" for name, error in failures.items())
+        super().__init__(f"hesaplanamayan düğümler: {details}")
+
+
+class Node:
+    __slots__ = ('name', 'module', 'function', 'inputs', 'persist', 'lock', 'options')
+
+    def __init__(self, name, module, function, inputs, persist=False, lock=None, options=None):
+        self.name = name
+        self.module = module
+        self.function = function
+        self.inputs = inputs
+        self.persist = persist
+        self.lock = lock
+        self.options = options or {}
+
+    def run(self, values):
+        function = getattr(importlib.import_module(self.module), self.function)
+        return function(*values, **self.options)
+
+
+class Pipeline:
+    """Düğümleri istendiğinde, yalnızca gereken ataları hesaplayarak çalıştıran zamanlayıcı.
+
+    `values` bellekteki sonuçlardır; aynı nesne üzerinden yapılan sonraki istekler bunları yeniden kullanır.
+    `computed` ve `loaded` son çalıştırmada hesaplanan ve diskten okunan düğümlerdir.
+    """
+
+    def __init__(self, data_path=DATA_PATH, dedupe=False, fig_dir='graphics', wordcloud_dir='wordclouds',
+                 cache_dir=PIPELINE_DIR, workers=None):
+        self.settings = {'data_path': data_path, 'dedupe': dedupe, 'fig_dir': fig_dir,
+                         'wordcloud_dir': wordcloud_dir}
+        self.cache_dir = cache_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.values = {'settings': self.settings}
+        self.nodes = {name: Node(name, *spec) for name, spec in NODES.items()}
+        self._charts = None
+        self._version = None
+        self._locks = {}
+        self.computed = []
+        self.loaded = []
+        self.failed = {}
+
+    def node(self, name):
+        if name not in self.nodes:
+            # Grafik düğümleri ilk istendiklerinde (grafik modülleri yüklenerek) eklenir
+            self.charts()
+        if name not in self.nodes:
+            raise ValueError(f"bilinmeyen düğüm: {name}")
+        return self.nodes[name]
+
+    def charts(self):
+        """Grafik düğümlerinin adları"""
+        if self._charts is None:
+            self._charts = chart_nodes()
+            for chart, (section, filename) in self._charts.items():
+                self.nodes.setdefault(chart, Node(chart, 'netflix_analysis.pipeline', 'draw_chart',
+                                                  [section, 'settings'], True, 'pyplot',
+                                                  {'section': section, 'filename': filename}))
+        return list(self._charts)
+
+    @property
+    def version(self):
+        if self._version is None:
+            from netflix_analysis.catalog import dataset_version
+
+            self._version = dataset_version(self.settings['data_path'])
+            if self.settings['dedupe']:
+                self._version += DEDUPE_SUFFIX
+        return self._version
+
+    def _cache_path(self, node):
+        if self.cache_dir is None:
+            return None
+        # Grafiklerin anahtarına çıktı klasörleri de katılır; analiz sonuçları klasörden bağımsızdır
+        settings = self.settings if node.lock == 'pyplot' else {'dedupe': self.settings['dedupe']}
+        key = [PIPELINE_FORMAT, self.version, settings, node.name, node.options]
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f'{node.name}-{digest}.pkl')
+
+    def _load(self, node):
+        path = self._cache_path(node)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        # Grafik ve kelime bulutu düğümlerinin değeri dosya yoludur; dosya silindiyse yeniden üretilir
+        if node.lock == 'pyplot' and not os.path.exists(value):
+            return None
+        return value
+
+    def _save(self, node, value):
+        path = self._cache_path(node)
+        if path is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def plan(self, targets):
+        """Hedefler için çalıştırılması gereken düğümler (topolojik sırayla).
+
+        Bellekte olan veya diskten okunabilen düğümler plana girmez ve ataları ziyaret edilmez.
+        """
+        order, visiting, done = [], set(), set(self.values)
+        for target in targets:
+            stack = [(target, False)]
+            while stack:
+                name, expanded = stack.pop()
+                if expanded:
+                    visiting.discard(name)
+                    done.add(name)
+                    order.append(name)
+                    continue
+                if name in done:
+                    continue
+                if name in visiting:
+                    raise ValueError(f"bağımlılık döngüsü: {name}")
+                node = self.node(name)
+                if node.persist:
+                    value = self._load(node)
+                    if value is not None:
+                        self.values[name] = value
+                        self.loaded.append(name)
+                        done.add(name)
+                        continue
+                visiting.add(name)
+                stack.append((name, True))
+                stack.extend((parent, False) for parent in reversed(node.inputs) if parent not in done)
+        return order
+
+    def _compute(self, name):
+        node = self.nodes[name]
+        inputs = [self.values[parent] for parent in node.inputs]
+        if node.lock is None:
+            value = node.run(inputs)
+        else:
+            with self._locks.setdefault(node.lock, threading.Lock()):
+                value = node.run(inputs)
+        if node.persist:
+            self._save(node, value)
+        return value
+
+    def run(self, targets, workers=None):
+        """Hedef düğümleri hesapla ve {ad: değer} döndür; girdileri hazır düğümler paralel çalışır.
+
+        Hata veren bir düğümün yalnızca torunları atlanır, bağımsız dallar tamamlanır; sonunda PipelineError
+        yükseltilir (başarılı düğümler `values` içinde ve diskte kalır).
+        """
+        targets = list(targets)
+        self.computed, self.loaded, self.failed = [], [], {}
+        order = self.plan(targets)
+        waiting = {name: {parent for parent in self.nodes[name].inputs if parent not in self.values}
+                   for name in order}
+        children = {}
+        for name, parents in waiting.items():
+            for parent in parents:
+                children.setdefault(parent, []).append(name)
+
+        workers = workers or self.workers
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            running = {}
+            while waiting or running:
+                for name in [name for name in order if name in waiting and not waiting[name]]:
+                    del waiting[name]
+                    running[executor.submit(self._compute, name)] = name
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        self.values[name] = future.result()
+                    except Exception as e:
+                        self.failed[name] = e
+                        # Torunlar hiç çalıştırılmaz
+                        stack = list(children.get(name, ()))
+                        while stack:
+                            child = stack.pop()
+                            if waiting.pop(child, None) is not None:
+                                stack.extend(children.get(child, ()))
+                        continue
+                    self.computed.append(name)
+                    for child in children.get(name, ()):
+                        waiting[child].discard(name)
+
+        if self.failed:
+            raise PipelineError(self.failed, [name for name in targets if name not in self.values])
+        return {name: self.values[name] for name in targets}
+
+    def get(self, name):
+        return self.run([name])[name]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analiz düğümlerini bağımlılıklarıyla birlikte çalıştır")
+    parser.add_argument('targets', nargs='*', help="düğüm adları (ör. type_distribution_pie, directors)")
+    parser.add_argument('--all', action='store_true', help="bütün grafikleri üret")
+    parser.add_argument('--list', action='store_true', help="düğümleri ve girdilerini listele")
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--fig-dir', default='graphics', help="grafik klasörü (varsayılan: graphics)")
+    parser.add_argument('--workers', type=int, help="paralel iş parçacığı sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument('--no-cache', action='store_true', help="diskteki düğüm önbelleğini kullanma")
+    parser.add_argument('--dedupe', action='store_true', help="tekrar listelenen içerikleri bir kez say")
+    args = parser.parse_args(argv)
+
+    # Grafikler dosyaya çizilir, pencere açılmaz
+    import matplotlib
+    matplotlib.use('Agg')
+
+    pipeline = Pipeline(args.data, dedupe=args.dedupe, fig_dir=args.fig_dir,
+                        cache_dir=None if args.no_cache else PIPELINE_DIR, workers=args.workers)
+    if args.list:
+        pipeline.charts()
+        for name, node in pipeline.nodes.items():
+            print(f"{name}: {', '.join(node.inputs)}")
+        return 0
+
+    targets = args.targets
+    if args.all:
+        targets = targets + pipeline.charts() + ['wordclouds']
+    if not targets:
+        parser.error("en az bir düğüm adı veya --all gerekli")
+
+    start_time = time.time()
+    try:
+        pipeline.run(targets)
+    except ValueError as e:
+        print(f"Çalıştırılamadı: {e}")
+        return 1
+    except PipelineError as e:
+        for name, error in e.failures.items():
+            print(f"{name} hesaplanamadı: {error}")
+    print(f"{len(pipeline.computed)} düğüm hesaplandı, {len(pipeline.loaded)} düğüm önbellekten okundu "
+          f"({time.time() - start_time:.2f} saniye)")
+    for name in targets:
+        value = pipeline.values.get(name)
+        if isinstance(value, str):
+            print(f"{name}: {value}")
+    return 1 if pipeline.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.catalog import MULTI_VALUE_COLUMNS, PLACEHOLDER
+from netflix_analysis.country_clusters import CLUSTERS_DIR, DEFAULT_CLUSTERS, cluster_countries
+from netflix_analysis.trends import TrendTable
+
+SINGLE_VALUE_DIMENSIONS = ['type', 'rating', 'rating_group', 'release_year', 'year_added']
+YEAR_DIMENSIONS = ['release_year', 'year_added']
+DIMENSIONS = SINGLE_VALUE_DIMENSIONS + list(MULTI_VALUE_COLUMNS)
+# Trendlerde ortalaması alınabilen metrikler (delay: eklenme yılı - yayın yılı)
+TREND_METRICS = ['minutes', 'seasons', 'delay']
+
+# Başlık araması sonuçlarında döndürülen sütunlar
+SEARCH_COLUMNS = ['show_id', 'title', 'type', 'director', 'country', 'release_year', 'year_added', 'rating',
+                  'duration', 'listed_in']
+
+
+def _labelled_rows(catalog, dimension, mask):
+    """Maskedeki satırlar için (satır konumu, değer) çiftleri; çok değerli sütunlarda köprü tablosu kullanılır"""
+    if dimension in MULTI_VALUE_COLUMNS:
+        bridge = catalog.bridge(dimension)
+        selected = mask[bridge.rows]
+        return bridge.rows[selected], bridge.values[bridge.codes[selected]]
+
+    column = catalog.df[dimension]
+    rows = np.flatnonzero(mask & column.notna().values)
+    labels = column.values[rows]
+    if dimension in YEAR_DIMENSIONS:
+        labels = labels.astype(int)
+    return rows, np.asarray(labels, dtype=object)
+
+
+def value_counts(catalog, dimension, mask):
+    if dimension in MULTI_VALUE_COLUMNS:
+        bridge = catalog.bridge(dimension)
+        counts = pd.Series(bridge.counts(mask), index=bridge.values)
+        return counts[counts > 0]
+
+    _, labels = _labelled_rows(catalog, dimension, mask)
+    return pd.Series(labels).value_counts()
+
+
+def _sorted_counts(counts, dimension):
+    if dimension in YEAR_DIMENSIONS:
+        return counts.sort_index()
+    # Sayıya göre azalan, eşitlikte değere göre sıralama (çıktı deterministik olsun)
+    order = np.lexsort((counts.index.astype(str), -counts.values))
+    return counts.iloc[order]
+
+
+def counts(catalog, by, mask):
+    result = _sorted_counts(value_counts(catalog, by, mask), by)
+    return [{by: _plain(value), 'count': int(n)} for value, n in result.items()]
+
+
+def top(catalog, dimension, mask, n=10):
+    """En çok içeriğe sahip değerler ('Not Given' yer tutucusu hariç)"""
+    result = value_counts(catalog, dimension, mask)
+    result = result[result.index != PLACEHOLDER]
+    order = np.lexsort((result.index.astype(str), -result.values))
+    result = result.iloc[order].head(n)
+    return [{dimension: _plain(value), 'count': int(count)} for value, count in result.items()]
+
+
+def crosstab(catalog, row_dimension, column_dimension, mask):
+    """İki boyutun çapraz tablosu; her satır bir `row_dimension` değeri"""
+    rows_a, labels_a = _labelled_rows(catalog, row_dimension, mask)
+    rows_b, labels_b = _labelled_rows(catalog, column_dimension, mask)
+
+    left = pd.DataFrame({'row': rows_a, 'a': labels_a})
+    right = pd.DataFrame({'row': rows_b, 'b': labels_b})
+    table = left.merge(right, on='row').groupby(['a', 'b']).size().unstack(fill_value=0)
+
+    if row_dimension in YEAR_DIMENSIONS:
+        table = table.sort_index()
+    else:
+        table = table.loc[table.sum(axis=1).sort_values(ascending=False, kind='stable').index]
+
+    records = []
+    for value, row in table.iterrows():
+        record = {row_dimension: _plain(value)}
+        record.update({str(column): int(n) for column, n in row.items()})
+        records.append(record)
+    return records
+
+
+def _metric_values(catalog, metric):
+    df = catalog.df
+    if metric == 'delay':
+        return (df['year_added'] - df['release_year']).values.astype(float)
+    return df[metric].values.astype(float)
+
+
+def trend(catalog, mask, year_field='release_year', by=None, metric=None, window=None, yoy=False):
+    """Yıllara göre içerik sayısı; `by` verilirse grup bazında.
+
+    `metric` verilirse sayı yerine metriğin ortalaması, `window` verilirse son `window` yılın kayan toplamı
+    (metriklerde ortalaması), `yoy` verilirse bu değerlerin bir önceki yıla göre büyüme oranı döner.
+    Tüm gruplar tek bir TrendTable geçişinden hesaplanır.
+    """
+    if metric is None and window is None and not yoy:
+        if by is None:
+            return counts(catalog, year_field, mask)
+        return crosstab(catalog, year_field, by, mask)
+
+    if metric is not None and metric not in TREND_METRICS:
+        raise ValueError(f"bilinmeyen metrik: {metric} (seçenekler: {', '.join(TREND_METRICS)})")
+
+    if by is None:
+        rows, groups = np.flatnonzero(mask), None
+    else:
+        rows, groups = _labelled_rows(catalog, by, mask)
+    metrics = {} if metric is None else {metric: _metric_values(catalog, metric)[rows]}
+    table = TrendTable.build(catalog.df[year_field].values[rows], groups, metrics, year_field, by)
+
+    grid = table.yoy(metric, window) if yoy else table.grid(metric, window)
+    result = table.frame(grid, series=by is None)
+    if by is None:
+        key = 'yoy' if yoy else metric or 'count'
+        return [{year_field: _plain(year), key: _plain(value)} for year, value in result.items()]
+
+    records = []
+    for year, row in result.iterrows():
+        record = {year_field: _plain(year)}
+        record.update({str(group): _plain(value) for group, value in row.items()})
+        records.append(record)
+    return records
+
+
+def search(catalog, query, mask, mode='tokens', n=10):
+    """Başlık araması; eşleşen içerikler bilgileriyle (bulanık aramada benzerlik skoruyla birlikte)"""
+    rows, scores = catalog.titles().search(query, mode)
+    keep = mask[rows]
+    rows, scores = rows[keep][:n], scores[keep][:n]
+
+    values = {column: catalog.df[column].values[rows] for column in SEARCH_COLUMNS}
+    records = []
+    for i, score in enumerate(scores):
+        record = {column: _plain(column_values[i]) for column, column_values in values.items()}
+        if mode == 'fuzzy':
+            record['score'] = round(float(score), 3)
+        records.append(record)
+    return records
+
+
+def title_row(catalog, title):
+    """show_id veya başlıktan satır konumu: önce show_id, sonra birebir başlık, sonra kelime araması"""
+    rows = np.flatnonzero(catalog.df['show_id'].values == title)
+    for mode in ('exact', 'tokens'):
+        if len(rows):
+            break
+        rows, _ = catalog.titles().search(title, mode)
+    if not len(rows):
+        raise ValueError(f"içerik bulunamadı: {title}")
+    return int(rows[0])
+
+
+def similar(catalog, title, mask, n=10):
+    """`title` (show_id veya başlık) ile kategori, ülke, direktör, yaş sınırı, yıl ve süresi en benzer içerikler.
+
+    Komşular önceden hesaplanmıştır (satır başına neighbors.NEIGHBORS); filtreler bu komşulara uygulanır.
+    """
+    rows, scores = catalog.neighbors().neighbors(title_row(catalog, title))
+    keep = mask[rows]
+    rows, scores = rows[keep][:n], scores[keep][:n]
+
+    values = {column: catalog.df[column].values[rows] for column in SEARCH_COLUMNS}
+    records = []
+    for i, score in enumerate(scores):
+        record = {column: _plain(column_values[i]) for column, column_values in values.items()}
+        record['score'] = round(float(score), 3)
+        records.append(record)
+    return records
+
+
+def duplicates(catalog, mask, n=None):
+    """Farklı show_id'lerle tekrar listelenen içerik grupları (en az bir satırı maskede olan ilk n grup)"""
+    return catalog.duplicates().records(catalog.df, mask, n)
+
+
+def country_clusters(catalog, mask, n_clusters=DEFAULT_CLUSTERS, metric='jensenshannon', method='hierarchical',
+                     by_year=False, year_field='year_added', cache_dir=CLUSTERS_DIR):
+    """Ülkelerin (veya ülke-yıl gruplarının) kategori/tür/yaş sınırı profillerine göre küme atamaları"""
+    clusters = cluster_countries(catalog, mask, n_clusters=n_clusters, metric=metric, method=method,
+                                 by_year=by_year, year_field=year_field, cache_dir=cache_dir)
+    return clusters.records()
+
+
+def validation(catalog, mask, rules=None, severity=None, rows=False, n=100):
+    """Yükleme sırasındaki doğrulama: kural başına ihlal sayıları veya (rows=True) ihlal eden ilk n satır"""
+    report = catalog.validation
+    if report is None:
+        raise ValueError("katalog için doğrulama raporu yok")
+    if not rows:
+        return report.summary(mask, rules, severity)
+    return report.records(catalog.df['show_id'].values, mask, rules, severity, n)
+
+
+def series_name(filters):
+    """Filtrelerden model kayıt defterindeki seri adını türet (script'lerle aynı adlandırma)"""
+    active = {key: value for key, value in filters.items() if value}
+    if not active:
+        return 'overall'
+    if list(active) == ['type'] and len(active['type']) == 1:
+        return f"type/{active['type'][0]}"
+
+    parts = []
+    for key in sorted(active):
+        value = active[key]
+        if isinstance(value, tuple):
+            parts.append(f'{key}={value[0]}-{value[1]}')
+        else:
+            parts.append(f"{key}={'|'.join(value)}")
+    return 'query/' + '&'.join(parts)
+
+
+def forecast(catalog, registry, filters, mask, model='poly', year=2025, interval='delta', level=0.95):
+    """Filtrelenmiş serinin tahmini ve tahmin aralığı; seri değişmediyse parametreler kayıt defterinden okunur.
+
+    `interval`: 'delta' (kovaryanstan, delta yöntemi) veya 'bootstrap' (artık bootstrap).
+    """
+    from netflix_analysis.growth_models import BASE_YEAR, n_params
+    from netflix_analysis.growth_series import yearly_counts
+    from netflix_analysis.intervals import forecast_interval
+
+    name = series_name(filters)
+    x, y = yearly_counts(catalog.df.loc[mask])
+    # Parametre sayısından fazla nokta yoksa uydurma anlamsız; kayıt defterine de yazılmaz
+    if len(x) <= n_params(model):
+        raise ValueError(f"{name} serisinde {len(x)} yıl var; {model} modeli için en az {n_params(model) + 1} "
+                         f"yıl gerekli")
+    refits_before = registry.refit_count
+    entry = registry.fit(name, model, x, y, catalog.version)
+    _, lower, upper = forecast_interval(model, x, y, entry.popt, entry.pcov, year - BASE_YEAR, level=level,
+                                        method=interval)
+
+    return [{
+        'series': name,
+        'model': model,
+        'year': year,
+        'forecast': float(registry.forecast(name, model, year)),
+        'lower': _plain(lower),
+        'upper': _plain(upper),
+        'level': level,
+        'interval': interval,
+        'params': [float(p) for p in entry.popt],
+        'data_version': entry.data_version,
+        'refit': registry.refit_count > refits_before,
+    }]
+
+
+def _plain(value):
+    """numpy skalerlerini JSON'a yazılabilir Python değerlerine çevir"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+
+# Kayıtlarda tutulan alanlar; kaynak tabloda olmayanlar None olur
+RECORD_FIELDS = ('show_id', 'type', 'title', 'director', 'country', 'listed_in', 'rating', 'rating_group',
+                 'duration', 'date_added', 'release_year', 'year_added', 'minutes', 'seasons')
+
+# Değerler bu büyüklükte parçalar halinde listeye çevrilir; bellek kullanımı katalog boyutundan bağımsız kalır
+CHUNK_SIZE = 1024
+
+
+class TitleRecord:
+    """Tek bir içeriğin hafif kaydı; pandas Series yerine satır satır işlemede kullanılır.
+
+    Metin alanları sözlükteki ortak nesnelere başvurur (aynı değer bellekte bir kez bulunur);
+    eksik değerler None'dır. `row`, kaydın kaynak tablodaki konumudur.
+    """
+
+    __slots__ = ('row',) + RECORD_FIELDS
+
+    def __init__(self, row, show_id, type, title, director, country, listed_in, rating, rating_group,
+                 duration, date_added, release_year, year_added, minutes, seasons):
+        self.row = row
+        self.show_id = show_id
+        self.type = type
+        self.title = title
+        self.director = director
+        self.country = country
+        self.listed_in = listed_in
+        self.rating = rating
+        self.rating_group = rating_group
+        self.duration = duration
+        self.date_added = date_added
+        self.release_year = release_year
+        self.year_added = year_added
+        self.minutes = minutes
+        self.seasons = seasons
+
+    def __repr__(self):
+        return f"TitleRecord({self.show_id!r}, {self.title!r}, {self.type!r})"
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in RECORD_FIELDS}
+
+
+class RecordTable:
+    """Sütunların sözlük kodlu hali: metin sütunları için kod dizisi + değer sözlüğü, sayılar için dizi"""
+
+    def __init__(self, columns, length):
+        self.columns = columns
+        self.length = length
+
+    @classmethod
+    def from_frame(cls, df, fields=RECORD_FIELDS):
+        columns = {}
+        for field in fields:
+            if field not in df:
+                continue
+            values = df[field]
+            if values.dtype.kind in 'biufmM':
+                columns[field] = values.values
+            else:
+                codes, uniques = pd.factorize(values)
+                columns[field] = (codes.astype(np.int32), np.asarray(uniques, dtype=object))
+        return cls(columns, len(df))
+
+    @classmethod
+    def from_columns(cls, stored, fields=RECORD_FIELDS):
+        """Sütun deposundaki kodlu sütunlardan oluştur; kodlar kopyalanmaz, yalnızca sözlükler nesneye çevrilir"""
+        columns = {}
+        for field in fields:
+            if field not in stored.specs:
+                continue
+            column = stored.encoded(field)
+            if isinstance(column, tuple):
+                codes, dictionary = column
+                column = codes, dictionary.astype(object)
+            columns[field] = column
+        return cls(columns, len(stored))
+
+    def __len__(self):
+        return self.length
+
+    def _values(self, field, rows):
+        """Alanın seçili satırlardaki Python değerleri (eksikler None)"""
+        column = self.columns.get(field)
+        if column is None:
+            return [None] * len(rows)
+        if isinstance(column, tuple):
+            codes, uniques = column
+            codes = codes[rows]
+            values = uniques[np.maximum(codes, 0)].tolist()
+            for i in np.flatnonzero(codes < 0).tolist():
+                values[i] = None
+            return values
+
+        values = column[rows]
+        if values.dtype.kind == 'M':
+            dates = np.datetime_as_string(values, unit='D').tolist()
+            return [None if date == 'NaT' else date for date in dates]
+        if values.dtype.kind in 'biu':
+            return values.tolist()
+        if np.array_equal(values, np.round(values)):
+            # Tam sayı sütunu (yıllar, süreler): eksik değer yok
+            return values.astype(np.int64).tolist()
+        missing = np.isnan(values)
+        if np.array_equal(values[~missing], np.round(values[~missing])):
+            result = values.astype(object)
+            result[~missing] = values[~missing].astype(np.int64)
+            result[missing] = None
+            return result.tolist()
+        return [None if v != v else v for v in values.tolist()]
+
+    def records(self, rows=None):
+        """Kayıtları sırayla üret; satır başına yalnızca bir __slots__ nesnesi oluşturulur"""
+        rows = np.arange(self.length) if rows is None else np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        for start in range(0, len(rows), CHUNK_SIZE):
+            chunk = rows[start:start + CHUNK_SIZE]
+            columns = [self._values(field, chunk) for field in RECORD_FIELDS]
+            for row, values in zip(chunk.tolist(), zip(*columns)):
+                yield TitleRecord(row, *values)
+
+    __iter__ = records
+
+
+def iter_records(df, fields=RECORD_FIELDS):
+    """Bir DataFrame'in satırlarını TitleRecord olarak dolaş (iterrows yerine)"""
+    return RecordTable.from_frame(df, fields).records()
@@ -0,0 +1,321 @@
+"""Tüm grafikleri tek bir HTML raporunda toplayan rapor oluşturucu.
+
+Rapor dosyasına her grafiğin küçük bir önizlemesi (PNG, base64 olarak gömülü) yazılır; tam çözünürlüklü
+(PNG veya SVG) sürümler rapor yanındaki klasörde durur ve yalnızca grafiğin ayrıntısı açıldığında yüklenir
+(`--embed` ile bunlar da rapor dosyasına gömülür). Biçim ve DPI grafik bazında ayarlanabilir:
+
+    python -m netflix_analysis.report
+    python -m netflix_analysis.report --format svg --sections years durations
+    python -m netflix_analysis.report --config report.json --embed
+
+report.json örneği (anahtarlar grafik dosya adları, "*" tüm grafikler için varsayılan):
+
+    {"*": {"format": "png", "dpi": 100}, "netflix_country_rating_heatmap.png": {"format": "svg"}}
+
+Çizilen grafikler veri sürümü, biçim ve DPI ile anahtarlanarak önbelleğe alınır; veri ve ayar değişmediyse
+grafik yeniden çizilmez ve analiz de çalıştırılmaz. Analiz sonuçları pipeline düğümlerinden alınır (bellekte ve
+diskte saklanır), böylece bölümler katalog ve toplam durumunu paylaşır. Eğri uydurma grafikleri ve kelime
+bulutları betikler tarafından üretildiğinden mevcut dosyalarından (özgün biçim ve çözünürlükte) alınır, yalnızca
+önizlemeleri oluşturulur.
+"""
+import argparse
+import base64
+import hashlib
+import html
+import importlib
+import json
+import os
+import shutil
+import sys
+import time
+
+from netflix_analysis.catalog import CACHE_DIR, DATA_PATH, DEDUPE_SUFFIX, dataset_version
+from netflix_analysis.pipeline import Pipeline
+
+REPORT_CACHE_DIR = os.path.join(CACHE_DIR, 'report')
+REPORT_PATH = 'graphics/report.html'
+
+# Önbellek anahtarına katılır; çizim veya önizleme kuralları değiştiğinde artırılır
+REPORT_FORMAT = 1
+
+FORMATS = ['png', 'svg']
+DEFAULT_CHART_CONFIG = {'format': 'png', 'dpi': 100}
+THUMBNAIL_WIDTH = 320
+
+# (ad, başlık); sonuçlar pipeline.NODES içindeki aynı adlı düğümden, grafik listesi charts.<ad>.CHARTS
+SECTIONS = [
+    ('countries', "Ülkeler ve Kategoriler"),
+    ('ratings', "Rating Analizi"),
+    ('directors', "Direktörler"),
+    ('years', "Yıllar"),
+    ('durations', "Süreler"),
+    ('country_clusters', "Ülke Kümeleri"),
+]
+
+# Betiklerin ürettiği grafik klasörleri: (ad, başlık, klasör)
+FILE_SECTIONS = [
+    ('curve_fitting', "Büyüme Modelleri", 'graphics/curve_fitting'),
+    ('wordclouds', "Kelime Bulutları", 'wordclouds'),
+]
+
+
+def load_config(path=None, format=None, dpi=None):
+    """Grafik ayarları: dosya adı -> {'format', 'dpi'}; komut satırı değerleri tüm grafiklerin varsayılanıdır"""
+    config = {}
+    if path:
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+
+    defaults = dict(DEFAULT_CHART_CONFIG)
+    defaults.update(config.pop('*', {}))
+    if format:
+        defaults['format'] = format
+    if dpi:
+        defaults['dpi'] = dpi
+    config = {name: dict(defaults, **settings) for name, settings in config.items()}
+    config['*'] = defaults
+
+    for name, settings in config.items():
+        if settings['format'] not in FORMATS:
+            raise ValueError(f"{name}: bilinmeyen biçim {settings['format']} (seçenekler: {', '.join(FORMATS)})")
+    return config
+
+
+def chart_settings(config, filename):
+    return config.get(filename, config['*'])
+
+
+def _cache_key(*parts):
+    return hashlib.sha1(json.dumps([REPORT_FORMAT, *parts]).encode('utf-8')).hexdigest()[:16]
+
+
+class ReportCache:
+    """Çizilmiş grafiklerin ve önizlemelerin önbelleği (cache/report/<anahtar>.<uzantı>)"""
+
+    def __init__(self, root=REPORT_CACHE_DIR):
+        self.root = root
+
+    def paths(self, key, format):
+        return os.path.join(self.root, f'{key}.{format}'), os.path.join(self.root, f'{key}.thumb.png')
+
+    def has(self, key, format):
+        return all(os.path.exists(path) for path in self.paths(key, format))
+
+    def failure(self, key):
+        """Daha önce çizilemeyen grafiğin hata mesajı (yoksa None)"""
+        try:
+            with open(os.path.join(self.root, f'{key}.failed'), encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def record_failure(self, key, message):
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, f'{key}.failed'), 'w', encoding='utf-8') as f:
+            f.write(message)
+
+
+def _render_chart(plot, data, full_path, thumb_path, settings):
+    """Grafiği istenen biçim/DPI ile ve aynı figürden önizlemesini çiz"""
+    import matplotlib.pyplot as plt
+
+    with plt.rc_context({'savefig.dpi': settings['dpi']}):
+        plot(data, full_path)
+    figure = plt.gcf()
+    figure.savefig(thumb_path, format='png', dpi=THUMBNAIL_WIDTH / figure.get_figwidth(),
+                   facecolor=figure.get_facecolor(), edgecolor='none')
+    plt.close('all')
+
+
+def _chart_entries(name, pipeline, cache, config, version):
+    """Bir bölümün grafikleri: (dosya adı, etiket, tam sürüm yolu, önizleme yolu) veya hata mesajı"""
+    import matplotlib.pyplot as plt
+
+    charts = importlib.import_module(f'netflix_analysis.charts.{name}')
+    entries = []
+    results = None
+    with plt.rc_context():
+        if hasattr(charts, 'apply_theme'):
+            charts.apply_theme()
+        for filename, plot, key, *labels in charts.CHARTS:
+            settings = chart_settings(config, filename)
+            cache_key = _cache_key(version, name, filename, settings)
+            full_path, thumb_path = cache.paths(cache_key, settings['format'])
+            label = labels[-1] if labels else filename
+
+            failure = cache.failure(cache_key)
+            if failure is None and not cache.has(cache_key, settings['format']):
+                try:
+                    if results is None:
+                        results = pipeline.get(name)
+                    os.makedirs(cache.root, exist_ok=True)
+                    _render_chart(plot, results[key], full_path, thumb_path, settings)
+                    print(f"{label} çizildi ({settings['format']}, {settings['dpi']} dpi)")
+                except ImportError as e:
+                    # Ör. wordcloud kurulu değil: grafik rapora alınmaz ve aynı veri/ayarla yeniden denenmez
+                    plt.close('all')
+                    failure = str(e)
+                    cache.record_failure(cache_key, failure)
+            if failure is not None:
+                entries.append((filename, label, None, failure))
+                continue
+            entries.append((filename, label, full_path, thumb_path))
+    return entries
+
+
+def _file_entries(directory, cache):
+    """Betiklerin ürettiği mevcut görsellerin önizlemeleri (kaynağın boyutu ve zamanıyla önbelleğe alınır)"""
+    from PIL import Image
+
+    entries = []
+    if not os.path.isdir(directory):
+        return entries
+    for filename in sorted(os.listdir(directory)):
+        path = os.path.join(directory, filename)
+        if not filename.endswith('.png') or not os.path.isfile(path):
+            continue
+        stat = os.stat(path)
+        _, thumb_path = cache.paths(_cache_key(os.path.abspath(path), stat.st_size, stat.st_mtime_ns,
+                                               THUMBNAIL_WIDTH), 'png')
+        if not os.path.exists(thumb_path):
+            os.makedirs(cache.root, exist_ok=True)
+            with Image.open(path) as picture:
+                picture.thumbnail((THUMBNAIL_WIDTH, THUMBNAIL_WIDTH * picture.height // picture.width or 1))
+                picture.save(thumb_path, format='PNG', optimize=True)
+        entries.append((filename, os.path.splitext(filename)[0].replace('_', ' '), path, thumb_path))
+    return entries
+
+
+def _data_uri(path):
+    mime = 'image/svg+xml' if path.endswith('.svg') else 'image/png'
+    with open(path, 'rb') as f:
+        return f'data:{mime};base64,{base64.b64encode(f.read()).decode("ascii")}'
+
+
+PAGE = """<!DOCTYPE html>
+<html lang="tr">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ background: #000; color: #eee; font-family: sans-serif; margin: 2em; }}
+h1, h2 {{ color: #E50914; }}
+.grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax({width}px, 1fr)); gap: 1.5em; }}
+figure {{ margin: 0; background: #141414; padding: 0.8em; border-radius: 6px; }}
+figure > img {{ width: 100%; }}
+figcaption {{ margin: 0.5em 0; }}
+details img {{ max-width: 90vw; margin-top: 0.5em; }}
+.missing {{ color: #999; font-style: italic; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<p>Veri sürümü {version} · oluşturulma {created}</p>
+{sections}
+</body>
+</html>
+"""
+
+
+def _figure_html(filename, label, full_path, thumb_path, full_src):
+    if full_path is None:
+        return (f'<figure><figcaption>{html.escape(label)}</figcaption>'
+                f'<p class="missing">çizilemedi: {html.escape(thumb_path)}</p></figure>')
+    # Kapalı <details> içindeki loading="lazy" görsel yalnızca açıldığında yüklenir
+    return (f'<figure id="{html.escape(filename)}"><img src="{_data_uri(thumb_path)}" alt="{html.escape(label)}">'
+            f'<figcaption>{html.escape(label)}</figcaption>'
+            f'<details><summary>Tam çözünürlük</summary>'
+            f'<img loading="lazy" src="{html.escape(full_src)}" alt="{html.escape(label)}"></details></figure>')
+
+
+def build_report(path=REPORT_PATH, data_path=DATA_PATH, config=None, sections=None, embed=False,
+                 cache=None, dedupe=False):
+    """Raporu yaz; (grafik sayısı, rapor dosyası boyutu, tam sürümler klasörü veya None) döndür"""
+    config = config or load_config()
+    cache = cache or ReportCache()
+    # Tekilleştirilmiş grafikler ayrı sürüm olarak önbelleğe alınır
+    version = dataset_version(data_path) + (DEDUPE_SUFFIX if dedupe else '')
+    # Bölümlerin ortak kullandığı katalog ve toplam durumu yalnızca bir grafik gerçekten çizilecekse yüklenir
+    pipeline = Pipeline(data_path, dedupe=dedupe)
+    files_dir = os.path.splitext(path)[0] + '_files'
+
+    blocks = []
+    for name, title in SECTIONS:
+        if sections and name not in sections:
+            continue
+        blocks.append((title, _chart_entries(name, pipeline, cache, config, version)))
+    for name, title, directory in FILE_SECTIONS:
+        if sections and name not in sections:
+            continue
+        entries = _file_entries(directory, cache)
+        if entries:
+            blocks.append((title, entries))
+
+    if not embed:
+        # Eski tam sürümler kalmasın: klasör her seferinde yeniden doldurulur
+        shutil.rmtree(files_dir, ignore_errors=True)
+        os.makedirs(files_dir, exist_ok=True)
+
+    html_sections = []
+    count = 0
+    for title, entries in blocks:
+        figures = []
+        for filename, label, full_path, thumb_path in entries:
+            full_src = None
+            if full_path is not None:
+                count += 1
+                if embed:
+                    full_src = _data_uri(full_path)
+                else:
+                    target = os.path.splitext(filename)[0] + os.path.splitext(full_path)[1]
+                    shutil.copyfile(full_path, os.path.join(files_dir, target))
+                    full_src = f'{os.path.basename(files_dir)}/{target}'
+            figures.append(_figure_html(filename, label, full_path, thumb_path, full_src))
+        html_sections.append(f'<h2>{html.escape(title)}</h2>\n<div class="grid">\n' + '\n'.join(figures)
+                             + '\n</div>')
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(PAGE.format(title="Netflix Analiz Raporu", version=version, width=THUMBNAIL_WIDTH,
+                            created=time.strftime('%Y-%m-%d %H:%M:%S'), sections='\n'.join(html_sections)))
+    os.replace(tmp_path, path)
+    return count, os.path.getsize(path), None if embed else files_dir
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tüm grafikleri tek HTML raporunda topla")
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--out', default=REPORT_PATH, help=f"rapor dosyası (varsayılan: {REPORT_PATH})")
+    parser.add_argument('--config', help="grafik bazında biçim/DPI ayarları (JSON)")
+    parser.add_argument('--format', choices=FORMATS, help="tüm grafiklerin varsayılan biçimi")
+    parser.add_argument('--dpi', type=int, help="tüm grafiklerin varsayılan DPI değeri")
+    parser.add_argument('--sections', nargs='+', choices=[s[0] for s in SECTIONS] + [s[0] for s in FILE_SECTIONS],
+                        help="yalnızca bu bölümler")
+    parser.add_argument('--embed', action='store_true', help="tam sürümleri de rapor dosyasına göm (tek dosya)")
+    parser.add_argument('--dedupe', action='store_true', help="tekrar listelenen içerikleri bir kez say")
+    args = parser.parse_args(argv)
+
+    # Raporda grafik penceresi açılmaz
+    import matplotlib
+    matplotlib.use('Agg')
+
+    start_time = time.time()
+    try:
+        config = load_config(args.config, args.format, args.dpi)
+    except (OSError, ValueError) as e:
+        print(f"Ayar dosyası okunamadı: {e}")
+        return 1
+    count, size, files_dir = build_report(args.out, args.data, config, args.sections, args.embed,
+                                          dedupe=args.dedupe)
+
+    print(f"\n{count} grafik içeren rapor yazıldı: {args.out} ({size / 1024:.0f} KiB, "
+          f"{time.time() - start_time:.2f} saniye)")
+    if files_dir:
+        total = sum(os.path.getsize(os.path.join(files_dir, f)) for f in os.listdir(files_dir))
+        print(f"Tam çözünürlüklü sürümler: {files_dir} ({total / 1024:.0f} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
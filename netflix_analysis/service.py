@@ -0,0 +1,335 @@
+"""Katalog üzerinde yerel HTTP sorgu servisi.
+
+Katalog bir kez yüklenir; köprü tabloları (ülke, kategori, direktör) ve filtresiz
+temel toplamlar bellekte tutulur. Yanıtlar sorgu parametrelerine göre bir LRU
+önbelleğinde saklanır.
+
+    python -m netflix_analysis.service --port 8050
+
+Uç noktalar (hepsi GET, JSON döner; country/region/type/year_range/year_field/rating_group
+filtrelerini kabul eder):
+    /health
+    /ratings/distribution        rating dağılımı
+    /ratings/groups              rating grubu dağılımı
+    /directors/top?n=15          en çok içeriğe sahip direktörler
+    /countries/type              ülke x tür tablosu ('Not Given' hariç)
+    /trends/yearly?by=type       yıllara göre içerik sayısı
+    /trends/yearly?by=type&metric=minutes&window=3&yoy=1   metrik ortalaması, kayan pencere, yıllık büyüme
+    /counts?by=...  /top?dimension=...&n=...  /crosstab?row=...&column=...
+    /forecast?model=poly&year=2025&interval=delta&level=0.95   tahmin ve tahmin aralığı (delta veya bootstrap)
+    /titles/search?q=...&mode=prefix&n=10   başlık araması (exact, tokens, prefix, fuzzy)
+    /titles/similar?q=s123&n=10   içerik özelliklerine göre benzer içerikler (q: show_id veya başlık)
+    /titles/duplicates?n=20   farklı show_id'lerle tekrar listelenen içerik grupları
+    /countries/clusters?k=6&metric=cosine&method=kmeans&by_year=1   ülkelerin profil kümeleri
+    /validation?severity=error&rows=1&n=50   doğrulama ihlallerinin sayıları veya ihlal eden satırlar
+"""
+import argparse
+import json
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from netflix_analysis import queries
+from netflix_analysis.catalog import PLACEHOLDER, load_catalog
+from netflix_analysis.cli import (CLUSTER_METHODS, CLUSTER_METRICS, INTERVAL_METHODS, SEVERITIES, VALIDATION_RULES,
+                                  parse_level, parse_window, parse_year_range)
+from netflix_analysis.model_registry import REGISTRY_PATH, ModelRegistry
+from netflix_analysis.title_index import SEARCH_MODES
+
+# Yanıtı zamana bağlı olan, önbelleğe alınmayan uç noktalar
+UNCACHED_PATHS = {'/health'}
+
+
+class QueryError(ValueError):
+    pass
+
+
+class QueryService:
+    """Bellekteki katalog üzerinden uç noktaları yanıtlayan servis nesnesi"""
+
+    def __init__(self, catalog, registry, cache_size=1024):
+        self.catalog = catalog
+        self.registry = registry
+        self._registry_lock = threading.Lock()
+        self.started_at = time.time()
+        self.routes = {
+            '/health': self.health,
+            '/ratings/distribution': self.rating_distribution,
+            '/ratings/groups': self.rating_groups,
+            '/directors/top': self.top_directors,
+            '/countries/type': self.country_type,
+            '/countries/clusters': self.country_clusters,
+            '/trends/yearly': self.yearly_trend,
+            '/counts': self.counts,
+            '/top': self.top,
+            '/crosstab': self.crosstab,
+            '/forecast': self.forecast,
+            '/titles/search': self.search_titles,
+            '/titles/similar': self.similar_titles,
+            '/titles/duplicates': self.duplicate_titles,
+            '/validation': self.validation,
+        }
+        self._cached_respond = lru_cache(maxsize=cache_size)(self._respond)
+
+        # Filtresiz temel sorguları önceden hesaplayıp önbelleğe al
+        for path in ['/ratings/distribution', '/ratings/groups', '/directors/top', '/countries/type',
+                     '/trends/yearly']:
+            self.respond(path, ())
+
+    def respond(self, path, params):
+        # Beklenmeyen hatalar bağlantıyı koparmaz, 500 olarak döner; istisnalar LRU önbelleğine girmediğinden
+        # aynı istek bir sonraki seferde yeniden denenir
+        try:
+            if path in UNCACHED_PATHS:
+                return self._respond(path, params)
+            return self._cached_respond(path, params)
+        except Exception as e:
+            return 500, _encode({'error': f"sunucu hatası: {type(e).__name__}: {e}"})
+
+    def _respond(self, path, params):
+        """(durum kodu, JSON gövdesi) döndür; `params` sıralı (anahtar, değerler) demetidir"""
+        handler = self.routes.get(path)
+        if handler is None:
+            return 404, _encode({'error': f"bilinmeyen uç nokta: {path}"})
+
+        params = dict(params)
+        try:
+            filters, year_field = self._filters(params)
+            mask = self.catalog.mask(year_field=year_field, **filters)
+            result = handler(params, filters, mask, year_field)
+        except QueryError as e:
+            return 400, _encode({'error': str(e)})
+        return 200, _encode(result)
+
+    def _filters(self, params):
+        year_field = _single(params, 'year_field', 'release_year')
+        if year_field not in queries.YEAR_DIMENSIONS:
+            raise QueryError(f"geçersiz year_field: {year_field}")
+
+        year_range = _single(params, 'year_range')
+        if year_range is not None:
+            try:
+                year_range = parse_year_range(year_range)
+            except argparse.ArgumentTypeError as e:
+                raise QueryError(str(e))
+
+        filters = {
+            'country': list(params.get('country', ())) or None,
+            'type': list(params.get('type', ())) or None,
+            'year_range': year_range,
+            'rating_group': list(params.get('rating_group', ())) or None,
+            'region': list(params.get('region', ())) or None,
+        }
+        return filters, year_field
+
+    def health(self, params, filters, mask, year_field):
+        return {'status': 'ok', 'titles': len(self.catalog), 'data_version': self.catalog.version,
+                'uptime_seconds': round(time.time() - self.started_at, 1)}
+
+    def rating_distribution(self, params, filters, mask, year_field):
+        return queries.counts(self.catalog, 'rating', mask)
+
+    def rating_groups(self, params, filters, mask, year_field):
+        return queries.counts(self.catalog, 'rating_group', mask)
+
+    def top_directors(self, params, filters, mask, year_field):
+        return queries.top(self.catalog, 'director', mask, n=_int(params, 'n', 15, minimum=0))
+
+    def country_type(self, params, filters, mask, year_field):
+        records = queries.crosstab(self.catalog, 'country', 'type', mask)
+        return [record for record in records if record['country'] != PLACEHOLDER]
+
+    def yearly_trend(self, params, filters, mask, year_field):
+        metric = _single(params, 'metric')
+        if metric is not None and metric not in queries.TREND_METRICS:
+            raise QueryError(f"geçersiz metrik: {metric} (seçenekler: {', '.join(queries.TREND_METRICS)})")
+        window = _single(params, 'window')
+        if window is not None:
+            try:
+                window = parse_window(window)
+            except argparse.ArgumentTypeError as e:
+                raise QueryError(str(e))
+        return queries.trend(self.catalog, mask, year_field=year_field, by=_dimension(params, 'by', required=False),
+                             metric=metric, window=window, yoy=_single(params, 'yoy', '0') in ('1', 'true'))
+
+    def counts(self, params, filters, mask, year_field):
+        return queries.counts(self.catalog, _dimension(params, 'by'), mask)
+
+    def top(self, params, filters, mask, year_field):
+        return queries.top(self.catalog, _dimension(params, 'dimension'), mask, n=_int(params, 'n', 10, minimum=0))
+
+    def crosstab(self, params, filters, mask, year_field):
+        return queries.crosstab(self.catalog, _dimension(params, 'row'), _dimension(params, 'column'), mask)
+
+    def search_titles(self, params, filters, mask, year_field):
+        query = _single(params, 'q')
+        if query is None:
+            raise QueryError("'q' parametresi gerekli")
+        mode = _single(params, 'mode', 'tokens')
+        if mode not in SEARCH_MODES:
+            raise QueryError(f"geçersiz arama türü: {mode} (seçenekler: {', '.join(SEARCH_MODES)})")
+        return queries.search(self.catalog, query, mask, mode=mode, n=_int(params, 'n', 10, minimum=0))
+
+    def similar_titles(self, params, filters, mask, year_field):
+        title = _single(params, 'q')
+        if title is None:
+            raise QueryError("'q' parametresi gerekli")
+        try:
+            return queries.similar(self.catalog, title, mask, n=_int(params, 'n', 10, minimum=0))
+        except ValueError as e:
+            raise QueryError(str(e))
+
+    def duplicate_titles(self, params, filters, mask, year_field):
+        return queries.duplicates(self.catalog, mask, n=_int(params, 'n', 20, minimum=0))
+
+    def country_clusters(self, params, filters, mask, year_field):
+        metric = _single(params, 'metric', 'jensenshannon')
+        if metric not in CLUSTER_METRICS:
+            raise QueryError(f"geçersiz uzaklık: {metric} (seçenekler: {', '.join(CLUSTER_METRICS)})")
+        method = _single(params, 'method', 'hierarchical')
+        if method not in CLUSTER_METHODS:
+            raise QueryError(f"geçersiz kümeleme yöntemi: {method} (seçenekler: {', '.join(CLUSTER_METHODS)})")
+        try:
+            return queries.country_clusters(self.catalog, mask, n_clusters=_int(params, 'k', 6), metric=metric,
+                                            method=method, by_year=_single(params, 'by_year', '0') in ('1', 'true'),
+                                            year_field=year_field)
+        except ValueError as e:
+            raise QueryError(str(e))
+
+    def validation(self, params, filters, mask, year_field):
+        rules = list(params.get('rule', ())) or None
+        for rule in rules or ():
+            if rule not in VALIDATION_RULES:
+                raise QueryError(f"geçersiz kural: {rule} (seçenekler: {', '.join(VALIDATION_RULES)})")
+        severity = _single(params, 'severity')
+        if severity is not None and severity not in SEVERITIES:
+            raise QueryError(f"geçersiz düzey: {severity} (seçenekler: {', '.join(SEVERITIES)})")
+        try:
+            return queries.validation(self.catalog, mask, rules=rules, severity=severity,
+                                      rows=_single(params, 'rows', '0') in ('1', 'true'),
+                                      n=_int(params, 'n', 100, minimum=0))
+        except ValueError as e:
+            raise QueryError(str(e))
+
+    def forecast(self, params, filters, mask, year_field):
+        model = _single(params, 'model', 'poly')
+        if model not in ('linear', 'poly', 'exp', 'logistic'):
+            raise QueryError(f"geçersiz model: {model}")
+        interval = _single(params, 'interval', 'delta')
+        if interval not in INTERVAL_METHODS:
+            raise QueryError(f"geçersiz aralık yöntemi: {interval} (seçenekler: {', '.join(INTERVAL_METHODS)})")
+        try:
+            level = parse_level(_single(params, 'level', '0.95'))
+        except argparse.ArgumentTypeError as e:
+            raise QueryError(str(e))
+        if filters['year_range'] and year_field != 'release_year':
+            filters[f'{year_field}_range'] = filters.pop('year_range')
+
+        # Kayıt defteri paylaşılan durum tutuyor; uydurmalar sırayla yapılmalı
+        with self._registry_lock:
+            try:
+                return queries.forecast(self.catalog, self.registry, filters, mask, model=model,
+                                        year=_int(params, 'year', 2025), interval=interval, level=level)
+            except (RuntimeError, TypeError, ValueError) as e:
+                raise QueryError(f"model uydurulamadı: {e}")
+
+
+def _encode(result):
+    return json.dumps(result, ensure_ascii=False).encode('utf-8')
+
+
+def _single(params, key, default=None):
+    values = params.get(key)
+    return values[-1] if values else default
+
+
+def _int(params, key, default, minimum=None):
+    value = _single(params, key)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise QueryError(f"{key} bir tam sayı olmalı: {value!r}")
+    if minimum is not None and number < minimum:
+        raise QueryError(f"{key} en az {minimum} olmalı: {value!r}")
+    return number
+
+
+def _dimension(params, key, required=True):
+    value = _single(params, key)
+    if value is None:
+        if required:
+            raise QueryError(f"'{key}' parametresi gerekli")
+        return None
+    if value not in queries.DIMENSIONS:
+        raise QueryError(f"geçersiz boyut: {value} (seçenekler: {', '.join(queries.DIMENSIONS)})")
+    return value
+
+
+def normalize_query(query):
+    """Önbellek anahtarı: parametre sırasından bağımsız, hashlenebilir demet"""
+    parsed = parse_qs(query, keep_blank_values=False)
+    return tuple(sorted((key, tuple(values)) for key, values in parsed.items()))
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        # Keep-alive bağlantıları için (yük testinde bağlantı kurma maliyetini önler)
+        protocol_version = 'HTTP/1.1'
+        # Başlık ve gövde ayrı yazıldığından Nagle + gecikmeli ACK her yanıta ~40 ms ekliyor
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            status, body = service.respond(url.path.rstrip('/') or '/', normalize_query(url.query))
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Her istek için satır yazdırmak yük altında darboğaz oluyor
+            pass
+
+    return Handler
+
+
+def create_server(host='127.0.0.1', port=8050, data_path='data/netflix1.csv', cache_size=1024, dedupe=False):
+    catalog = load_catalog(data_path, dedupe=dedupe)
+    service = QueryService(catalog, ModelRegistry(REGISTRY_PATH), cache_size=cache_size)
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Netflix katalog sorgu servisi")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8050)
+    parser.add_argument('--data', default='data/netflix1.csv')
+    parser.add_argument('--cache-size', type=int, default=1024, help="LRU yanıt önbelleği boyutu")
+    parser.add_argument('--dedupe', action='store_true', help="tekrar listelenen içerikleri bir kez say")
+    args = parser.parse_args(argv)
+
+    start_time = time.time()
+    server = create_server(args.host, args.port, args.data, args.cache_size, args.dedupe)
+    print(f"Katalog yüklendi ({len(server.service.catalog)} içerik, {time.time() - start_time:.2f} saniye).")
+    print(f"Servis çalışıyor: http://{args.host}:{server.server_address[1]}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServis durduruluyor...")
+    finally:
+        server.service.registry.save()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""Birleştirilebilir kantil özetleri (t-digest): film süreleri, sezon sayıları ve eklenme gecikmeleri.
+
+Her (metrik, eklenme yılı, tür, kategori) için değerlerin tamamı yerine ağırlıklı merkezlerden oluşan küçük
+bir özet tutulur. Özetler satırlar geldikçe tek geçişte güncellenir ve birbiriyle birleştirilebilir; yıl
+bazında medyan veya kategori bazında p90 gibi herhangi bir yüzdelik, ilgili özetler birleştirilerek hesaplanır.
+
+Merkezler k1 ölçek fonksiyonuna göre gruplanır: dağılımın uçlarında kümeler küçük (uç yüzdelikler hassas),
+ortasında büyük kalır. Sıkıştırma tek bir sıralama ve gruplu toplamla yapılır (merkez başına döngü yok).
+"""
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.catalog import MULTI_VALUE_COLUMNS, Bridge
+
+# Özet başına merkez sayısının yaklaşık üst sınırını belirler
+DEFAULT_COMPRESSION = 100
+
+# Özetlenen metrikler ve özet anahtarının alanları; kategori None ise özet içerik düzeyindedir
+# (bir içerik birden fazla kategoride olabildiğinden kategori özetleri birleştirilince tekrar sayılır)
+SKETCH_METRICS = ['minutes', 'seasons', 'years_delay']
+SKETCH_KEYS = ['year_added', 'type', 'category']
+
+DEFAULT_QUANTILES = [0.5, 0.9]
+
+
+class TDigest:
+    """Bir değer kümesinin t-digest özeti: sıralı merkez ortalamaları, ağırlıkları ve tek değerli olup olmadıkları.
+
+    Tek bir değerden oluşan merkezler (`exact`) kesin kalır: ayrık verilerde (sezon sayısı, yıl farkı) bir
+    değerin tekrarları tek merkezde toplanır ve o değere düşen yüzdelikler ara değer yerine değerin kendisidir.
+    """
+
+    __slots__ = ('compression', 'means', 'weights', 'exact', 'min', 'max')
+
+    def __init__(self, compression=DEFAULT_COMPRESSION, means=None, weights=None, exact=None, min=np.inf,
+                 max=-np.inf):
+        self.compression = compression
+        self.means = np.asarray(means if means is not None else [], dtype=float)
+        self.weights = np.asarray(weights if weights is not None else [], dtype=float)
+        self.exact = np.asarray(exact if exact is not None else np.ones(len(self.means)), dtype=bool)
+        self.min = float(min)
+        self.max = float(max)
+
+    @property
+    def count(self):
+        return float(self.weights.sum())
+
+    def add(self, values):
+        """Değerleri özete ekle (NaN'lar atlanır)"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values):
+            # Aynı değerin tekrarları baştan tek bir kesin merkeze indirilir
+            values, counts = np.unique(values, return_counts=True)
+            self.min = min(self.min, float(values[0]))
+            self.max = max(self.max, float(values[-1]))
+            self._compress(np.concatenate([self.means, values]), np.concatenate([self.weights, counts]),
+                           np.concatenate([self.exact, np.ones(len(values), dtype=bool)]))
+        return self
+
+    def merge(self, other):
+        """Başka bir özeti bu özete kat"""
+        if len(other.means):
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self._compress(np.concatenate([self.means, other.means]),
+                           np.concatenate([self.weights, other.weights]),
+                           np.concatenate([self.exact, other.exact]))
+        return self
+
+    def copy(self):
+        return TDigest(self.compression, self.means.copy(), self.weights.copy(), self.exact.copy(), self.min,
+                       self.max)
+
+    def _scale(self, q):
+        """k1 ölçek fonksiyonu: uçlarda hızlı artar, böylece uçlardaki kümeler küçük kalır"""
+        return self.compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0, 1) - 1)
+
+    def _compress(self, means, weights, exact):
+        order = np.argsort(means, kind='stable')
+        means, weights, exact = means[order], weights[order], exact[order]
+        cumulative = np.cumsum(weights)
+        k_left = self._scale((cumulative - weights) / cumulative[-1])
+        k_right = self._scale(cumulative / cumulative[-1])
+
+        # Merkezler sol kenarlarının k ölçeğindeki birim aralığına göre kümelenir (bir kümede k ~1 artar);
+        # tek başına bir birimden geniş merkezler (sık tekrarlanan değerler) ve ardından gelen merkez yeni küme açar
+        wide = k_right - k_left >= 1
+        bins = np.floor(k_left)
+        new_cluster = np.r_[True, (bins[1:] != bins[:-1]) | wide[1:] | wide[:-1]]
+        starts = np.flatnonzero(new_cluster)
+
+        merged = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged
+        self.weights = merged
+        self.exact = ((np.add.reduceat(exact.astype(np.int64), starts) == np.diff(np.r_[starts, len(means)]))
+                      & (np.minimum.reduceat(means, starts) == np.maximum.reduceat(means, starts)))
+
+    def quantile(self, q):
+        """q (skaler veya dizi) yüzdeliklerinin tahmini.
+
+        Sıra konumu pandas'taki gibi q * (n - 1)'dir; kesin merkezler kapladıkları sıraların tamamında kendi
+        değerlerini verir, diğer merkezler arasında doğrusal ara değer alınır. Özet yalnızca kesin
+        merkezlerden oluşuyorsa sonuç pandas'ın (linear) yüzdelikleriyle aynıdır.
+        """
+        q = np.asarray(q, dtype=float)
+        if not len(self.weights):
+            return np.full(q.shape, np.nan)
+        cumulative = np.cumsum(self.weights)
+        left = cumulative - self.weights
+
+        # Kesin merkezler ilk ve son sıralarının orta noktalarında iki nokta, diğerleri ağırlık merkezinde tek nokta
+        index = np.repeat(np.arange(len(self.weights)), np.where(self.exact, 2, 1))
+        second = np.r_[False, index[1:] == index[:-1]]
+        positions = np.where(self.exact[index], np.where(second, cumulative[index] - 0.5, left[index] + 0.5),
+                             left[index] + self.weights[index] / 2)
+
+        positions = np.r_[0.0, positions, cumulative[-1]]
+        values = np.r_[self.min, self.means[index], self.max]
+        return np.interp(q * (cumulative[-1] - 1) + 0.5, positions, values)
+
+    def to_list(self):
+        return [self.means.tolist(), self.weights.tolist(), self.exact.astype(int).tolist(), self.min, self.max]
+
+    @classmethod
+    def from_list(cls, item, compression=DEFAULT_COMPRESSION):
+        means, weights, exact, low, high = item
+        return cls(compression, means, weights, exact, low, high)
+
+
+def quantile_label(q):
+    """0.5 -> 'p50', 0.9 -> 'p90'"""
+    return f"p{q * 100:g}"
+
+
+def _metric_frame(df):
+    """Özetlenen metrikler ve anahtar alanları (satır konumu sırasıyla)"""
+    fields = pd.DataFrame({
+        'year_added': df['year_added'].values,
+        'type': df['type'].values,
+        'minutes': df['minutes'].values,
+        'seasons': df['seasons'].values,
+    })
+    fields['years_delay'] = fields['year_added'] - df['release_year'].values
+    return fields
+
+
+class QuantileSketches:
+    """(metrik, eklenme yılı, tür, kategori) -> TDigest özetleri"""
+
+    def __init__(self, digests=None, compression=DEFAULT_COMPRESSION):
+        self.digests = dict(digests or {})
+        self.compression = compression
+
+    @classmethod
+    def from_frame(cls, df, compression=DEFAULT_COMPRESSION):
+        sketches = cls(compression=compression)
+        sketches.add_frame(df)
+        return sketches
+
+    def add_frame(self, df):
+        """Ayrıştırılmış satırları özetlere ekle: her metrik için satırlar anahtara göre bir kez sıralanır"""
+        fields = _metric_frame(df)
+        bridge = Bridge.from_column(df[MULTI_VALUE_COLUMNS['category']].reset_index(drop=True))
+        categories = pd.DataFrame({'_row': bridge.rows, 'category': bridge.values[bridge.codes]})
+        fields['_row'] = np.arange(len(fields))
+
+        for metric in SKETCH_METRICS:
+            table = fields.dropna(subset=['year_added', 'type', metric])
+            # İçerik düzeyi (kategori None) ve kategori düzeyi özetler
+            self._add_groups(metric, table.assign(category=None), ['year_added', 'type'])
+            self._add_groups(metric, table.merge(categories, on='_row'), SKETCH_KEYS)
+
+    def _add_groups(self, metric, table, keys):
+        if not len(table):
+            return
+        table = table.sort_values(keys, kind='stable')
+        values = table[metric].values
+        key_values = [table[key].values for key in SKETCH_KEYS]
+        changed = np.zeros(len(table), dtype=bool)
+        changed[0] = True
+        for key in keys:
+            column = table[key].values
+            changed[1:] |= column[1:] != column[:-1]
+        bounds = np.r_[np.flatnonzero(changed), len(table)]
+
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            key = (metric,) + tuple(_plain(column[start]) for column in key_values)
+            digest = self.digests.get(key)
+            if digest is None:
+                digest = self.digests[key] = TDigest(self.compression)
+            digest.add(values[start:end])
+
+    def merge(self, other):
+        """Başka bir özet kümesini (ör. ayrı işlenmiş bir veri parçasını) kat"""
+        for key, digest in other.digests.items():
+            if key in self.digests:
+                self.digests[key].merge(digest)
+            else:
+                self.digests[key] = digest.copy()
+
+    def digest(self, metric, **filters):
+        """Filtreye uyan özetlerin birleşimi; `category` verilmezse içerik düzeyi özetler kullanılır"""
+        return next(iter(self._grouped(metric, (), filters).values()), TDigest(self.compression))
+
+    def _grouped(self, metric, by, filters):
+        category_level = 'category' in by or 'category' in filters
+        filters = {name: set(np.atleast_1d(values).tolist()) for name, values in filters.items()}
+        groups = {}
+        for key, digest in self.digests.items():
+            if key[0] != metric or (key[3] is not None) != category_level:
+                continue
+            fields = dict(zip(SKETCH_KEYS, key[1:]))
+            if any(fields[name] not in values for name, values in filters.items()):
+                continue
+            group = tuple(fields[name] for name in by)
+            if group in groups:
+                groups[group].merge(digest)
+            else:
+                groups[group] = digest.copy()
+        return groups
+
+    def quantiles(self, metric, q=DEFAULT_QUANTILES, by=('year_added',), **filters):
+        """`by` alanlarına göre gruplanmış yüzdelikler: satırlar gruplar, sütunlar p50, p90 gibi etiketler.
+
+        Filtreler alan adı -> değer(ler), örn. type='Movie' veya category=['Dramas', 'Comedies'].
+        """
+        by = list(by)
+        q = list(np.atleast_1d(q))
+        groups = self._grouped(metric, by, filters)
+        keys = sorted(groups)
+        if len(by) == 1:
+            index = pd.Index([key[0] for key in keys], name=by[0])
+        else:
+            index = pd.MultiIndex.from_tuples(keys, names=by)
+        values = np.array([groups[key].quantile(q) for key in keys]).reshape(len(keys), len(q))
+        return pd.DataFrame(values, index=index, columns=[quantile_label(value) for value in q])
+
+    def to_list(self):
+        return [[*key, *digest.to_list()] for key, digest in sorted(self.digests.items(), key=_sort_key)]
+
+    @classmethod
+    def from_list(cls, items, compression=DEFAULT_COMPRESSION):
+        return cls({tuple(item[:4]): TDigest.from_list(item[4:], compression) for item in items}, compression)
+
+
+def _plain(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _sort_key(item):
+    # Kategori None olabilir; içerik düzeyi özetler önce gelsin
+    key = item[0]
+    return key[:3], key[3] is not None, key[3] or ''
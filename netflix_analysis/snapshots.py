@@ -0,0 +1,242 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.aggregates import TRACKED_VALUES, AggregateState
+from netflix_analysis.catalog import CACHE_DIR, MULTI_VALUE_COLUMNS, Bridge, dataset_version, parse_catalog
+from netflix_analysis.sketches import QuantileSketches
+
+SNAPSHOT_DIR = os.path.join(CACHE_DIR, 'snapshots')
+
+# Anlık görüntü dosya biçimi değiştiğinde artırılır
+SNAPSHOT_FORMAT = 1
+
+# Hata mesajında gösterilen en fazla tekrarlanan show_id sayısı
+MAX_LISTED_DUPLICATES = 5
+
+# Parmak izine ve değişen alan karşılaştırmasına giren ham CSV sütunları
+SOURCE_COLUMNS = ['show_id', 'type', 'title', 'director', 'country', 'date_added', 'release_year', 'rating',
+                  'duration', 'listed_in']
+
+
+def row_fingerprints(raw):
+    """show_id -> satırın ham sütunlarından hesaplanan 64 bit özet; show_id benzersiz değilse ValueError"""
+    show_ids = raw['show_id']
+    duplicated = show_ids[show_ids.duplicated(keep=False)].unique()
+    if len(duplicated):
+        listed = ', '.join(str(show_id) for show_id in duplicated[:MAX_LISTED_DUPLICATES])
+        raise ValueError(f"show_id benzersiz değil: {len(duplicated)} değer birden fazla satırda var ({listed}"
+                         f"{', ...' if len(duplicated) > MAX_LISTED_DUPLICATES else ''}); anlık görüntü kaydedilmedi")
+    hashes = pd.util.hash_pandas_object(raw[SOURCE_COLUMNS], index=False)
+    return pd.Series(hashes.values, index=pd.Index(raw['show_id'].values, name='show_id'))
+
+
+class Snapshot:
+    """Belirli bir tarihteki ayrıştırılmış katalog ve satır parmak izleri"""
+
+    def __init__(self, date, version, df, fingerprints):
+        self.date = date
+        self.version = version
+        self.df = df
+        self.fingerprints = fingerprints
+
+    def rows(self, show_ids):
+        """Verilen show_id'lere ait satırlar (show_id indeksli, verilen sırayla)"""
+        # Parmak izleri ham satır sırasıyla oluşturulur; konumlar doğrudan df satırlarına karşılık gelir
+        rows = self.df.iloc[self.fingerprints.index.get_indexer(show_ids)]
+        rows.index = pd.Index(show_ids, name='show_id')
+        return rows
+
+
+class CatalogDelta:
+    """İki anlık görüntü arasındaki fark: eklenen, silinen ve değişen satırlar (show_id'ye göre)"""
+
+    def __init__(self, old_date, new_date, added, removed, changed_old, changed_new):
+        self.old_date = old_date
+        self.new_date = new_date
+        self.added = added
+        self.removed = removed
+        self.changed_old = changed_old
+        self.changed_new = changed_new
+
+    def __len__(self):
+        return len(self.added) + len(self.removed) + len(self.changed_new)
+
+    def summary(self):
+        return {
+            'old_date': self.old_date,
+            'new_date': self.new_date,
+            'added': len(self.added),
+            'removed': len(self.removed),
+            'changed': len(self.changed_new),
+        }
+
+    def changed_fields(self):
+        """Değişen her satır için farklılaşan ham sütunlar"""
+        old = self.changed_old[SOURCE_COLUMNS]
+        new = self.changed_new[SOURCE_COLUMNS]
+        differs = (old != new) & ~(old.isna() & new.isna())
+        return {show_id: [column for column in SOURCE_COLUMNS if row[column]]
+                for show_id, row in differs.iterrows()}
+
+    def rating_changes(self):
+        """Rating'i değişen içerikler"""
+        old_rating = self.changed_old['rating']
+        new_rating = self.changed_new['rating']
+        differs = (old_rating != new_rating) & ~(old_rating.isna() & new_rating.isna())
+        return pd.DataFrame({
+            'title': self.changed_new['title'][differs],
+            'old_rating': old_rating[differs],
+            'new_rating': new_rating[differs],
+        })
+
+    def records(self):
+        """Satır bazında değişiklik kayıtları (CLI çıktısı için)"""
+        records = []
+        for change, frame in (('added', self.added), ('removed', self.removed)):
+            for show_id, title in frame['title'].items():
+                records.append({'change': change, 'show_id': show_id, 'title': title})
+
+        fields = self.changed_fields()
+        for show_id, title in self.changed_new['title'].items():
+            records.append({'change': 'changed', 'show_id': show_id, 'title': title,
+                            'fields': ','.join(fields[show_id])})
+        return records
+
+
+def compute_delta(old, new):
+    """Parmak izleri karşılaştırılarak fark hesaplanır; yalnızca farklı satırlar kopyalanır"""
+    old_fp, new_fp = old.fingerprints, new.fingerprints
+
+    common = new_fp.index.intersection(old_fp.index)
+    changed = common[old_fp.loc[common].values != new_fp.loc[common].values]
+    added = new_fp.index.difference(old_fp.index)
+    removed = old_fp.index.difference(new_fp.index)
+
+    return CatalogDelta(old.date, new.date,
+                        added=new.rows(added), removed=old.rows(removed),
+                        changed_old=old.rows(changed), changed_new=new.rows(changed))
+
+
+class SnapshotStore:
+    """Tarihe göre saklanan katalog anlık görüntüleri ve en güncel toplamlar"""
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+        self.aggregates_path = os.path.join(root, 'aggregates.json')
+
+    def _path(self, date):
+        return os.path.join(self.root, f'{date}.pkl')
+
+    def dates(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name[:-4] for name in os.listdir(self.root) if name.endswith('.pkl'))
+
+    def load(self, date):
+        with open(self._path(date), 'rb') as f:
+            stored = pickle.load(f)
+        if stored.get('format') != SNAPSHOT_FORMAT:
+            raise ValueError(f"{date} anlık görüntüsü eski bir biçimde; yeniden eklenmeli")
+        return Snapshot(stored['date'], stored['version'], stored['df'], stored['fingerprints'])
+
+    def previous(self, date):
+        """Verilen tarihten önceki en son anlık görüntünün tarihi"""
+        earlier = [d for d in self.dates() if d < date]
+        return earlier[-1] if earlier else None
+
+    def add(self, path, date):
+        """CSV dökümünü anlık görüntü olarak kaydet; show_id tekrarlanıyorsa hiçbir şey yazılmadan ValueError"""
+        raw = pd.read_csv(path)
+        snapshot = Snapshot(date, dataset_version(path), parse_catalog(raw.copy()), row_fingerprints(raw))
+
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self._path(date) + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'format': SNAPSHOT_FORMAT, 'date': snapshot.date, 'version': snapshot.version,
+                         'df': snapshot.df, 'fingerprints': snapshot.fingerprints},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._path(date))
+        return snapshot
+
+    def aggregates(self):
+        return AggregateState.load(self.aggregates_path)
+
+
+def record_snapshot(store, path, date):
+    """Yeni dökümü kaydet, önceki anlık görüntüyle farkını bul ve toplamlara yalnızca farkı uygula.
+
+    Döndürür: (fark veya ilk anlık görüntüyse None, ortaya çıkan/kaybolan değerler, toplamlar)
+    """
+    previous_date = store.previous(date)
+    snapshot = store.add(path, date)
+    state = store.aggregates()
+
+    delta = None
+    changes = None
+    if previous_date is not None:
+        delta = compute_delta(store.load(previous_date), snapshot)
+
+    if state is not None and state.date is not None and state.date > date:
+        # Geçmişe dönük bir döküm: güncel toplamlara dokunma
+        return delta, changes, state
+
+    if delta is not None and state is not None and state.date == previous_date:
+        changes = state.apply(delta)
+        if state.sketches is None:
+            # Silinen / değişen satırlar özetlerden çıkarılamaz: özetler yeni dökümden bir geçişte kurulur
+            state.sketches = QuantileSketches.from_frame(snapshot.df)
+    else:
+        state = AggregateState.from_frame(snapshot.df, date=date)
+    state.save(store.aggregates_path)
+    return delta, changes, state
+
+
+def diff_snapshots(store, old_date, new_date):
+    """İki kayıtlı anlık görüntü arasındaki fark ve ortaya çıkan/kaybolan değerler"""
+    old = store.load(old_date)
+    delta = compute_delta(old, store.load(new_date))
+    return delta, value_changes(old, delta)
+
+
+def _values(column):
+    """Çok değerli sütunda geçen değerler (toplamlardaki ayırma kurallarıyla)"""
+    if not len(column):
+        return set()
+    return set(Bridge.from_column(column.reset_index(drop=True)).values)
+
+
+def value_changes(old, delta):
+    """Farkın satırlarından ortaya çıkan / kaybolan direktör ve ülkeler (AggregateState.apply ile aynı biçim).
+
+    Yalnızca farkın bir tarafında geçen değerler adaydır; bunlar eski görüntünün değişmeyen satırlarında da
+    geçmiyorsa ortaya çıkmış ya da kaybolmuştur. Değişmeyen satırlar yalnızca aday varsa taranır.
+    """
+    touched = old.fingerprints.index.get_indexer(delta.removed.index.append(delta.changed_old.index))
+    unchanged = np.ones(len(old.df), dtype=bool)
+    unchanged[touched] = False
+
+    changes = {'appeared': {}, 'disappeared': {}}
+    for name in TRACKED_VALUES:
+        column = MULTI_VALUE_COLUMNS[name]
+        before = _values(pd.concat([delta.removed[column], delta.changed_old[column]]))
+        after = _values(pd.concat([delta.added[column], delta.changed_new[column]]))
+        kept = set()
+        if before ^ after:
+            kept = _values(old.df[column][unchanged]) & (before ^ after)
+        changes['appeared'][name] = sorted(after - before - kept)
+        changes['disappeared'][name] = sorted(before - after - kept)
+    return changes
+
+
+def change_records(delta, changes):
+    """Satır değişiklikleri ve yeni / kaybolan direktör ve ülkeler için kayıtlar"""
+    records = delta.records() if delta is not None else []
+    if changes:
+        for kind, prefix in (('appeared', 'new'), ('disappeared', 'removed')):
+            for name, values in changes[kind].items():
+                for value in values:
+                    records.append({'change': f'{prefix}_{name}', 'value': value})
+    return records
@@ -0,0 +1,129 @@
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.catalog import Bridge
+
+SEARCH_MODES = ['exact', 'tokens', 'prefix', 'fuzzy']
+
+TOKEN_PATTERN = re.compile(r'\w+')
+APOSTROPHES = re.compile(r"['’]")
+
+# Bulanık aramada sonuç sayılması için gereken en düşük trigram benzerliği (Dice katsayısı)
+FUZZY_THRESHOLD = 0.4
+
+
+def normalize_title(text):
+    """Aramada kullanılan biçim: aksanlar ve kesme işaretleri atılmış, küçük harf"""
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(TOKEN_PATTERN.findall(APOSTROPHES.sub('', text.casefold())))
+
+
+def title_tokens(normalized):
+    return normalized.split()
+
+
+def title_trigrams(normalized):
+    """Kelime bazında, baştan iki sondan bir boşlukla doldurulmuş trigramlar (pg_trgm gibi)"""
+    trigrams = set()
+    for token in normalized.split():
+        padded = f'  {token} '
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def _list_bridge(lists):
+    """Satır başına değer listelerinden (tekrarsız) köprü tablosu"""
+    exploded = lists.explode().dropna()
+    pairs = pd.DataFrame({'row': exploded.index.values, 'value': exploded.values}).drop_duplicates()
+    codes, values = pd.factorize(pairs['value'], sort=True)
+    return Bridge(pairs['row'].values.astype(np.int64), codes.astype(np.int32), np.asarray(values, dtype=object))
+
+
+class TitleIndex:
+    """Başlıklar üzerinde ters indeks: kelime -> satırlar ve trigram -> satırlar.
+
+    Kelime sözlüğü sıralı olduğundan bir önekle başlayan kelimeler köprü tablosunda ardışık bir
+    aralıktır; önek araması tek bir dilimle yapılır. Bulanık arama, sorgunun trigramlarını paylaşan
+    başlıkları sayıp Dice benzerliğine göre sıralar.
+    """
+
+    def __init__(self, normalized, tokens, trigrams, trigram_counts=None):
+        self.normalized = normalized
+        self.tokens = tokens
+        self.trigrams = trigrams
+        if trigram_counts is None:
+            trigram_counts = np.bincount(trigrams.rows, minlength=len(normalized))
+        self.trigram_counts = trigram_counts
+
+    @classmethod
+    def build(cls, df):
+        normalized = df['title'].fillna('').astype(str).map(normalize_title).reset_index(drop=True)
+        tokens = _list_bridge(normalized.map(title_tokens))
+        trigrams = _list_bridge(normalized.map(lambda title: sorted(title_trigrams(title))))
+        return cls(normalized.values, tokens, trigrams)
+
+    def __len__(self):
+        return len(self.normalized)
+
+    def token_rows(self, token):
+        return self.tokens.rows_for(token)
+
+    def prefix_rows(self, prefix):
+        """Bu önekle başlayan bir kelime içeren satırlar (sıralı)"""
+        values = self.tokens.values
+        start = np.searchsorted(values, prefix, side='left')
+        end = np.searchsorted(values, prefix + '\U0010ffff', side='left')
+        bridge = self.tokens
+        return np.unique(bridge.rows[bridge.order[bridge.offsets[start]:bridge.offsets[end]]])
+
+    def search(self, query, mode='tokens'):
+        """(satır konumları, skorlar); skorlar yalnızca bulanık aramada anlamlı, diğerlerinde 1"""
+        normalized = normalize_title(query)
+        words = title_tokens(normalized)
+        if not words:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        if mode == 'fuzzy':
+            return self._fuzzy(normalized)
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"geçersiz arama türü: {mode} (seçenekler: {', '.join(SEARCH_MODES)})")
+
+        # Son kelime önek olarak aranır (yazarken arama); diğer kelimeler birebir eşleşmeli
+        postings = [self.token_rows(word) for word in words[:-1]]
+        postings.append(self.prefix_rows(words[-1]) if mode == 'prefix' else self.token_rows(words[-1]))
+        postings.sort(key=len)
+        rows = postings[0]
+        for other in postings[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+
+        if mode == 'exact':
+            rows = rows[self.normalized[rows] == normalized]
+        return rows, np.ones(len(rows))
+
+    def _fuzzy(self, normalized):
+        query_trigrams = title_trigrams(normalized)
+        codes = [code for code in map(self.trigrams.code_of, query_trigrams) if code is not None]
+        if not codes:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        bridge = self.trigrams
+        hits = np.bincount(np.concatenate([bridge.rows_for_code(code) for code in codes]), minlength=len(self))
+        candidates = np.flatnonzero(hits)
+        scores = 2 * hits[candidates] / (len(query_trigrams) + self.trigram_counts[candidates])
+        keep = scores >= FUZZY_THRESHOLD
+        candidates, scores = candidates[keep], scores[keep]
+
+        order = np.lexsort((candidates, -scores))
+        return candidates[order], scores[order]
+
+    def token_counts(self, rows):
+        """Verilen satırların başlıklarındaki kelime sıklıkları (her başlıkta bir kez sayılır)"""
+        row_mask = np.zeros(len(self), dtype=bool)
+        row_mask[rows] = True
+        counts = self.tokens.counts(row_mask)
+        present = np.flatnonzero(counts)
+        return dict(zip(self.tokens.values[present], counts[present].tolist()))
@@ -0,0 +1,191 @@
+"""Yıllık trendler: sayılar, ortalamalar, kayan pencereler ve yıllık büyüme.
+
+Satırlar (grup, yıl) anahtarına göre bir kez sıralanır; her hücrenin satır sayısı ve her metriğin toplamı
+aynı geçişte `np.add.reduceat` ile alınır ve yıl ekseni boyunca kümülatif toplamlara çevrilir. Bundan sonra
+herhangi bir yıl aralığının toplamı iki kümülatif değerin farkıdır (O(1)); kayan pencereler ve yıllık
+büyüme tüm gruplar için tek dizi işlemiyle hesaplanır, her trend çizgisi için ayrı groupby gerekmez.
+"""
+import numpy as np
+import pandas as pd
+
+ROLLING_STATS = ['sum', 'mean']
+
+
+def _cumulative(grid):
+    """Yıl ekseninde başa sıfır eklenmiş kümülatif toplam: [a, b) aralığı = cum[:, b] - cum[:, a]"""
+    return np.concatenate([np.zeros((grid.shape[0], 1), dtype=grid.dtype), np.cumsum(grid, axis=1)], axis=1)
+
+
+class TrendTable:
+    """Grup x yıl hücrelerinin kümülatif satır sayıları ve metrik toplamları.
+
+    Yıllar en küçükten en büyüğe kesintisiz bir aralıktır (verisi olmayan yıllar 0 sayılır); `present`
+    en az bir satırı olan yılları işaretler. Grupsuz tabloda tek grup vardır ve sonuçlar Series döner.
+    """
+
+    def __init__(self, years, groups, counts, sums, valid, year_field='year', group_field=None):
+        self.years = years
+        self.groups = groups
+        self.year_field = year_field
+        self.group_field = group_field
+        self.present = counts.sum(axis=0) > 0
+        self._counts = _cumulative(counts)
+        # Metrik toplamları ve metriği eksik olmayan satır sayıları (ortalamalar NaN'ları atlar)
+        self._sums = {name: _cumulative(grid) for name, grid in sums.items()}
+        self._valid = {name: _cumulative(grid) for name, grid in valid.items()}
+
+    @classmethod
+    def build(cls, years, groups=None, metrics=None, year_field='year', group_field=None):
+        """Yıl dizisi, isteğe bağlı grup etiketleri ve {ad: değerler} metriklerinden tabloyu tek geçişte kur"""
+        years = np.asarray(years)
+        metrics = dict(metrics or {})
+        keep = ~pd.isna(years)
+        if groups is not None:
+            keep &= ~pd.isna(np.asarray(groups, dtype=object))
+        # Yıl indeksi girdinin tam sayı türünü korur (ör. year_added int32)
+        year_dtype = years.dtype if years.dtype.kind in 'iu' else np.dtype(np.int64)
+        years = years[keep].astype(np.int64)
+
+        if groups is None:
+            group_codes = np.zeros(len(years), dtype=np.int64)
+            labels = np.array([None], dtype=object)
+        else:
+            group_codes, labels = pd.factorize(np.asarray(groups, dtype=object)[keep], sort=True)
+            labels = np.asarray(labels, dtype=object)
+
+        first_year = int(years.min()) if len(years) else 0
+        n_years = int(years.max()) - first_year + 1 if len(years) else 0
+        counts = np.zeros((len(labels), n_years), dtype=np.int64)
+        sums = {name: np.zeros((len(labels), n_years)) for name in metrics}
+        valid = {name: np.zeros((len(labels), n_years), dtype=np.int64) for name in metrics}
+
+        if len(years):
+            # Tek sıralı geçiş: (grup, yıl) sırasında her hücre ardışık bir dilimdir
+            order = np.lexsort((years, group_codes))
+            cell = group_codes[order] * n_years + (years[order] - first_year)
+            starts = np.flatnonzero(np.r_[True, cell[1:] != cell[:-1]])
+            cells = cell[starts]
+            g, y = np.divmod(cells, n_years)
+            counts[g, y] = np.diff(np.r_[starts, len(cell)])
+            for name, values in metrics.items():
+                values = np.asarray(values, dtype=float)[keep][order]
+                missing = np.isnan(values)
+                sums[name][g, y] = np.add.reduceat(np.where(missing, 0.0, values), starts)
+                valid[name][g, y] = np.add.reduceat((~missing).astype(np.int64), starts)
+
+        years = np.arange(first_year, first_year + n_years, dtype=year_dtype)
+        return cls(years, labels, counts, sums, valid, year_field, group_field)
+
+    @classmethod
+    def from_frame(cls, df, year_field, by=None, metrics=()):
+        """DataFrame sütunlarından: `by` grup sütunu, `metrics` ortalaması alınacak sayısal sütunlar"""
+        return cls.build(df[year_field].values, df[by].values if by else None,
+                         {name: df[name].values for name in metrics}, year_field, by)
+
+    def __len__(self):
+        return len(self.years)
+
+    def _index(self, start, end):
+        """[start, end] yıl aralığının kümülatif dizilerdeki sınırları (aralık tabloyla kesiştirilir)"""
+        first = self.years[0] if len(self.years) else 0
+        return (int(np.clip(start - first, 0, len(self.years))),
+                int(np.clip(end - first + 1, 0, len(self.years))))
+
+    # Yıl aralığı sorguları: her grup için iki kümülatif değerin farkı
+
+    def window_counts(self, start, end):
+        a, b = self._index(start, end)
+        return self._counts[:, max(b, a)] - self._counts[:, a]
+
+    def window_sums(self, metric, start, end):
+        a, b = self._index(start, end)
+        return self._sums[metric][:, max(b, a)] - self._sums[metric][:, a]
+
+    def window_means(self, metric, start, end):
+        a, b = self._index(start, end)
+        valid = self._valid[metric][:, max(b, a)] - self._valid[metric][:, a]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(valid > 0, self.window_sums(metric, start, end) / np.maximum(valid, 1), np.nan)
+
+    # Tüm yıllar için grid (grup x yıl) sonuçları
+
+    def _grids(self, metric, window, total):
+        """(değer toplamları, sayılar) gridleri; pencere w ise her yıl [t - w + 1, t] aralığını kapsar"""
+        if metric is None:
+            cum_values = cum_counts = self._counts
+        else:
+            cum_values, cum_counts = self._sums[metric], self._valid[metric]
+        if total:
+            cum_values, cum_counts = cum_values.sum(axis=0, keepdims=True), cum_counts.sum(axis=0, keepdims=True)
+
+        window = window or 1
+        end = np.arange(1, len(self.years) + 1)
+        start = np.maximum(end - window, 0)
+        values = (cum_values[:, end] - cum_values[:, start]).astype(float)
+        counts = (cum_counts[:, end] - cum_counts[:, start]).astype(float)
+        # pandas rolling gibi: pencere dolmadan (ilk w - 1 yıl) sonuç yok
+        values[:, end - start < window] = np.nan
+        return values, counts
+
+    def grid(self, metric=None, window=None, stat=None, total=False):
+        """Grup x yıl değerleri: metrik yoksa satır sayıları, varsa ortalamalar.
+
+        `window` verilirse her yıl son `window` yılın toplamı (stat='sum') veya ortalamasıdır (stat='mean';
+        metriklerde hücreler satır sayısıyla ağırlıklandırılır, sayılarda yıllık ortalamadır).
+        """
+        stat = stat or ('sum' if metric is None else 'mean')
+        if stat not in ROLLING_STATS:
+            raise ValueError(f"bilinmeyen istatistik: {stat} (seçenekler: {', '.join(ROLLING_STATS)})")
+        if metric is None and window is None and stat == 'sum':
+            # Yıllık satır sayıları tam sayı kalır
+            counts = np.diff(self._counts, axis=1)
+            return counts.sum(axis=0, keepdims=True) if total else counts
+
+        values, counts = self._grids(metric, window, total)
+        if stat == 'sum':
+            return values
+        if metric is None:
+            return values / (window or 1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(counts > 0, values / np.maximum(counts, 1), np.nan)
+
+    def yoy(self, metric=None, window=None, stat=None, total=False):
+        """Yıllık büyüme oranı: (v_t - v_(t-1)) / v_(t-1); önceki yıl 0 veya eksikse NaN"""
+        values = self.grid(metric, window, stat, total)
+        growth = np.full(values.shape, np.nan)
+        previous, current = values[:, :-1], values[:, 1:]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            growth[:, 1:] = np.where(previous != 0, (current - previous) / np.where(previous != 0, previous, 1),
+                                     np.nan)
+        return growth
+
+    def frame(self, values, series=False, group=None):
+        """Grid'i yıl indeksli DataFrame'e (sütunlar gruplar) veya Series'e çevir.
+
+        Yalnızca satırı olan yıllar alınır; `group` verilirse o grubun satırı olan yıllarıyla tek grubun Series'i.
+        """
+        if group is not None:
+            row = int(np.flatnonzero(self.groups == group)[0])
+            present = self._counts[row, 1:] > self._counts[row, :-1]
+            return pd.Series(values[row, present], index=pd.Index(self.years[present], name=self.year_field))
+
+        index = pd.Index(self.years[self.present], name=self.year_field)
+        values = values[:, self.present]
+        if series:
+            return pd.Series(values[0], index=index)
+        return pd.DataFrame(values.T, index=index, columns=pd.Index(list(self.groups), name=self.group_field))
+
+    def _is_series(self, total):
+        return total or self.group_field is None
+
+    def counts(self, total=False, window=None, group=None):
+        """Satır sayıları (pencere verilirse son `window` yılın toplamı)"""
+        return self.frame(self.grid(window=window, total=total), self._is_series(total), group)
+
+    def means(self, metric, total=False, window=None, group=None):
+        """Metriğin ortalaması (pencere verilirse son `window` yılın havuzlanmış ortalaması)"""
+        return self.frame(self.grid(metric, window=window, total=total), self._is_series(total), group)
+
+    def growth(self, metric=None, total=False, window=None, group=None):
+        """Yıllık büyüme oranları (sayılar veya ortalamalar üzerinden)"""
+        return self.frame(self.yoy(metric, window=window, total=total), self._is_series(total), group)
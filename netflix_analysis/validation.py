@@ -0,0 +1,176 @@
+"""Yükleme sırasında veri doğrulama: tekrarlanan show_id'ler, okunamayan tarihler, eklenmeden önce yayınlanmamış
+içerikler, bozuk süre metinleri ve "Not Given" yer tutucuları.
+
+Her kural bütün sütuna tek seferde uygulanan bir maskedir; satır başına Python kodu çalışmaz. Metin sütunları
+bir kez kodlanır (factorize); süre biçimi ve yer tutucu kuralları farklı değerler üzerinde çalıştırılıp kodlarla
+satırlara yayılır, böylece milyonlarca satırda bile düzenli ifade yalnızca birkaç bin değere uygulanır.
+Sonuç her (kural, sütun) için ihlal eden satırların konumları ve ham değerleridir; katalog önbelleğiyle
+(sütun deposu) birlikte saklanır.
+"""
+import numpy as np
+import pandas as pd
+
+from netflix_analysis.catalog import PLACEHOLDER
+
+# Kural -> (düzey, açıklama)
+RULES = {
+    'missing_value': ('error', "değer eksik"),
+    'duplicate_id': ('error', "show_id birden fazla satırda var"),
+    'invalid_type': ('error', "tür Movie veya TV Show değil"),
+    'unparseable_date': ('error', "tarih okunamadı"),
+    'invalid_year': ('error', "yıl tam sayı değil"),
+    'release_after_added': ('error', "yayın yılı eklenme yılından sonra"),
+    'malformed_duration': ('error', "süre '90 min' veya '2 Seasons' biçiminde değil"),
+    'duration_unit_mismatch': ('error', "süre birimi türle uyuşmuyor (film: min, dizi: Season)"),
+    'placeholder': ('warning', f"yer tutucu ('{PLACEHOLDER}') değer"),
+}
+SEVERITIES = ['error', 'warning']
+
+REQUIRED_COLUMNS = ['show_id', 'type', 'title', 'date_added', 'release_year', 'rating', 'duration']
+PLACEHOLDER_COLUMNS = ['title', 'director', 'country', 'rating', 'listed_in']
+# Farklı değerleri üzerinden kontrol edilen metin sütunları
+TEXT_COLUMNS = ['show_id', 'type', 'duration'] + PLACEHOLDER_COLUMNS
+CONTENT_TYPES = ['Movie', 'TV Show']
+DURATION_PATTERN = r'\d+ (?:min|Seasons?)'
+
+
+def _factorize(column):
+    """Metin sütununun (kodlar, farklı değerler) hali; eksik değerlerin kodu -1"""
+    codes, uniques = pd.factorize(column)
+    return codes, pd.Series(uniques, dtype=str)
+
+
+def _spread(codes, flags):
+    """Farklı değerler için hesaplanan bayrakları satırlara yay (eksik değerler False)"""
+    return np.append(np.asarray(flags, dtype=bool), False)[codes]
+
+
+def check_frame(raw, parsed):
+    """Ham ve ayrıştırılmış tablolardan {(kural, sütun): boolean maske}"""
+    masks = {}
+    # Metin sütunları bir kez kodlanır; eksiklik, tekrar ve metin kuralları kodlar üzerinden hesaplanır
+    text = {column: _factorize(raw[column]) for column in TEXT_COLUMNS if column in raw}
+    present = {column: codes >= 0 for column, (codes, _) in text.items()}
+    for column in raw.columns:
+        if column not in present:
+            present[column] = raw[column].notna().values
+
+    for column in REQUIRED_COLUMNS:
+        if column in raw:
+            masks['missing_value', column] = ~present[column]
+
+    codes, _ = text['show_id']
+    masks['duplicate_id', 'show_id'] = np.append(np.bincount(codes[codes >= 0]) > 1, False)[codes]
+    codes, types = text['type']
+    masks['invalid_type', 'type'] = _spread(codes, ~types.isin(CONTENT_TYPES))
+
+    masks['unparseable_date', 'date_added'] = present['date_added'] & parsed['date_added'].isna().values
+    release_year = parsed['release_year'].values
+    with np.errstate(invalid='ignore'):
+        masks['invalid_year', 'release_year'] = present['release_year'] & ~(release_year == np.round(release_year))
+        masks['release_after_added', 'release_year'] = release_year > parsed['year_added'].values
+
+    durations, values = text['duration']
+    malformed = _spread(durations, ~values.str.fullmatch(DURATION_PATTERN))
+    masks['malformed_duration', 'duration'] = malformed
+    # Birim yalnızca biçimi doğru sürelerde kontrol edilir: filmler dakika, diziler sezon
+    seasons = _spread(durations, values.str.contains('Season', regex=False))
+    is_movie = _spread(codes, types == 'Movie')
+    is_show = _spread(codes, types == 'TV Show')
+    masks['duration_unit_mismatch', 'duration'] = (present['duration'] & ~malformed
+                                                   & ((is_movie & seasons) | (is_show & ~seasons)))
+
+    for column in PLACEHOLDER_COLUMNS:
+        if column in text:
+            # Çok değerli sütunlarda yer tutucu listenin bir öğesi olabilir
+            codes, values = text[column]
+            masks['placeholder', column] = _spread(codes, values.str.contains(PLACEHOLDER, regex=False))
+    return masks
+
+
+class ValidationReport:
+    """(kural, sütun) -> (ihlal eden satırlar, ham değerler).
+
+    Satırlar katalog tablosundaki konumlardır; değerler metin dizisidir (eksik değer boş metin).
+    """
+
+    def __init__(self, entries, n_rows):
+        self.entries = entries
+        self.n_rows = n_rows
+
+    @classmethod
+    def from_masks(cls, raw, masks):
+        entries = {}
+        for (rule, column), mask in masks.items():
+            rows = np.flatnonzero(mask).astype(np.int32)
+            values = raw[column].iloc[rows].astype(object).fillna('').astype(str).values
+            entries[rule, column] = rows, values
+        return cls(entries, len(raw))
+
+    def __len__(self):
+        return sum(len(rows) for rows, _ in self.entries.values())
+
+    def subset(self, keep):
+        """Yalnızca `keep` boolean maskesindeki satırların raporu; satırlar yeni tablodaki konumlara çevrilir"""
+        positions = np.cumsum(keep, dtype=np.int64) - 1
+        entries = {}
+        for entry, (rows, values) in self.entries.items():
+            kept = keep[rows]
+            entries[entry] = positions[rows[kept]].astype(rows.dtype), values[kept]
+        return ValidationReport(entries, int(keep.sum()))
+
+    def _selected(self, rules=None, severity=None):
+        for (rule, column), (rows, values) in self.entries.items():
+            if rules and rule not in rules:
+                continue
+            if severity and RULES[rule][0] != severity:
+                continue
+            yield rule, column, rows, values
+
+    def invalid(self, rules=None, severity='error'):
+        """Seçili kurallardan en az birini ihlal eden satırların boolean maskesi"""
+        mask = np.zeros(self.n_rows, dtype=bool)
+        for _, _, rows, _ in self._selected(rules, severity):
+            mask[rows] = True
+        return mask
+
+    @property
+    def ok(self):
+        """Hata düzeyinde ihlal yoksa True (yer tutucular uyarıdır)"""
+        return not any(len(rows) for _, _, rows, _ in self._selected(severity='error'))
+
+    def summary(self, mask=None, rules=None, severity=None):
+        """Her (kural, sütun) için ihlal sayısı; `mask` verilirse yalnızca maskedeki satırlar sayılır"""
+        records = []
+        for rule, column, rows, _ in self._selected(rules, severity):
+            count = int(mask[rows].sum()) if mask is not None else len(rows)
+            records.append({'rule': rule, 'column': column, 'severity': RULES[rule][0],
+                            'description': RULES[rule][1], 'rows': count})
+        return records
+
+    def records(self, show_ids=None, mask=None, rules=None, severity=None, n=None):
+        """İhlal eden satırlar (satır sırasıyla): satır, show_id, kural, sütun, düzey ve ham değer"""
+        parts = [(rule, column, rows, values) for rule, column, rows, values in self._selected(rules, severity)]
+        if not parts:
+            return []
+        rows = np.concatenate([part[2] for part in parts])
+        values = np.concatenate([part[3] for part in parts])
+        entry = np.repeat(np.arange(len(parts)), [len(part[2]) for part in parts])
+        keep = mask[rows] if mask is not None else np.ones(len(rows), dtype=bool)
+        order = np.flatnonzero(keep)[np.argsort(rows[keep], kind='stable')][:n]
+
+        result = []
+        for row, value, index in zip(rows[order].tolist(), values[order].tolist(), entry[order].tolist()):
+            rule, column = parts[index][:2]
+            result.append({'row': row, 'show_id': None if show_ids is None else show_ids[row], 'rule': rule,
+                           'column': column, 'severity': RULES[rule][0], 'value': value})
+        return result
+
+
+def validate_frame(raw, parsed=None):
+    """Ham CSV tablosunu doğrula; `parsed` verilmezse parse_catalog ile ayrıştırılır"""
+    if parsed is None:
+        from netflix_analysis.catalog import parse_catalog
+
+        parsed = parse_catalog(raw)
+    return ValidationReport.from_masks(raw.reset_index(drop=True), check_frame(raw, parsed))
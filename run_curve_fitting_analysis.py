@@ -1,3 +1,4 @@
+import argparse
 import os
 import time
 import subprocess
@@ -13,8 +14,8 @@ def create_directories():
         os.makedirs('graphics/curve_fitting')
 
 
-def run_python_script(script_name):
-    """Python scriptini çalıştır ve çıktıları yönlendir"""
+def run_python_script(script_name, arguments=()):
+    """Python scriptini (verilen argümanlarla) çalıştır ve çıktıları yönlendir"""
     print(f"\n{'=' * 50}")
     print(f"Çalıştırılıyor: {script_name}")
     print(f"{'=' * 50}\n")
@@ -25,7 +26,7 @@ def run_python_script(script_name):
 
         # Scripti çalıştır
         process = subprocess.Popen(
-            [python_executable, script_name],
+            [python_executable, script_name, *arguments],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             universal_newlines=True
@@ -59,8 +60,13 @@ def run_python_script(script_name):
         return False
 
 
-def main():
+def main(argv=None):
     """Ana işlev - tüm curve fitting analizlerini çalıştır"""
+    parser = argparse.ArgumentParser(description="Tüm curve fitting analizlerini çalıştır")
+    parser.add_argument('--dedupe', action='store_true', help="tekrar listelenen içerikleri bir kez say")
+    args = parser.parse_args(argv)
+    arguments = ['--dedupe'] if args.dedupe else []
+
     start_time = time.time()
 
     print("Netflix Curve Fitting Analizi Başlıyor...")
@@ -74,13 +80,14 @@ def main():
     scripts = [
         "curve_fitting.py",
         "content_type_curve_fitting.py",
-        "seasonal_curve_fitting.py"
+        "seasonal_curve_fitting.py",
+        "backtest_curve_fitting.py"
     ]
 
     results = {}
 
     for script in scripts:
-        results[script] = run_python_script(script)
+        results[script] = run_python_script(script, arguments)
 
     # Sonuçları özetleme
     print("\n")
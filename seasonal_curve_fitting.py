@@ -1,24 +1,35 @@
+import argparse
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
-import seaborn as sns
 import os
 import re
 
-# Görsel stili ayarlama
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("Set2")
+from netflix_analysis.duplicates import dedupe_frame
+from netflix_analysis.growth_models import exp_func, fit_model, linear_func, poly_func, r_squared
+from netflix_analysis.intervals import DEFAULT_LEVEL, format_interval, forecast_interval, write_intervals
+from netflix_analysis.records import iter_records
 
-# Grafiklerin kaydedileceği dizini kontrol etme ve oluşturma
-if not os.path.exists('graphics/curve_fitting'):
-    os.makedirs('graphics/curve_fitting')
+FIG_DIR = 'graphics/curve_fitting'
+
+
+# Görsel stili ayarlama ve grafik dizinini oluşturma; matplotlib yalnızca grafik çizilirken yüklenir
+def setup_plotting():
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("Set2")
+    os.makedirs(FIG_DIR, exist_ok=True)
+    return plt, sns.color_palette("Set2")
 
 
 # Veri setini yükleme
-def load_data():
+def load_data(dedupe=False):
     try:
         netflix_data = pd.read_csv('data/netflix1.csv')
+        if dedupe:
+            # Farklı show_id'lerle tekrar listelenen içerikler bir kez sayılır
+            netflix_data = dedupe_frame(netflix_data)
         return netflix_data
     except FileNotFoundError:
         print(
@@ -26,26 +37,6 @@ def load_data():
         return None
 
 
-# Curve fitting fonksiyonları
-def linear_func(x, a, b):
-    return a * x + b
-
-
-def poly_func(x, a, b, c):
-    return a * x ** 2 + b * x + c
-
-
-def exp_func(x, a, b, c):
-    return a * np.exp(b * x) + c
-
-
-# R-kare değerini hesaplama
-def r_squared(y_true, y_pred):
-    ss_res = np.sum((y_true - y_pred) ** 2)
-    ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
-    return 1 - (ss_res / ss_tot)
-
-
 # TV Show'ların sezon sayılarını çıkarma
 def extract_seasons(description):
     if not isinstance(description, str):
@@ -65,22 +56,37 @@ def extract_seasons(description):
     return None
 
 
+# Gelecek yıllar için tahmin aralığı bandını çiz, 2025 tahmininin aralık kaydını döndür (delta yöntemi)
+def forecast_band(plt, series, model, x_data, y_data, popt, pcov, future_years, color):
+    _, lower, upper = forecast_interval(model, x_data, y_data, popt, pcov, future_years)
+    plt.fill_between(future_years + 2000, lower, upper, color=color, alpha=0.15)
+
+    forecast, lower, upper = forecast_interval(model, x_data, y_data, popt, pcov, 2025 - 2000)
+    return {'series': series, 'model': model, 'year': 2025, 'forecast': forecast, 'lower': lower,
+            'upper': upper, 'level': DEFAULT_LEVEL, 'interval': 'delta'}
+
+
 # Sezonluk içeriklerin (TV Shows) analizi
 def analyze_tv_shows(data):
+    plt, palette = setup_plotting()
+    interval_rows = []
+
     # Sadece TV Show'ları seçme
     tv_shows = data[data['type'] == 'TV Show'].copy()
 
-    # Sezon sayılarını çıkarma
-    tv_shows['seasons'] = tv_shows['description'].apply(extract_seasons)
+    # Sezon sayılarını çıkarma (bu veri setinde 'description' yok; "2 Seasons" bilgisi 'duration' sütununda)
+    source = 'description' if 'description' in tv_shows else 'duration'
+    tv_shows['seasons'] = tv_shows[source].apply(extract_seasons)
 
     # Eksik değerleri description'dan farklı bir yöntemle tekrar doldurmaya çalışalım
-    # Bazen sezon bilgisi title içinde olabilir
-    for idx, row in tv_shows[tv_shows['seasons'].isna()].iterrows():
-        if isinstance(row['title'], str) and 'season' in row['title'].lower():
-            seasons_pattern = r'(\d+)\s+season'
-            season_match = re.search(seasons_pattern, row['title'].lower())
+    # Bazen sezon bilgisi title içinde olabilir; satırlar Series yerine hafif kayıtlarla dolaşılır
+    missing = tv_shows[tv_shows['seasons'].isna()]
+    seasons_pattern = r'(\d+)\s+season'
+    for record in iter_records(missing, ['title']):
+        if record.title is not None and 'season' in record.title.lower():
+            season_match = re.search(seasons_pattern, record.title.lower())
             if season_match:
-                tv_shows.at[idx, 'seasons'] = int(season_match.group(1))
+                tv_shows.at[missing.index[record.row], 'seasons'] = int(season_match.group(1))
 
     # Eksik değerleri (NaN) olan kayıtları kaldırma
     tv_shows = tv_shows.dropna(subset=['seasons'])
@@ -96,7 +102,7 @@ def analyze_tv_shows(data):
     plt.figure(figsize=(12, 8))
 
     # Sütun grafiği
-    ax = season_counts.plot(kind='bar', color=sns.color_palette("Set2"))
+    ax = season_counts.plot(kind='bar', color=palette)
 
     # Her sütunun üzerine değeri yazma
     for i, v in enumerate(season_counts):
@@ -123,7 +129,7 @@ def analyze_tv_shows(data):
 
         try:
             # Polinom modeli uygulama
-            popt, _ = curve_fit(poly_func, x_data, y_data)
+            popt, pcov = fit_model('poly', x_data, y_data)
 
             # Model performansını değerlendirme
             y_pred = poly_func(x_data, *popt)
@@ -143,6 +149,9 @@ def analyze_tv_shows(data):
             future_years = np.arange(max(x_data) + 1, max(x_data) + 6)
             future_avg_seasons = poly_func(future_years, *popt)
             plt.plot(future_years + 2000, future_avg_seasons, '--', linewidth=2, label='Tahmin', color='green')
+            interval = forecast_band(plt, 'tv_show/avg_seasons', 'poly', x_data, y_data, popt, pcov, future_years,
+                                     'green')
+            interval_rows.append(interval)
 
             # Tahmin bölgesini belirtmek için dikey çizgi
             plt.axvline(x=max(x_data) + 2000, color='gray', linestyle='--', alpha=0.7)
@@ -156,7 +165,8 @@ def analyze_tv_shows(data):
 
             # 2025 yılı için tahmin
             pred_2025 = poly_func(25, *popt)  # 2025 - 2000 = 25
-            print(f"2025 yılı için ortalama sezon sayısı tahmini: {pred_2025:.2f}")
+            print(f"2025 yılı için ortalama sezon sayısı tahmini: {pred_2025:.2f} "
+                  f"({format_interval(interval['lower'], interval['upper'], digits=2)})")
 
             # Grafiği kaydetme
             plt.savefig('graphics/curve_fitting/netflix_tv_show_season_trend.png', dpi=300, bbox_inches='tight')
@@ -175,9 +185,9 @@ def analyze_tv_shows(data):
 
         try:
             # Üç farklı model uygulama
-            popt_linear, _ = curve_fit(linear_func, x_data, y_data)
-            popt_poly, _ = curve_fit(poly_func, x_data, y_data)
-            popt_exp, _ = curve_fit(exp_func, x_data, y_data, p0=[1, 0.1, 1])
+            popt_linear, pcov_linear = fit_model('linear', x_data, y_data)
+            popt_poly, pcov_poly = fit_model('poly', x_data, y_data)
+            popt_exp, pcov_exp = fit_model('exp', x_data, y_data)
 
             # R-kare değerlerini hesaplama
             r2_linear = r_squared(y_data, linear_func(x_data, *popt_linear))
@@ -208,6 +218,15 @@ def analyze_tv_shows(data):
             plt.plot(future_years + 2000, poly_func(future_years, *popt_poly), '--', linewidth=2, color='green')
             plt.plot(future_years + 2000, exp_func(future_years, *popt_exp), '--', linewidth=2, color='purple')
 
+            # Tahmin aralıkları
+            fits = {'linear': (popt_linear, pcov_linear, 'red'), 'poly': (popt_poly, pcov_poly, 'green'),
+                    'exp': (popt_exp, pcov_exp, 'purple')}
+            intervals = {}
+            for model, (popt, pcov, color) in fits.items():
+                interval = forecast_band(plt, 'tv_show/count', model, x_data, y_data, popt, pcov, future_years, color)
+                interval_rows.append(interval)
+                intervals[model] = format_interval(interval['lower'], interval['upper'])
+
             # Tahmin bölgesini belirtmek için dikey çizgi
             plt.axvline(x=max(x_data) + 2000, color='gray', linestyle='--', alpha=0.7)
 
@@ -224,9 +243,9 @@ def analyze_tv_shows(data):
             pred_2025_exp = exp_func(25, *popt_exp)
 
             print(f"\n2025 yılı için TV Show sayısı tahminleri:")
-            print(f"Lineer Model: {int(pred_2025_linear)} TV Show")
-            print(f"Polinom Model: {int(pred_2025_poly)} TV Show")
-            print(f"Üstel Model: {int(pred_2025_exp)} TV Show")
+            print(f"Lineer Model: {int(pred_2025_linear)} TV Show ({intervals['linear']})")
+            print(f"Polinom Model: {int(pred_2025_poly)} TV Show ({intervals['poly']})")
+            print(f"Üstel Model: {int(pred_2025_exp)} TV Show ({intervals['exp']})")
 
             # En iyi modeli belirleme
             best_r2 = max(r2_linear, r2_poly, r2_exp)
@@ -240,10 +259,17 @@ def analyze_tv_shows(data):
         except Exception as e:
             print(f"TV Show büyüme eğrileri için curve fitting yapılamadı: {e}")
 
+    # 2025 tahminleri ve tahmin aralıkları (makine tarafından okunabilir)
+    write_intervals(interval_rows, 'graphics/curve_fitting/tv_show_forecast_intervals.csv')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TV Show sezon analizi ve curve fitting")
+    parser.add_argument('--dedupe', action='store_true', help="tekrar listelenen içerikleri bir kez say")
+    args = parser.parse_args(argv)
 
-def main():
     # Veri setini yükleme
-    netflix_data = load_data()
+    netflix_data = load_data(dedupe=args.dedupe)
 
     if netflix_data is not None:
         print("Netflix veri seti başarıyla yüklendi. Toplam kayıt sayısı:", len(netflix_data))
@@ -1,39 +1,21 @@
-from wordcloud import WordCloud, STOPWORDS
-import os
-import pandas as pd
+import argparse
 
-df = pd.read_csv("data/netflix1.csv")
-df.rename(columns={"listed_in": "category"}, inplace=True)
+from netflix_analysis.analyses.wordclouds import category_title_frequencies
+from netflix_analysis.catalog import load_catalog
 
-movie_df = df[df['type'] == 'Movie'].copy()
-movie_df = movie_df.dropna(subset=['title', 'category'])
 
-movie_df['category'] = movie_df['category'].str.split(', ')
-movie_exploded = movie_df.explode('category')
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kategori başlık kelime bulutları")
+    parser.add_argument('--dedupe', action='store_true', help="tekrar listelenen içerikleri bir kez say")
+    args = parser.parse_args(argv)
 
-wordcloud_dir = "wordclouds"
-os.makedirs(wordcloud_dir, exist_ok=True)
-stopwords = set(STOPWORDS)
-stopwords.update(["Movie", "Film", "Series", "Season", "Netflix", "the", "The"])
+    # Grafik kütüphaneleri yalnızca çizim yapılırken yüklenir
+    from netflix_analysis.charts.wordclouds import render_title_wordclouds
 
-# Her kategori için wordcloud oluşturma
-for category in movie_exploded['category'].dropna().unique():
-    titles = movie_exploded[movie_exploded['category'] == category]['title']
-    text = " ".join(title for title in titles if isinstance(title, str))
+    catalog = load_catalog(dedupe=args.dedupe)
+    frequencies = category_title_frequencies(catalog, content_type='Movie')
+    render_title_wordclouds(frequencies, wordcloud_dir="wordclouds")
 
-    if not text.strip():
-        continue
 
-    wordcloud = WordCloud(
-        stopwords=stopwords,
-        background_color='black',
-        width=800,
-        height=400,
-        colormap='plasma'
-    ).generate(text)
-
-    filename = f"{category.lower().replace('&', 'and').replace(' ', '_')}_titles_wordcloud.png"
-    filepath = os.path.join(wordcloud_dir, filename)
-
-    wordcloud.to_file(filepath)
-    print(f"{category} için kelime bulutu kaydedildi: {filepath}")
+if __name__ == "__main__":
+    main()